@@ -632,7 +632,7 @@ def cshMakeCSHole(diam, type):
   if not(diam in table):
     return None
 
-  (key, shape) = FastenerBase.FSGetKey('CSHole', diam, 0)
+  (key, shape) = FastenerBase.FSGetKey('CSHole', type, diam)
   if shape != None:
     return shape
   
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  FSBenchmark.py
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#
+###################################################################################
+
+# headless benchmark of the fastener generator:
+#   FreeCADCmd FSBenchmark.py
+# like FSWorker.py it drives screw_maker.Screw and FSCatalog directly, as
+# FastenerBase and ScrewMaker need the gui. every catalog type known to
+# screw_maker is generated for all its diameters, screws for the shortest, a
+# medium and the longest standard length, each with simple and real threads.
+# the DIN nuts of FSNuts are not covered. wall time, face count, memory change
+# and validity of every shape are written to <out>.json and <out>.csv
+# settings are passed in environment variables:
+#   FSBENCH_OUT: output file name without extension, default "FSBenchmark"
+#   FSBENCH_BASELINE: json file of an earlier run to compare with
+#   FSBENCH_TYPES: comma separated list of types, default all
+#   FSBENCH_THREADS: comma separated thread modes, default "simple,real"
+#   FSBENCH_COLD: "1" to clear the thread, tool and head caches of screw_maker
+#     before every fastener. the shape cache FSCache and its disk tier are never
+#     used by the benchmark, so every fastener is really generated
+# the workbench preferences (thread engine, 3D print scaling) are used as set
+
+import os, sys, json, time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import FreeCAD
+import FSCatalog
+import screw_maker
+
+BenchTapLengths = ('10', '20', '40')
+BenchSlowerLimit = 1.2   # report fasteners this much slower than the baseline
+
+def memUsage():
+  ''' resident memory of this process in bytes, 0 if unknown '''
+  try:
+    with open('/proc/self/statm') as f:
+      return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+  except Exception:
+    pass
+  try:
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+  except Exception:
+    return 0
+
+def clearCaches():
+  screw_maker.ThreadCache.clear()
+  screw_maker.ToolCache.clear()
+  screw_maker.HeadCache.clear()
+
+# generator settings from the workbench preferences, as fingerprint for
+# Screw.applySettings (see FSScrewMaker.updateFastenerParameters)
+def benchSettings():
+  param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fasteners")
+  fingerprint = ()
+  if param.GetInt("ScrewToolbarThreadGeneration", 0) == 1:
+    fingerprint = (param.GetFloat("ScrewThrScaleA", 0.99), param.GetFloat("ScrewThrScaleB", -0.05),
+        param.GetFloat("NutThrScaleA", 1.03), param.GetFloat("NutThrScaleB", 0.1))
+  if param.GetInt("ThreadEngine", 0) == 1:
+    fingerprint += ('ruled',)
+  return fingerprint
+
+def benchTypes():
+  return [type for type in FSCatalog.types() if type in screw_maker.ScrewStandards]
+
+def benchLengths(type, diam):
+  if type == 'ScrewTap':
+    return BenchTapLengths
+  if FSCatalog.FSGetCatalogStandards()[type]['lengths'] == None:
+    return ('1',)
+  lens = FSCatalog.lengths(type, diam)
+  if len(lens) == 0:
+    return ()
+  return sorted(set([lens[0], lens[len(lens) // 2], lens[-1]]), key = float)
+
+def benchItems(types, threads):
+  items = []
+  for type in types:
+    for diam in FSCatalog.diameters(type):
+      for length in benchLengths(type, diam):
+        for thread in threads:
+          items.append((type, diam, length, thread))
+  return items
+
+def benchOne(screw, type, diam, length, thread, cold):
+  if cold:
+    clearCaches()
+  res = {'id': ' '.join((type, diam, length, thread)), 'type': type, 'diam': diam,
+         'len': length, 'thread': thread, 'time': 0.0, 'faces': 0, 'mem': 0,
+         'valid': False, 'error': ''}
+  mem = memUsage()
+  start = time.time()
+  try:
+    shape = screw.createScrew(type, diam, length, thread, True)
+    res['time'] = time.time() - start
+    res['faces'] = len(shape.Faces)
+    res['valid'] = shape.isValid()
+  except Exception as e:
+    res['time'] = time.time() - start
+    res['error'] = str(e)
+  res['mem'] = memUsage() - mem
+  return res
+
+def writeResults(out, meta, results):
+  with open(out + '.json', 'w') as f:
+    json.dump({'meta': meta, 'results': results}, f, indent = 1)
+  fields = ('type', 'diam', 'len', 'thread', 'time', 'faces', 'mem', 'valid', 'error')
+  with open(out + '.csv', 'w') as f:
+    f.write(';'.join(fields) + '\n')
+    for res in results:
+      f.write(';'.join([str(res[field]).replace(';', ',') for field in fields]) + '\n')
+
+def compareResults(results, baselineFile):
+  ''' print the differences to an earlier run, returns the number of fasteners
+      that were valid in the baseline but are not any more '''
+  with open(baselineFile) as f:
+    baseline = dict([(res['id'], res) for res in json.load(f)['results']])
+  broken = 0
+  total = 0.0
+  baseTotal = 0.0
+  for res in results:
+    if not(res['id'] in baseline):
+      continue
+    base = baseline[res['id']]
+    total += res['time']
+    baseTotal += base['time']
+    if base['valid'] and not res['valid']:
+      broken += 1
+      print("BROKEN  " + res['id'] + " " + res['error'])
+    elif base['time'] > 0.01 and res['time'] > base['time'] * BenchSlowerLimit:
+      print("SLOWER  " + res['id'] + ": %.3fs, was %.3fs" % (res['time'], base['time']))
+    if res['faces'] != base['faces']:
+      print("FACES   " + res['id'] + ": " + str(res['faces']) + ", was " + str(base['faces']))
+  if baseTotal > 0.0:
+    print("Total time of common fasteners: %.2fs, baseline %.2fs (%.0f%%)" % (total, baseTotal, 100.0 * total / baseTotal))
+  return broken
+
+def main():
+  out = os.environ.get('FSBENCH_OUT', 'FSBenchmark')
+  baselineFile = os.environ.get('FSBENCH_BASELINE', '')
+  types = os.environ.get('FSBENCH_TYPES', '')
+  if types == '':
+    types = sorted(benchTypes())
+  else:
+    types = [type.strip() for type in types.split(',') if type.strip() in benchTypes()]
+  threads = [thread.strip() for thread in os.environ.get('FSBENCH_THREADS', 'simple,real').split(',')]
+  cold = os.environ.get('FSBENCH_COLD', '0') == '1'
+
+  screw = screw_maker.Screw()
+  screw.applySettings(benchSettings())
+  items = benchItems(types, threads)
+  results = []
+  start = time.time()
+  for i, item in enumerate(items):
+    res = benchOne(screw, *(item + (cold,)))
+    results.append(res)
+    status = 'ok'
+    if not res['valid']:
+      status = 'INVALID ' + res['error']
+    print("%d/%d %s: %.3fs %d faces %s" % (i + 1, len(items), res['id'], res['time'], res['faces'], status))
+  meta = {'date': time.strftime('%Y-%m-%d %H:%M:%S'), 'total': time.time() - start,
+          'engine': screw.smThreadEngine, 'scaling': benchSettings(),
+          'tuner': screw.Tuner, 'cold': cold}
+  writeResults(out, meta, results)
+  invalid = len([res for res in results if not res['valid']])
+  print("%d fasteners in %.1fs, %d invalid" % (len(results), meta['total'], invalid))
+  if baselineFile != '':
+    return compareResults(results, baselineFile)
+  return 0
+
+res = 1
+try:
+  if main() == 0:
+    res = 0
+except Exception as e:
+  sys.stderr.write("Fastener benchmark failed: " + str(e) + "\n")
+sys.stdout.flush()
+sys.stderr.flush()
+# FreeCADCmd may stay in its console after the script, so leave right away
+os._exit(res)
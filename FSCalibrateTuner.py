@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  FSCalibrateTuner.py
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#
+###################################################################################
+
+# offline calibration of the thread tuner table FSTunerTable.json:
+#   FreeCADCmd FSCalibrateTuner.py
+# the tuner sets the helix radius of the thread sweeps. for every standard
+# diameter and pitch, tuner values around 510 are tried for a complete ISO4017
+# screw with real thread and for a screw tap. of the first valid values found,
+# the one with the fastest build is stored. sizes without a valid value are
+# removed from the table, so they use the default Screw.Tuner, and listed at
+# the end
+
+import os, sys, json, time
+import Part
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import screw_maker
+from screw_maker import Screw, tuningTable, iso4017range
+
+CalibrateCandidates = sorted(range(480, 541), key = lambda t: (abs(t - 510), t))
+CalibrateValidCount = 5   # valid values to compare per size
+CalibrateTurns = 6
+
+# the outer thread alone is an open shell, the head and the end faces close
+# it. so a complete, fully threaded screw of about CalibrateTurns turns is built
+def buildThread(screw, thread, d, P, inner):
+  if inner:
+    return screw.makeInnerThread_2(d, P, CalibrateTurns, None, 0.0)
+  minl, maxl = iso4017range[thread]
+  l = min(max(CalibrateTurns * P, float(minl)), float(maxl))
+  return screw.createScrew('ISO4017', thread, str(l), 'real', True)
+
+def tryTuner(thread, d, P, inner, tuner):
+  screw = Screw()
+  screw.setTuner(tuner)
+  screw_maker.ThreadCache.clear()
+  start = time.time()
+  try:
+    solid = buildThread(screw, thread, d, P, inner)
+    valid = solid.isValid() and solid.Volume > 0.0
+  except Exception:
+    valid = False
+  return valid, time.time() - start
+
+def calibrate(thread, d, P, inner):
+  found = []
+  for tuner in CalibrateCandidates:
+    valid, secs = tryTuner(thread, d, P, inner, tuner)
+    if valid:
+      found.append((secs, tuner))
+      if len(found) >= CalibrateValidCount:
+        break
+  if len(found) == 0:
+    return None
+  return min(found)[1]
+
+def main():
+  table = screw_maker.getTunerTable()
+  failed = []
+  for thread in sorted(tuningTable, key = lambda m: float(m.lstrip('(M').rstrip(')'))):
+    P = tuningTable[thread][0]
+    d = float(thread.lstrip('(M').rstrip(')'))
+    key = screw_maker.tunerKey(d, P)
+    for kind in ('outer', 'inner'):
+      tuner = calibrate(thread, d, P, kind == 'inner')
+      if tuner == None:
+        print(thread + " " + kind + ": no valid tuner found, using the default")
+        table[kind].pop(key, None)
+        failed.append(thread + " " + kind)
+        continue
+      print(thread + " " + kind + ": " + str(tuner))
+      table[kind][key] = tuner
+  with open(screw_maker.TunerTableFile, 'w') as f:
+    json.dump(table, f, indent = 2, sort_keys = True)
+  if len(failed) > 0:
+    print("No valid tuner found for: " + ', '.join(failed))
+
+main()
+os._exit(0)
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  FSCatalog.py
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#
+###################################################################################
+
+# the fastener catalog: dimension tables of the fastener standards. every table
+# is a json file in the Catalog directory, read on first access. rows are
+# returned as tuples, like in the former python tables.
+# Catalog/standards.json lists the fastener types with their tables:
+#   kind: 'Screw', 'Washer', 'Nut' or 'ScrewTap'
+#   table, lengths, ranges: names of the definition, length and length range tables
+#   diamPos: position within the def table to be used for auto diameter selection, -1 = get size from Mxx
+#   kPos: position within the def table to be used for countersunk holes creation
+#   hidden: known to the screw maker, but not offered by the workbench
+# this module only uses the python standard library, so the query functions
+# at the end can be used without FreeCAD:
+#   import FSCatalog
+#   FSCatalog.lengths('ISO4762', 'M6')
+
+import os, json, bisect
+
+CatalogDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Catalog')
+
+def FSLoadCatalogTable(name):
+  with open(os.path.join(CatalogDir, name + '.json')) as f:
+    data = json.load(f)
+  if isinstance(data, dict):
+    for key in data:
+      if isinstance(data[key], list):
+        data[key] = tuple(data[key])
+  return data
+
+class FSCatalogTable(object):
+  '''A table of the fastener catalog. Behaves like the dict or list it holds,
+     which is read from Catalog/<name>.json on first use'''
+  def __init__(self, name):
+    self.name = name
+    self.table = None
+
+  def data(self):
+    if self.table == None:
+      self.table = FSLoadCatalogTable(self.name)
+    return self.table
+
+  def __getitem__(self, key):
+    return self.data()[key]
+
+  def __contains__(self, key):
+    return key in self.data()
+
+  def __iter__(self):
+    return iter(self.data())
+
+  def __len__(self):
+    return len(self.data())
+
+  def __repr__(self):
+    return "FSCatalogTable('" + self.name + "')"
+
+  def keys(self):
+    return self.data().keys()
+
+  def values(self):
+    return self.data().values()
+
+  def items(self):
+    return self.data().items()
+
+  def get(self, key, default = None):
+    return self.data().get(key, default)
+
+# tables are shared, so every table is read only once
+FSCatalogTables = {}
+def FSGetCatalogTable(name):
+  if name == None:
+    return None
+  if not(name in FSCatalogTables):
+    FSCatalogTables[name] = FSCatalogTable(name)
+  return FSCatalogTables[name]
+
+FSCatalogStandards = None
+def FSGetCatalogStandards():
+  global FSCatalogStandards
+  if FSCatalogStandards == None:
+    with open(os.path.join(CatalogDir, 'standards.json')) as f:
+      FSCatalogStandards = json.load(f)
+  return FSCatalogStandards
+
+# 'M6', '(M14)' or '20' as number
+def FSSizeValue(m):
+  return float(m.lstrip('(').rstrip(')').lstrip('M'))
+
+# item of the sorted values closest to x, on a tie the smaller one.
+# default if no value is closer than mindif
+def FSFindClosestValue(values, items, x, default, mindif):
+  res = default
+  i = bisect.bisect_left(values, x)
+  for j in (i - 1, i):
+    if j >= 0 and j < len(values) and abs(values[j] - x) < mindif:
+      mindif = abs(values[j] - x)
+      res = items[j]
+  return res
+
+class FSSizeIndex:
+  '''Diameters and lengths of a fastener type sorted by value, with the
+     slice of valid lengths per diameter'''
+  def __init__(self, diamTable, lenTable, rangeTable):
+    self.diamTable = diamTable
+    self.rangeTable = rangeTable
+    self.diams = sorted(diamTable, key = FSSizeValue)
+    self.diamValues = [FSSizeValue(m) for m in self.diams]
+    self.lens = None
+    self.lenSet = None
+    self.lenSlices = {}
+    if lenTable == None:
+      return
+    self.lens = sorted(lenTable, key = FSSizeValue)
+    self.lenValues = [float(l) for l in self.lens]
+    self.lenSet = set(lenTable)
+    if rangeTable == None:
+      return
+    for m in rangeTable:
+      minl, maxl = rangeTable[m]
+      self.lenSlices[m] = (bisect.bisect_left(self.lenValues, float(minl)), bisect.bisect_right(self.lenValues, float(maxl)))
+
+  def lengths(self, diam):
+    first, last = self.lenSlices[diam]
+    return self.lens[first:last]
+
+  def closest(self, diam, length):
+    ''' closest standard diameter and length, the length within the range of the diameter '''
+    if not (diam in self.diamTable):
+      diam = FSFindClosestValue(self.diamValues, self.diams, FSSizeValue(diam), diam, 100.0)
+    if (self.lens != None) and not (length in self.lenSet):
+      length = FSFindClosestValue(self.lenValues, self.lens, float(length), length, 100.0)
+    if self.rangeTable != None:
+      minl , maxl = self.rangeTable[diam]
+      if float(length) < float(minl):
+        length = minl
+      if float(length) > float(maxl):
+        length = maxl
+    return (diam, length)
+
+FSCatalogIndexes = {}
+def FSGetCatalogIndex(type):
+  if not(type in FSCatalogIndexes):
+    std = FSGetCatalogStandards()[type]
+    FSCatalogIndexes[type] = FSSizeIndex(FSGetCatalogTable(std['table']), FSGetCatalogTable(std['lengths']), FSGetCatalogTable(std['ranges']))
+  return FSCatalogIndexes[type]
+
+# catalog queries
+
+def types(kind = None):
+  ''' fastener types offered by the workbench, optionally only of one kind '''
+  stds = FSGetCatalogStandards()
+  return [type for type in stds if not stds[type].get('hidden', False) and (kind == None or stds[type]['kind'] == kind)]
+
+def diameters(type):
+  ''' diameters of a fastener type, sorted by size '''
+  return list(FSGetCatalogIndex(type).diams)
+
+def lengths(type, diam):
+  ''' standard lengths of a fastener type and diameter, sorted. empty if
+      the type has no lengths or the diameter is unknown '''
+  index = FSGetCatalogIndex(type)
+  if not(diam in index.lenSlices):
+    return []
+  return index.lengths(diam)
+
+def closest(type, diam, length):
+  ''' closest (diameter, length) of a fastener type to the given ones '''
+  if not(type in FSGetCatalogStandards()):
+    return (diam, length)
+  return FSGetCatalogIndex(type).closest(diam, length)
+
+def countersinkDims(type, diam):
+  ''' (head diameter, head height) of a countersunk screw, (0, 0) if the type
+      or diameter has none '''
+  stds = FSGetCatalogStandards()
+  if not(type in stds) or stds[type]['diamPos'] < 0:
+    return (0, 0)
+  table = FSGetCatalogTable(stds[type]['table'])
+  if not(diam in table):
+    return (0, 0)
+  return (table[diam][stds[type]['diamPos']], table[diam][stds[type]['kPos']])
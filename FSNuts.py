@@ -35,6 +35,7 @@ iconPath = os.path.join( __dir__, 'Icons' )
 
 import FastenerBase
 from FastenerBase import FSBaseObject
+from FSCatalog import FSGetCatalogTable
 import ScrewMaker  
 #screwMaker = ScrewMaker.Instance()
 
@@ -94,7 +95,7 @@ def nutMakeFace(do, di, s, m):
 def nutMakeSolid(diam):
   if not(diam in MHexNutTable):
     return None
-  (key, shape) = FastenerBase.FSGetKey('Nut', diam)
+  (key, shape) = FastenerBase.FSGetKey('Nut', 'ISO4032', diam)
   if shape != None:
     return shape
   
@@ -170,20 +171,13 @@ Gui.addCommand("FSHexNut", FSHexNutCommand())
 
 ###################################################################################
 # Square Metric Hex nuts DIN562
-din562def = {
 #         s,    m,    d
-  'M1.6':(3.2,  1,    1.25),
-  'M2':  (4.0,  1.2,  1.6),
-  'M2.5':(5.0,  1.6,  2.05),
-  'M3':  (5.5,  1.8,  2.5),
-  'M4':  (7.0,  2.2,  3.3),
-  'M5':  (8.0,  2.7,  4.2),
-  'M6':  (10.0, 3.2,  5.0),
-  'M8':  (13.0, 4,    6.8),
-  'M10': (17.0, 5,    8.5)
-}
+din562def = FSGetCatalogTable('din562def')
 
 def makeSquareTool(s, m):
+  return ScrewMaker.Instance().getCachedTool(('square', s, m), buildSquareTool, s, m)
+
+def buildSquareTool(s, m):
   # makes a cylinder with an inner square hole, used as cutting tool
   # create square face
   msq = Base.Matrix()
@@ -233,75 +227,34 @@ def sqnutMakeFace(do, di, dw, s, m):
 def nut562MakeSolid(diam):
   if not(diam in din562def):
     return None
-  (key, shape) = FastenerBase.FSGetKey('Nut562', diam)
-  if shape != None:
-    return shape
   
   s, m, di = din562def[diam]
   do = FastenerBase.MToFloat(diam)
   f = sqnutMakeFace(do, di, 0, s, m)
   p = f.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
   htool = makeSquareTool(s, m)
-  shape = p.cut(htool)
-  FastenerBase.FSCache[key] = shape
-  return shape
+  return p.cut(htool)
     
 ###################################################################################
 # Square Metric Hex nuts DIN 557
-din557def = {
 #         s,    m,    d     dw
-  'M4':  (7.0,  3.2,  3.3,  5.7),
-  'M5':  (8.0,  4,    4.2,  6.7),
-  'M6':  (10.0, 5,    5.0,  8.7),
-  'M8':  (13.0, 6.5,  6.8,  11.5),
-  'M10': (17.0, 8,    8.5,  15.5),
-  'M12': (19.0, 10,   10.2, 17.2),
-  'M16': (24.0, 13,   14.0, 22)
-}
+din557def = FSGetCatalogTable('din557def')
 
 def nut557MakeSolid(diam):
   if not(diam in din557def):
     return None
-  (key, shape) = FastenerBase.FSGetKey('Nut557', diam)
-  if shape != None:
-    return shape
   
   s, m, di, dw = din557def[diam]
   do = FastenerBase.MToFloat(diam)
   f = sqnutMakeFace(do, di, dw, s, m)
   p = f.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
   htool = makeSquareTool(s, m)
-  shape = p.cut(htool)
-  FastenerBase.FSCache[key] = shape
-  return shape
+  return p.cut(htool)
   
 ###################################################################################
 # Nyloc Hex nuts DIN 985
-din985def = {
 #           P,    damax, dw,  e,     m,   h,    s_nom
-  'M3':    (0.5,  3.45, 4.6,  6.1,   2.4,  4.0,  5.5),
-  'M4':    (0.7,  4.6,  5.9,  7.7,   2.9,  5.0,  7.0), 
-  'M5':    (0.8,  5.75, 6.9,  8.9,   3.2,  5.0,  8.0),
-  'M6':    (1.0,  6.75, 8.9,  11.05, 4.0,  6.0, 10.0),
-  'M7':    (1.0,  6.75, 9.6,  12.12, 4.7,  7.5, 11.0),
-  'M8':    (1.25, 8.75, 11.6, 14.5,  5.5,  8.0, 13.0),
-  'M10':   (1.50, 10.8, 15.6, 17.9,  6.5, 10.0,  16.0),
-  'M12':   (1.75, 13.0, 17.4, 20.1,  8.0, 12.0,  18.0),
-  'M14':   (2.00, 15.1, 20.5, 24.5,  9.5, 14.0,  22.0),
-  'M16':   (2.00, 17.3, 22.5, 26.9, 10.5, 16.0,  24.0),
-  'M18':   (2.50, 19.5, 24.9, 29.6, 13.0, 18.5,  27.0),
-  'M20':   (2.50, 21.6, 27.7, 33.7, 14.0, 20.0,  30.0),
-  'M22':   (2.50, 23.7, 29.5, 37.3, 15.0, 22.0,  34.0),
-  'M24':   (3.00, 25.9, 33.2, 40.1, 15.0, 24.0,  36.0),
-  'M27':   (3.00, 29.1, 38.0, 45.2, 17.0, 27.0,  41.0),
-  'M30':   (3.50, 32.4, 42.7, 50.9, 19.0, 30.0,  46.0), 
-  'M33':   (3.50, 35.6, 46.6, 55.4, 22.0, 33.0,  50.0), 
-  'M36':   (4.00, 38.9, 51.1, 61.0, 25.0, 36.0,  55.0),
-  'M39':   (4.00, 42.1, 55.9, 66.5, 17.0, 39.0,  60.0),
-  'M42':   (4.50, 45.4, 60.6, 71.3, 29.0, 42.0,  65.0),
-  'M45':   (4.50, 48.6, 64.7, 77.0, 32.0, 45.0,  70.0),
-  'M48':   (5.00, 51.8, 69.4, 82.6, 36.0, 48.0,  75.0),
-  } 
+din985def = FSGetCatalogTable('din985def')
 
   
 def nylocMakeFace(do, p, da, dw, e, m, h, s):
@@ -335,9 +288,6 @@ def nylocMakeFace(do, p, da, dw, e, m, h, s):
 def nut985MakeSolid(diam):
   if not(diam in din985def):
     return None
-  (key, shape) = FastenerBase.FSGetKey('Nut985', diam)
-  if shape != None:
-    return shape
   
   p, da, dw, e, m, h, s = din985def[diam]
   do = FastenerBase.MToFloat(diam)
@@ -345,11 +295,10 @@ def nut985MakeSolid(diam):
   p = f.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
   screwMaker = ScrewMaker.Instance()
   htool = htool = screwMaker.makeHextool(s, m, s * 2)
-  shape = p.cut(htool)
-  FastenerBase.FSCache[key] = shape
-  return shape
+  return p.cut(htool)
  
  
+# the nuts are built through ScrewMaker, which caches them in FSCache
 def createNut(type, diam):
   if (type == 'DIN557'):
     return nut557MakeSolid(diam)
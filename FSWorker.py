@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  FSWorker.py
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#
+###################################################################################
+
+# generates fastener shapes in a separate FreeCADCmd process:
+#   FreeCADCmd FSWorker.py
+# the request is passed as json in the FSWORKER_SPEC environment variable:
+#   path: workbench directory
+#   tuner: thread tuner value
+#   items: list of fasteners to generate, each with
+#     type, diam, len, thread: fastener parameters as given to createScrew
+#     scaling: generator settings fingerprint of the cache key, see Screw.applySettings
+#     out: file name for the resulting brep, left empty if generation fails
+
+import os, sys, json
+
+def buildFastener(screw, item):
+  screw.applySettings(item['scaling'])
+  return screw.createScrew(item['type'], item['diam'], item['len'], item['thread'], True)
+
+if 'FSWORKER_SPEC' in os.environ:
+  res = 0
+  try:
+    spec = json.loads(os.environ['FSWORKER_SPEC'])
+    if not(spec['path'] in sys.path):
+      sys.path.insert(0, spec['path'])
+    from screw_maker import Screw
+    screw = Screw()
+    screw.Tuner = spec['tuner']
+    for item in spec['items']:
+      try:
+        buildFastener(screw, item).exportBrep(item['out'])
+      except Exception as e:
+        sys.stderr.write("Fastener worker failed for " + item['type'] + " " + item['diam'] + ": " + str(e) + "\n")
+        res = 1
+  except Exception as e:
+    sys.stderr.write("Fastener worker failed: " + str(e) + "\n")
+    res = 1
+  sys.stderr.flush()
+  # FreeCADCmd may stay in its console after the script, so leave right away
+  os._exit(res)
@@ -24,8 +24,8 @@
 ###################################################################################
 from FreeCAD import Gui
 from FreeCAD import Base
-from PySide import QtGui
-import FreeCAD, FreeCADGui, Part, os, math, sys
+from PySide import QtCore, QtGui
+import FreeCAD, FreeCADGui, Part, os, math, sys, collections, hashlib, tempfile, time, heapq, json
 import DraftVecUtils
 
 __dir__ = os.path.dirname(__file__)
@@ -113,7 +113,7 @@ def FSAddFastenerType(typeName, hasLength = True, lengthFixed = True):
   FSFasenerTypeDB[typeName] = FSFastenerType(typeName, hasLength, lengthFixed)
   
 def FSAddItemsToType(typeName, item):
-  if not(typeName in FSFasenerTypeDB):
+  if not(typeName in FSFasenerTypeDB) or item in FSFasenerTypeDB[typeName].items:
     return
   FSFasenerTypeDB[typeName].items.append(item)
 
@@ -149,24 +149,410 @@ def FSGetToolbarItem(tname, iname):
   return None
       
 
+class FSCacheParamObserver:
+  '''Refreshes the cache limits when they are changed in the preferences'''
+  def __init__(self, cache):
+    self.cache = cache
+
+  def OnChange(self, grp, name):
+    if name in ("ShapeCacheSize", "ShapeCacheEntries"):
+      self.cache.updateLimits()
+      self.cache.evict()
+
 # fastener chach - prevent recreation of same fasteners
-FSCache = {}
-def FSGetKey(*args):
-  obj = None
-  key = 'FS'
-  for arg in args:
-    key = key + '|' + str(arg)
-  if key in FSCache:
-    FreeCAD.Console.PrintLog("Using cached shape for: " + key + "\n")
-    return (key, FSCache[key])
-  return (key, None)
+# shapes are kept in least recently used order and evicted when the memory
+# budget set in the preferences is exceeded
+class FSShapeCache:
+  '''Memory bounded LRU cache of generated fastener shapes'''
+  def __init__(self):
+    self.shapes = collections.OrderedDict()
+    self.sizes = {}
+    self.index = {} # (field, value) -> set of keys
+    self.totalSize = 0
+    self.disk = FSDiskCache()
+    self.updateLimits()
+    self.resetStats()
+    self.paramObserver = FSCacheParamObserver(self)
+    FSParam.Attach(self.paramObserver)
+
+  def resetStats(self):
+    self.hits = 0
+    self.diskHits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.buildStarts = {} # key -> time the shape was found missing
+    self.buildTimes = {} # standard -> [number of builds, total seconds]
+    self.slowest = [] # heap of (seconds, build number, key)
+    self.buildCount = 0
+
+  def updateLimits(self):
+    self.maxSize = FSParam.GetInt("ShapeCacheSize", 512) * 1024 * 1024
+    self.maxEntries = FSParam.GetInt("ShapeCacheEntries", 1000)
+
+  def __contains__(self, key):
+    return key in self.shapes
+
+  def __len__(self):
+    return len(self.shapes)
+
+  def __getitem__(self, key):
+    shape = self.shapes.pop(key)
+    self.shapes[key] = shape # mark as most recently used
+    return shape
+
+  def __setitem__(self, key, shape):
+    self.recordBuild(key)
+    self.put(key, shape)
+    self.disk.store(key, shape)
+
+  # look up a shape in memory, then on disk
+  def get(self, key):
+    if key in self.shapes:
+      self.hits += 1
+      return self[key]
+    shape = self.disk.load(key)
+    if shape is not None:
+      self.diskHits += 1
+      self.put(key, shape)
+    else:
+      self.misses += 1
+      self.buildStarts[key] = time.time()
+    return shape
+
+  # the time between a miss and storing the generated shape is counted as build time
+  def recordBuild(self, key):
+    if not key in self.buildStarts:
+      return
+    secs = time.time() - self.buildStarts.pop(key)
+    standard = getattr(key, 'standard', None) or getattr(key, 'kind', str(key))
+    if not standard in self.buildTimes:
+      self.buildTimes[standard] = [0, 0.0]
+    self.buildTimes[standard][0] += 1
+    self.buildTimes[standard][1] += secs
+    self.buildCount += 1
+    if len(self.slowest) < FSCacheSlowestCount:
+      heapq.heappush(self.slowest, (secs, self.buildCount, key))
+    elif secs > self.slowest[0][0]:
+      heapq.heapreplace(self.slowest, (secs, self.buildCount, key))
+
+  def stats(self):
+    lookups = self.hits + self.diskHits + self.misses
+    return {
+      'hits': self.hits,
+      'diskHits': self.diskHits,
+      'misses': self.misses,
+      'hitRate': float(self.hits + self.diskHits) / lookups if lookups > 0 else 0.0,
+      'evictions': self.evictions,
+      'entries': len(self.shapes),
+      'bytes': self.totalSize,
+      'maxBytes': self.maxSize,
+      'buildTimes': dict((std, tuple(val)) for std, val in self.buildTimes.items()),
+      'slowest': [(secs, key) for secs, num, key in sorted(self.slowest, reverse = True)],
+      'partCaches': [(name, cache.stats()) for name, cache in FSPartCaches.items()]}
+
+  def report(self):
+    st = self.stats()
+    res = "Fastener shape cache\n"
+    res += "  entries: %d, resident: %.1f MB of %.0f MB\n" % (st['entries'], st['bytes'] / 1048576.0, st['maxBytes'] / 1048576.0)
+    res += "  hits: %d, disk hits: %d, misses: %d (hit rate %.1f%%)\n" % (st['hits'], st['diskHits'], st['misses'], st['hitRate'] * 100.0)
+    res += "  evictions: %d\n" % st['evictions']
+    for name, pst in st['partCaches']:
+      res += "%s cache: %d of %d entries, hits: %d, misses: %d, evictions: %d\n" % (name,
+          pst['entries'], pst['maxEntries'], pst['hits'], pst['misses'], pst['evictions'])
+    if len(st['buildTimes']) > 0:
+      res += "Build time per standard:\n"
+      for std, (cnt, secs) in sorted(st['buildTimes'].items(), key = lambda x: -x[1][1]):
+        res += "  %s: %d builds, %.2f s total, %.3f s average\n" % (std, cnt, secs, secs / cnt)
+    if len(st['slowest']) > 0:
+      res += "Slowest shapes:\n"
+      for secs, key in st['slowest']:
+        res += "  %.3f s: %s\n" % (secs, FSKeyText(key))
+    return res
+
+  # add a shape to the memory tier only
+  def put(self, key, shape):
+    if key in self.shapes:
+      self.__delitem__(key)
+    size = FSShapeFootprint(shape)
+    self.shapes[key] = shape
+    self.sizes[key] = size
+    for field in FSKeyIndexFields:
+      self.index.setdefault((field, getattr(key, field, None)), set()).add(key)
+    self.totalSize += size
+    self.evict()
+
+  def __delitem__(self, key):
+    del self.shapes[key]
+    self.totalSize -= self.sizes.pop(key)
+    for field in FSKeyIndexFields:
+      ikey = (field, getattr(key, field, None))
+      keys = self.index[ikey]
+      keys.discard(key)
+      if len(keys) == 0:
+        del self.index[ikey]
+
+  def keys(self):
+    return list(self.shapes.keys())
+
+  # get the cached keys whose fields match all given values, eg. keysMatching(thread = 'real')
+  def keysMatching(self, **fields):
+    candidates = None
+    for field in fields:
+      if field in FSKeyIndexFields:
+        keys = self.index.get((field, fields[field]), set())
+        if candidates == None or len(keys) < len(candidates):
+          candidates = keys
+    if candidates == None:
+      candidates = self.shapes
+    res = []
+    for key in candidates:
+      match = True
+      for field in fields:
+        if getattr(key, field, None) != fields[field]:
+          match = False
+          break
+      if match:
+        res.append(key)
+    return res
+
+  def removeMatching(self, **fields):
+    for key in self.keysMatching(**fields):
+      FreeCAD.Console.PrintLog("Removing cached shape: " + str(key) + "\n")
+      self.__delitem__(key)
+
+  def clear(self):
+    self.shapes.clear()
+    self.sizes.clear()
+    self.index.clear()
+    self.totalSize = 0
+
+  # remove least recently used shapes until within budget. the most recent shape is always kept
+  def evict(self):
+    while len(self.shapes) > 1 and (self.totalSize > self.maxSize or len(self.shapes) > self.maxEntries):
+      key = next(iter(self.shapes))
+      FreeCAD.Console.PrintLog("Evicting cached shape: " + str(key) + "\n")
+      self.__delitem__(key)
+      self.evictions += 1
+
+# second cache tier: generated shapes are stored as brep files in the user cache
+# directory so they survive between sessions. file names are derived from the
+# cache key (which includes the thread scaling fingerprint) and the generator sources
+# and data: the catalog tables and the thread tuner table.
+FSDiskCacheFormat = 1
+FSGeneratorFiles = ('FastenerBase.py', 'ScrewMaker.py', 'screw_maker.py', 'FSNuts.py', 'PEMInserts.py', 'CountersunkHoles.py',
+    'FSCatalog.py', 'FSTunerTable.json')
+FSGeneratorDataDirs = ('Catalog',) # all json files in these directories
+FSDiskCacheTmpAge = 3600 # seconds after which a left over temporary file is removed
+
+def FSGetGeneratorFiles():
+  files = list(FSGeneratorFiles)
+  for dname in FSGeneratorDataDirs:
+    try:
+      files.extend([os.path.join(dname, fname) for fname in sorted(os.listdir(os.path.join(__dir__, dname))) if fname.endswith('.json')])
+    except OSError:
+      pass
+  return files
+
+class FSDiskCache:
+  '''Persistent brep cache of generated fastener shapes'''
+  def __init__(self):
+    if hasattr(FreeCAD, 'getUserCachePath'):
+      basedir = FreeCAD.getUserCachePath()
+    else:
+      basedir = os.path.join(FreeCAD.getUserAppDataDir(), 'Cache')
+    self.path = os.path.join(basedir, 'Fasteners')
+    self.storeCount = 0
+    self.version = FSDiskCacheFormat
+    # any change in the generator code or data invalidates the cached shapes
+    for fname in FSGetGeneratorFiles():
+      try:
+        st = os.stat(os.path.join(__dir__, fname))
+        self.version = str(self.version) + '|' + fname + ':' + str(st.st_size) + ':' + str(int(st.st_mtime))
+      except OSError:
+        pass
+
+  def isEnabled(self):
+    return FSParam.GetBool("DiskCacheEnabled", True)
+
+  def fileName(self, key):
+    id = str(key) + '#' + str(self.version)
+    return os.path.join(self.path, hashlib.sha1(id.encode('utf-8')).hexdigest() + '.brep')
+
+  def load(self, key):
+    if not self.isEnabled():
+      return None
+    fname = self.fileName(key)
+    if not os.path.isfile(fname):
+      return None
+    try:
+      shape = Part.Shape()
+      shape.importBrep(fname)
+      os.utime(fname, None) # keep recently used files when trimming
+    except Exception:
+      FreeCAD.Console.PrintWarning("Removing unreadable cached shape: " + fname + "\n")
+      self.remove(fname)
+      return None
+    if shape.isNull():
+      return None
+    FreeCAD.Console.PrintLog("Loaded cached shape from disk for: " + str(key) + "\n")
+    return shape
+
+  def store(self, key, shape):
+    if not self.isEnabled():
+      return
+    fname = self.fileName(key)
+    try:
+      if not os.path.isdir(self.path):
+        os.makedirs(self.path)
+      # write to a temporary file first so other sessions never see a partial file
+      fd, tmpname = tempfile.mkstemp(suffix = '.tmp', dir = self.path)
+      os.close(fd)
+      shape.exportBrep(tmpname)
+      if hasattr(os, 'replace'):
+        os.replace(tmpname, fname)
+      else:
+        if os.path.exists(fname):
+          os.remove(fname)
+        os.rename(tmpname, fname)
+    except Exception:
+      FreeCAD.Console.PrintWarning("Failed writing cached shape: " + fname + "\n")
+      return
+    self.storeCount += 1
+    if self.storeCount % 32 == 1:
+      self.trim()
+
+  def remove(self, fname):
+    try:
+      os.remove(fname)
+    except OSError:
+      pass
+
+  # delete least recently used files until the cache fits the size limit.
+  # temporary files left by crashed sessions are removed as well
+  def trim(self):
+    maxSize = FSParam.GetInt("DiskCacheSize", 1024) * 1024 * 1024
+    files = []
+    totalSize = 0
+    now = time.time()
+    try:
+      for fname in os.listdir(self.path):
+        if fname.endswith('.tmp'):
+          fname = os.path.join(self.path, fname)
+          if now - os.stat(fname).st_mtime > FSDiskCacheTmpAge:
+            self.remove(fname)
+          continue
+        if not fname.endswith('.brep'):
+          continue
+        fname = os.path.join(self.path, fname)
+        st = os.stat(fname)
+        files.append((st.st_mtime, st.st_size, fname))
+        totalSize += st.st_size
+    except OSError:
+      return
+    files.sort()
+    for mtime, size, fname in files:
+      if totalSize <= maxSize:
+        break
+      self.remove(fname)
+      totalSize -= size
+
+  def clear(self):
+    if not os.path.isdir(self.path):
+      return
+    for fname in os.listdir(self.path):
+      if fname.endswith('.brep') or fname.endswith('.tmp'):
+        self.remove(os.path.join(self.path, fname))
+
+# rough estimate of the memory used by a shape, in bytes
+def FSShapeFootprint(shape):
+  size = 1024 + len(shape.Edges) * 512 + len(shape.Vertexes) * 128
+  for face in shape.Faces:
+    size += 2048
+    surf = face.Surface
+    if hasattr(surf, 'NbUPoles'):
+      # bspline surfaces (thread sweeps) dominate the memory usage
+      size += surf.NbUPoles * surf.NbVPoles * 32
+  return size
+
+# cache key: kind of fastener object, standard (or table) name, diameter, length,
+# thread mode and generator settings fingerprint (3D print scaling, thread engine). unused fields are None
+FSKey = collections.namedtuple('FSKey', 'kind standard diameter length thread scaling')
+FSKeyIndexFields = ('kind', 'standard', 'thread')
+FSCacheSlowestCount = 10
+
+# caches of intermediate shapes kept by the generators (thread turns, tools...).
+# they are reported together with the shape cache. a part cache has a stats()
+# method returning hits, misses, evictions, entries and maxEntries
+FSPartCaches = collections.OrderedDict()
+def FSRegisterPartCache(name, cache):
+  FSPartCaches[name] = cache
+
+# short human readable form of a cache key
+def FSKeyText(key):
+  return ' '.join(str(field) for field in key if field != None)
+
+FSCache = FSShapeCache()
+def FSGetKey(kind, standard = None, diameter = None, length = None, thread = None, scaling = None):
+  key = FSKey(kind, standard, diameter, length, thread, scaling)
+  shape = FSCache.get(key)
+  if shape is not None:
+    FreeCAD.Console.PrintLog("Using cached shape for: " + str(key) + "\n")
+  return (key, shape)
   
 # removes all cached fasteners with real thread
 def FSCacheRemoveThreaded():
-  for key in FSCache.keys():
-    if key.endswith('|real'):
-      FreeCAD.Console.PrintLog("Removing cached shape: " + key + "\n")
-      del FSCache[key]
+  FSCache.removeMatching(thread = 'real')
+
+# usage count of cache keys, kept between sessions to warm up the cache with
+# the most used fasteners
+class FSUsageStats:
+  '''Persistent usage count of fastener cache keys'''
+  def __init__(self):
+    self.path = os.path.join(FreeCAD.getUserAppDataDir(), 'Fasteners', 'usage.json')
+    self.counts = None
+    self.saveScheduled = False
+
+  def load(self):
+    self.counts = {}
+    if not os.path.isfile(self.path):
+      return
+    try:
+      with open(self.path) as f:
+        for fields, count in json.load(f):
+          # json turns the scaling fingerprint into a list
+          if isinstance(fields[5], list):
+            fields[5] = tuple(fields[5])
+          self.counts[FSKey(*fields)] = count
+    except Exception:
+      FreeCAD.Console.PrintWarning("Failed reading fastener usage file: " + self.path + "\n")
+
+  def record(self, key):
+    if self.counts == None:
+      self.load()
+    self.counts[key] = self.counts.get(key, 0) + 1
+    # save once after a burst of updates
+    if not self.saveScheduled:
+      self.saveScheduled = True
+      QtCore.QTimer.singleShot(5000, self.save)
+
+  def save(self):
+    self.saveScheduled = False
+    try:
+      dir = os.path.dirname(self.path)
+      if not os.path.isdir(dir):
+        os.makedirs(dir)
+      with open(self.path, 'w') as f:
+        json.dump([[list(key), count] for key, count in self.counts.items()], f)
+    except Exception:
+      FreeCAD.Console.PrintWarning("Failed writing fastener usage file: " + self.path + "\n")
+
+  def mostUsed(self, count):
+    if self.counts == None:
+      self.load()
+    keys = sorted(self.counts, key = lambda k: -self.counts[k])
+    return keys[:count]
+
+FSUsage = FSUsageStats()
 
 def MToFloat(m):
     m = m.lstrip('(');
@@ -279,22 +665,76 @@ class FSFaceMaker:
     w = Part.Wire(self.edges)
     return Part.Face(w)
     
+# size matching of many holes at once. the sizes of a table are kept sorted in
+# numpy arrays, built once per table and match mode. numpy is loaded on use
+FSSizeArrays = {}
+
+def FSGetSizeArrays(key, table, sizeFunc):
+  ''' (values, names) of a size table, sorted by value. sizeFunc gives the
+      value of a table entry '''
+  if not(key in FSSizeArrays):
+    import numpy
+    names = list(table)
+    values = numpy.array([sizeFunc(m) for m in names], dtype = float)
+    order = numpy.argsort(values, kind = 'stable')
+    FSSizeArrays[key] = (values[order], [names[i] for i in order])
+  return FSSizeArrays[key]
+
+def FSHoleDiameters(holes):
+  ''' diameters of holes as numpy array. holes are circular edges or radii,
+      nan for anything else '''
+  import numpy
+  diams = [float('nan')] * len(holes)
+  for i, hole in enumerate(holes):
+    if isinstance(hole, (int, float)):
+      diams[i] = hole * 2
+    elif hole != None and hasattr(hole, 'Curve') and hasattr(hole.Curve, 'Radius'):
+      diams[i] = hole.Curve.Radius * 2
+  return numpy.array(diams, dtype = float)
+
+def FSMatchSizes(sizes, diams, mode, maxdif, default):
+  ''' name of the matching size for every diameter, default if there is none
+      closer than maxdif. mode: 'below' = largest size smaller than the
+      diameter, 'above' = smallest size larger than the diameter, 'nearest' =
+      closest size. on equal sizes the first in table order is taken '''
+  import numpy
+  values, names = sizes
+  n = len(values)
+  if n == 0:
+    return [default] * len(diams)
+  diams = numpy.asarray(diams, dtype = float)
+  if mode == 'above':
+    idx = numpy.searchsorted(values, diams, side = 'right')
+    found = idx < n
+    idx = numpy.minimum(idx, n - 1)
+    dif = values[idx] - diams
+  else:
+    idx = numpy.searchsorted(values, diams, side = 'left') - 1
+    found = idx >= 0
+    idx = numpy.maximum(idx, 0)
+    dif = diams - values[idx]
+    if mode == 'nearest':
+      upper = numpy.minimum(idx + found, n - 1)
+      updif = numpy.abs(values[upper] - diams)
+      useUpper = numpy.logical_or(numpy.logical_not(found), updif < dif)
+      idx = numpy.where(useUpper, upper, idx)
+      dif = numpy.where(useUpper, updif, dif)
+      found = numpy.ones(len(diams), dtype = bool)
+    # first of equal sizes
+    idx = numpy.searchsorted(values, values[idx], side = 'left')
+  found = numpy.logical_and(found, dif < maxdif)
+  return [names[i] if ok else default for i, ok in zip(idx.tolist(), found.tolist())]
+
+def FSAutoDiametersM(holes, table, tablepos):
+  ''' FSAutoDiameterM for a list of hole edges or radii '''
+  if tablepos == -1:
+    sizes = FSGetSizeArrays((id(table), tablepos), table, lambda m: MToFloat(m) + 0.1)
+  else:
+    sizes = FSGetSizeArrays((id(table), tablepos), table, lambda m: table[m][tablepos] + 0.1)
+  return FSMatchSizes(sizes, FSHoleDiameters(holes), 'above', 10.0, 'M5')
+
 def FSAutoDiameterM(holeObj, table, tablepos):
-  res = 'M5'
-  if holeObj != None and hasattr(holeObj, 'Curve') and hasattr(holeObj.Curve, 'Radius'):
-    d = holeObj.Curve.Radius * 2
-    mindif = 10.0
-    for m in table:
-        if tablepos == -1:
-          dia = MToFloat(m) + 0.1
-        else:
-          dia = table[m][tablepos] + 0.1
-        if (dia > d):
-          dif = dia - d
-          if dif < mindif:
-            mindif = dif
-            res = m
-  return res
+  return FSAutoDiametersM([holeObj], table, tablepos)[0]
 
 class FSViewProviderIcon:
   "A View provider for custom icon"
@@ -366,6 +806,7 @@ def FSGetAttachableSelections():
       edgestable[baseObjectName] = 1
       
     # add all edges of a selected surface
+    edgeIndex = None
     for subobj in selObj.SubObjects:
       if not(isinstance(subobj, Part.Face)):
         continue
@@ -376,7 +817,9 @@ def FSGetAttachableSelections():
           continue
         if not(hasattr(edge.Curve,"Center")):
           continue
-        edgeName = GetEdgeName(obj.Shape, edge)
+        if edgeIndex == None:
+          edgeIndex = FSEdgeIndex(obj.Shape)
+        edgeName = edgeIndex.name(edge)
         if edgeName == None or edgeName in edgestable:
           continue
         asels.append((obj, [edgeName]))
@@ -386,12 +829,146 @@ def FSGetAttachableSelections():
     asels.append(None)
   return asels
 
-def FSGenerateObjects(objectClass, name):
-  for selObj in FSGetAttachableSelections():
+# the edges of a shape by hash code, to find edge names without comparing
+# against every edge of the shape
+class FSEdgeIndex:
+  def __init__(self, shape):
+    self.edges = {}
+    for i, edge in enumerate(shape.Edges):
+      self.edges.setdefault(edge.hashCode(), []).append((i + 1, edge))
+
+  def name(self, edge):
+    for i, e in self.edges.get(edge.hashCode(), []):
+      if e.isSame(edge):
+        return 'Edge' + str(i)
+    return None
+
+# hole detection: all circular edges of a shape are grouped by their axis line.
+# coaxial edges belong to one hole, which gets the edge with the smallest
+# radius within the diameter range. of several such edges the one on top
+# (along the axis pointing upwards) is used, e.g. the floor of a counterbore
+FSHoleDigits = 4 # rounding of axis and position when comparing edges
+
+def FSHoleAxis(edge):
+  ''' (axis key, radius, height) of a circle or arc edge, None for other edges '''
+  if not(hasattr(edge, 'Curve') and isinstance(edge.Curve, Part.Circle)):
+    return None
+  axis = FreeCAD.Vector(edge.Curve.Axis)
+  axis.normalize()
+  # the same direction for both ends of a hole, upwards if possible
+  for c in (axis.z, axis.y, axis.x):
+    if abs(c) > 10 ** -FSHoleDigits:
+      if c < 0:
+        axis = axis.negative()
+      break
+  center = edge.Curve.Center
+  height = center.dot(axis)
+  base = center - axis * height
+  key = tuple([round(c, FSHoleDigits) + 0.0 for c in (axis.x, axis.y, axis.z, base.x, base.y, base.z)])
+  return (key, edge.Curve.Radius, height)
+
+# True if the cylinder or cone face is concave: its normal points to the axis
+# like in a hole, not away from it like on a boss or shaft. None for other faces
+def FSIsConcaveFace(face, axis):
+  surf = face.Surface
+  if not isinstance(surf, (Part.Cylinder, Part.Cone)) or abs(surf.Axis.dot(axis)) < 1.0 - 10 ** -FSHoleDigits:
+    return None
+  umin, umax, vmin, vmax = face.ParameterRange
+  pnt = face.valueAt((umin + umax) / 2.0, (vmin + vmax) / 2.0)
+  normal = face.normalAt((umin + umax) / 2.0, (vmin + vmax) / 2.0)
+  radial = pnt - surf.Center
+  radial = radial - surf.Axis * radial.dot(surf.Axis)
+  return normal.dot(radial) < 0.0
+
+# a circular edge belongs to a hole if a cylinder or cone face next to it is concave
+def FSIsHoleEdge(shape, edge):
+  axis = FreeCAD.Vector(edge.Curve.Axis)
+  axis.normalize()
+  return True in [FSIsConcaveFace(face, axis) for face in shape.ancestorsOfType(edge, Part.Face)]
+
+def FSFindHoles(obj, minDiam = 0.0, maxDiam = 0.0):
+  ''' Find the holes of an object with a diameter between minDiam and maxDiam
+      (0 = no limit). Returns a list of attachable selections (obj, [edgeName]),
+      one per hole '''
+  shape = obj.Shape
+  holes = {}
+  arcs = {} # (axis key, radius, height) -> [angle, index of the first arc]
+  for i, edge in enumerate(shape.Edges):
+    hole = FSHoleAxis(edge)
+    if hole == None:
+      continue
+    key, radius, height = hole
+    if radius * 2 < minDiam or (maxDiam > 0.0 and radius * 2 > maxDiam):
+      continue
+    if not edge.isClosed():
+      # rims split into arcs (e.g. by STEP export) count once they close the
+      # circle, the hole is attached to the first arc
+      arc = arcs.setdefault((key, round(radius, FSHoleDigits), round(height, FSHoleDigits)), [0.0, i])
+      full = arc[0] >= 2.0 * math.pi - 10 ** -FSHoleDigits
+      arc[0] += edge.LastParameter - edge.FirstParameter
+      if full or arc[0] < 2.0 * math.pi - 10 ** -FSHoleDigits:
+        continue
+      i = arc[1]
+    if not FSIsHoleEdge(shape, edge):
+      continue
+    best = holes.get(key)
+    if best == None or round(radius - best[0], FSHoleDigits) < 0 or \
+        (round(radius - best[0], FSHoleDigits) == 0 and height > best[1]):
+      holes[key] = (radius, height, i + 1)
+  return [(obj, ['Edge' + str(hole[2])]) for hole in sorted(holes.values(), key = lambda h: h[2])]
+
+# creators of fastener objects by name, used to fill holes. a factory is
+# called with an attachable selection (obj, [edgeName]) or None and returns
+# the new object
+FSFactories = {}
+def FSRegisterFactory(name, factory):
+  FSFactories[name] = factory
+
+# raised by a generator when the user cancels a long running generation
+class FSCancelled(Exception):
+  pass
+
+def FSObjectFactory(objectClass, name):
+  ''' factory for fastener classes with an icon view provider '''
+  def create(selObj):
     a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
     objectClass(a, selObj)
     FSViewProviderIcon(a.ViewObject)
-  FreeCAD.ActiveDocument.recompute()
+    return a
+  return create
+
+# batch preparation of new fasteners by proxy class. called with the list of
+# new objects of that class before they are recomputed, e.g. to generate all
+# distinct shapes at once
+FSPrebuilders = {}
+
+def FSCreateFasteners(factory, selObjs):
+  ''' Create a fastener with the given factory for every attachable selection.
+      All objects are added in one undo transaction and only the new objects
+      are recomputed. If the generation is cancelled nothing is added '''
+  doc = FreeCAD.ActiveDocument
+  doc.openTransaction("Add fasteners")
+  try:
+    objs = [factory(selObj) for selObj in selObjs]
+    classes = {}
+    for obj in objs:
+      classes.setdefault(obj.Proxy.__class__, []).append(obj)
+    for cls in classes:
+      if cls in FSPrebuilders:
+        FSPrebuilders[cls](classes[cls])
+    doc.recompute(objs)
+  except FSCancelled as e:
+    doc.abortTransaction()
+    FreeCAD.Console.PrintMessage(str(e) + "\n")
+    return []
+  except:
+    doc.abortTransaction()
+    raise
+  doc.commitTransaction()
+  return objs
+
+def FSGenerateObjects(objectClass, name):
+  FSCreateFasteners(FSObjectFactory(objectClass, name), FSGetAttachableSelections())
 
 def FSMoveToObject(ScrewObj_m, attachToObject, invert, offset):
     Pnt1 = None
@@ -554,6 +1131,62 @@ class FSMakeSimpleCommand:
         
 Gui.addCommand('FSSimple',FSMakeSimpleCommand())
 FSCommands.append('FSSimple', "command")
+
+class FSFillHolesCommand:
+  """Fill holes command"""
+
+  def GetResources(self):
+    icon = os.path.join( iconPath , 'IconFillHoles.svg')
+    return {'Pixmap'  : icon , # the name of a svg file available in the resources
+            'MenuText': "Fill holes" ,
+            'ToolTip' : "Add a fastener to every hole of the selected objects"}
+ 
+  def Activated(self):
+    objs = self.GetObjects()
+    if len(objs) == 0 or len(FSFactories) == 0:
+      return
+    win = Gui.getMainWindow()
+    title = "Fill holes"
+    names = sorted(FSFactories)
+    last = FSParam.GetString("FillHolesFastener", "ISO4762")
+    current = 0
+    if last in names:
+      current = names.index(last)
+    name, ok = QtGui.QInputDialog.getItem(win, title, "Fastener:", names, current, False)
+    if not ok:
+      return
+    FSParam.SetString("FillHolesFastener", name)
+    minDiam, ok = QtGui.QInputDialog.getDouble(win, title, "Minimum hole diameter (mm):", 0.0, 0.0, 10000.0, 2)
+    if not ok:
+      return
+    maxDiam, ok = QtGui.QInputDialog.getDouble(win, title, "Maximum hole diameter (mm), 0 = no limit:", 0.0, 0.0, 10000.0, 2)
+    if not ok:
+      return
+    holes = []
+    for obj in objs:
+      holes.extend(FSFindHoles(obj, minDiam, maxDiam))
+    FreeCAD.Console.PrintMessage("Adding " + name + " to " + str(len(holes)) + " holes\n")
+    if len(holes) > 0:
+      FSCreateFasteners(FSFactories[name], holes)
+    return
+   
+  def IsActive(self):
+    return len(self.GetObjects()) > 0
+
+  def GetObjects(self):
+    objs = []
+    for selObj in Gui.Selection.getSelectionEx():
+      obj = selObj.Object
+      grp = obj.getParentGeoFeatureGroup()
+      if grp != None and hasattr(grp,'TypeId') and grp.TypeId == 'PartDesign::Body' :
+        obj = grp
+      if hasattr(obj, 'Shape') and not(hasattr(obj, 'Proxy') and isinstance(obj.Proxy, FSBaseObject)) and not(obj in objs):
+        objs.append(obj)
+    return objs
+        
+        
+Gui.addCommand('FSFillHoles',FSFillHolesCommand())
+FSCommands.append('FSFillHoles', "command")
  
 
 FSMatchOuter = False
@@ -719,3 +1352,29 @@ class FSMakeBomCommand:
         
 Gui.addCommand('FSMakeBOM',FSMakeBomCommand())
 FSCommands.append('FSMakeBOM', "command")
+
+###################################################################################
+# Cache statistics command
+###################################################################################
+
+class FSCacheStatsCommand:
+  """Show fastener cache statistics"""
+
+  def GetResources(self):
+    icon = os.path.join( iconPath , 'IconCacheStats.svg')
+    return {'Pixmap'  : icon , # the name of a svg file available in the resources
+            'MenuText': "Fastener cache statistics" ,
+            'ToolTip' : "Show hit rate, memory usage and build times of the fastener shape cache"}
+ 
+  def Activated(self):
+    report = FSCache.report()
+    FreeCAD.Console.PrintMessage(report)
+    QtGui.QMessageBox.information(QtGui.qApp.activeWindow(), "Fastener cache statistics", report)
+    return
+   
+  def IsActive(self):
+    return True
+        
+        
+Gui.addCommand('FSCacheStats',FSCacheStatsCommand())
+FSCommands.append('FSCacheStats', "command")
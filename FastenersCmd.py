@@ -33,6 +33,20 @@ from FastenerBase import FSBaseObject
 import ScrewMaker  
 screwMaker = ScrewMaker.Instance()
 
+FSThreadModes = ['simple', 'symbol', 'real']
+
+def FSAddThreadProperty(obj):
+  obj.addProperty("App::PropertyEnumeration", "thread", "Parameters", "Thread generation: simple, cosmetic thread symbol or real thread").thread = FSThreadModes
+
+# for backward compatibility: older documents store the thread as a boolean (real or simple)
+def FSVerifyThreadProperty(obj):
+  if hasattr(obj,'thread') and obj.getTypeIdOfProperty('thread') == 'App::PropertyBool':
+    realThread = obj.thread
+    obj.removeProperty('thread')
+    FSAddThreadProperty(obj)
+    if realThread:
+      obj.thread = 'real'
+
 class FSScrewObject(FSBaseObject):
   def __init__(self, obj, type, attachTo):
     '''"Add screw type fastener" '''
@@ -48,7 +62,7 @@ class FSScrewObject(FSBaseObject):
     if (self.itemText == "Screw"):
       obj.addProperty("App::PropertyEnumeration","length","Parameters","Screw length").length = screwMaker.GetAllLengths(type, diameters[1])
     if (self.itemText != "Washer"):
-      obj.addProperty("App::PropertyBool", "thread", "Parameters", "Generate real thread").thread = False
+      FSAddThreadProperty(obj)
     obj.type = type
     obj.Proxy = self
     
@@ -56,6 +70,12 @@ class FSScrewObject(FSBaseObject):
     if not (hasattr(obj,'matchOuter')):
       obj.addProperty("App::PropertyBool", "matchOuter", "Parameters", "Match outer thread diameter").matchOuter = FastenerBase.FSMatchOuter
  
+  def setResolvedDiameter(self, fp, diam):
+    ''' Set a diameter already matched to the hole, e.g. by FSPrebuildScrews.
+        The next execute uses it instead of matching the hole again '''
+    self.resolvedDiameter = diam
+    fp.diameter = diam
+
   def execute(self, fp):
     '''"Print a short message when doing a recomputation, this method is mandatory" '''
     
@@ -89,8 +109,12 @@ class FSScrewObject(FSBaseObject):
       diameterchange = True      
 
     matchouterchange = not (hasattr(self,'matchOuter')) or self.matchOuter != fp.matchOuter
+    resolved = getattr(self, 'resolvedDiameter', None)
+    self.resolvedDiameter = None
 
-    if fp.diameter == 'Auto' or matchouterchange:
+    if resolved != None and resolved == fp.diameter:
+      d = resolved
+    elif fp.diameter == 'Auto' or matchouterchange:
       d = screwMaker.AutoDiameter(fp.type, shape, baseobj, fp.matchOuter)
       fp.diameter = d
       diameterchange = True      
@@ -110,18 +134,13 @@ class FSScrewObject(FSBaseObject):
     else:
       l = 1
       
-    screwMaker.updateFastenerParameters()  
-      
     threadType = 'simple'
-    if hasattr(fp,'thread') and fp.thread:
-      threadType = 'real'
+    FSVerifyThreadProperty(fp)
+    if hasattr(fp,'thread'):
+      threadType = fp.thread
       
-    (key, s) = FastenerBase.FSGetKey(self.itemText, fp.type, d, l, threadType)
-    if s == None:
-      s = screwMaker.createFastener(fp.type, d, l, threadType, True)
-      FastenerBase.FSCache[key] = s
-    else:
-      FreeCAD.Console.PrintLog("Using cached object\n")
+    (key, s) = screwMaker.createDeferredFastener(fp, fp.type, d, l, threadType)
+    FastenerBase.FSUsage.record(key)
 
     self.type = fp.type
     self.diameter = fp.diameter
@@ -205,21 +224,63 @@ class FSScrewCommand:
             'ToolTip' : self.Help}
  
   def Activated(self):
-    for selObj in FastenerBase.FSGetAttachableSelections():
-      a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython",self.TypeName)
-      FSScrewObject(a, self.Type, selObj)
-      a.Label = a.Proxy.itemText
-      FSViewProviderTree(a.ViewObject)
-    FreeCAD.ActiveDocument.recompute()
+    FastenerBase.FSCreateFasteners(FSScrewFactory(self.Type), FastenerBase.FSGetAttachableSelections())
     return
    
   def IsActive(self):
     return Gui.ActiveDocument != None
 
+def FSPrebuildScrews(objs):
+  ''' Choose the sizes of new screws for all their holes at once and generate
+      every distinct shape once, in worker processes if possible. execute then
+      takes the shapes from the cache '''
+  holes = {}
+  for obj in objs:
+    if obj.diameter != 'Auto':
+      continue
+    try:
+      baseobj = obj.baseObject[0]
+      shape = baseobj.Shape.getElement(obj.baseObject[1][0])
+    except:
+      continue
+    matchOuter = obj.matchOuter or baseobj.Name.startswith("Washer")
+    holes.setdefault((obj.type, matchOuter), []).append((obj, shape))
+  for (type, matchOuter), items in holes.items():
+    diams = screwMaker.AutoDiameters(type, [shape for obj, shape in items], matchOuter)
+    for (obj, shape), d in zip(items, diams):
+      obj.Proxy.setResolvedDiameter(obj, d)
+  specs = []
+  for obj in objs:
+    if obj.diameter == 'Auto':
+      continue
+    l = 1
+    if hasattr(obj,'length'):
+      d, l = screwMaker.FindClosest(obj.type, obj.diameter, obj.length)
+    else:
+      d = obj.diameter
+    threadType = 'simple'
+    if hasattr(obj,'thread'):
+      threadType = obj.thread
+    specs.append((obj.type, d, l, threadType))
+  if len(specs) > 1:
+    screwMaker.createFasteners(specs)
+
+FastenerBase.FSPrebuilders[FSScrewObject] = FSPrebuildScrews
+
+def FSScrewFactory(type):
+  def create(selObj):
+    a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython",screwMaker.GetTypeName(type))
+    FSScrewObject(a, type, selObj)
+    a.Label = a.Proxy.itemText
+    FSViewProviderTree(a.ViewObject)
+    return a
+  return create
+
 def FSAddScrewCommand(type, help, dropGroup = None):
   cmd = 'FS' + type
   Gui.addCommand(cmd,FSScrewCommand(type, help))
   FastenerBase.FSCommands.append(cmd, "screws", dropGroup)
+  FastenerBase.FSRegisterFactory(type, FSScrewFactory(type))
   
 FSAddScrewCommand("ISO4017", "ISO 4017 Hex head screw", "Hex head")
 FSAddScrewCommand("ISO4014", "ISO 4014 Hex head bolt", "Hex head")
@@ -354,7 +415,7 @@ class FSScrewRodObject(FSBaseObject):
     obj.addProperty("App::PropertyEnumeration","diameter","Parameters","Screw diameter standard").diameter = diameters
     obj.addProperty("App::PropertyLength","length","Parameters","Screw length").length = 20.0
     self.VerifyCreateMatchOuter(obj)
-    obj.addProperty("App::PropertyBool", "thread", "Parameters", "Generate real thread").thread = False
+    FSAddThreadProperty(obj)
     obj.Proxy = self
  
   def VerifyCreateMatchOuter(self, obj):
@@ -390,18 +451,13 @@ class FSScrewRodObject(FSBaseObject):
       l = 2.0
       fp.length = 2.0
       
-    screwMaker.updateFastenerParameters()  
-
     threadType = 'simple'
-    if hasattr(fp,'thread') and fp.thread:
-      threadType = 'real'
+    FSVerifyThreadProperty(fp)
+    if hasattr(fp,'thread'):
+      threadType = fp.thread
       
-    (key, s) = FastenerBase.FSGetKey(self.itemText, d, str(l), threadType)
-    if s == None:
-      s = screwMaker.createScrew(self.type, d, str(l), threadType, True)
-      FastenerBase.FSCache[key] = s
-    else:
-      FreeCAD.Console.PrintLog("Using cached object\n")
+    (key, s) = screwMaker.createDeferredFastener(fp, self.type, d, str(l), threadType)
+    FastenerBase.FSUsage.record(key)
 
     self.diameter = fp.diameter
     self.length = l
@@ -69,6 +69,8 @@ class FastenersWorkbench (Workbench):
  
     def Activated(self):
         "This function is executed when the workbench is activated"
+        import ScrewMaker
+        ScrewMaker.FSWarmup.start()
         return
  
     def Deactivated(self):
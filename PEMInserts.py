@@ -92,7 +92,8 @@ def clMakePressNut(diam, code):
   if not(diam in CLSPEMTable):
     return None
   
-  (key, shape) = FastenerBase.FSGetKey('PressNut', diam, code)
+  # press nuts have no length, the size code is kept in the thread field of the key
+  (key, shape) = FastenerBase.FSGetKey('PressNut', 'CLS', diam, thread = code)
   if shape != None:
     return shape
 
@@ -199,6 +200,7 @@ class FSPressnutCommand:
     return Gui.ActiveDocument != None
 
 Gui.addCommand("FSPressNut", FSPressnutCommand())
+FastenerBase.FSRegisterFactory("PEMPressNut", FastenerBase.FSObjectFactory(FSPressNutObject, "PressNut"))
 FastenerBase.FSCommands.append("FSPressNut", "screws", "PEM Inserts")
 
 
@@ -302,7 +304,7 @@ def soMakeStandOff(diam, len, blind):
   if not(diam in SOPEMTable):
     return None
 
-  (key, shape) = FastenerBase.FSGetKey('StandOff', diam, len, blind)
+  (key, shape) = FastenerBase.FSGetKey('StandOff', 'BSO' if blind else 'SO', diam, len)
   if shape != None:
     return shape
   
@@ -434,6 +436,7 @@ class FSStandOffCommand:
     return Gui.ActiveDocument != None
 
 Gui.addCommand("FSStandOff", FSStandOffCommand())
+FastenerBase.FSRegisterFactory("PEMStandoff", FastenerBase.FSObjectFactory(FSStandOffObject, "Standoff"))
 FastenerBase.FSCommands.append("FSStandOff", "screws", "PEM Inserts")
 
 ###################################################################################
@@ -487,7 +490,7 @@ def fhMakeStud(diam, len):
   if not(diam in FHPEMTable):
     return None
 
-  (key, shape) = FastenerBase.FSGetKey('Stud', diam, len)
+  (key, shape) = FastenerBase.FSGetKey('Stud', 'FH', diam, len)
   if shape != None:
     return shape
   
@@ -602,6 +605,7 @@ class FSStudCommand:
     return Gui.ActiveDocument != None
 
 Gui.addCommand("FSStud", FSStudCommand())
+FastenerBase.FSRegisterFactory("PEMStud", FastenerBase.FSObjectFactory(FSStudObject, "Stud"))
 FastenerBase.FSCommands.append("FSStud", "screws", "PEM Inserts")
 
 ## add fastener types
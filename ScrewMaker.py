@@ -2,10 +2,11 @@
 
 # A Wrapper to Ulrich's screw_maker macro
 
-import FreeCAD, FreeCADGui, Part, math
+import FreeCAD, FreeCADGui, Part, math, os, json, subprocess, tempfile, multiprocessing, time
 from FreeCAD import Base
 import DraftVecUtils
 import FastenerBase
+import FSCatalog
 
 from PySide import QtCore, QtGui
 from screw_maker import *
@@ -67,124 +68,92 @@ def FSCGetInnerThread(diam):
   return FSCScrewHoleChartDict[diam]
 
 
-screwTables = {
-    #            name,    def table,   length table,  range table,  diam pos*, K pos**
-    'ISO4017':  ("Screw",  iso4017head,  iso4017length,  iso4017range,  -1, 0),
-    'ISO4014':  ("Screw",  iso4014head,  iso4014length,  iso4014range,  -1, 0),
-    'EN1662':   ("Screw",  en1662def,    en1662length,   en1662range,   -1, 0),            
-    'EN1665':   ("Screw",  en1665def,    en1665length,   en1665range,   -1, 0),
-    'ISO2009':  ("Screw",  iso2009def,   iso2009length,  iso2009range,  4, 5),
-    'ISO2010':  ("Screw",  iso2009def,   iso2009length,  iso2009range,  4, 5),
-    'ISO4762':  ("Screw",  iso4762def,   iso4762length,  iso4762range,  -1, 0),
-    'ISO10642': ("Screw",  iso10642def,  iso10642length, iso10642range, 3, 7),
-    'ISO1207':  ("Screw",  iso1207def,   iso1207length,  iso1207range,  -1, 0),
-    'ISO1580':  ("Screw",  iso1580def,   iso2009length,  iso2009range,  -1, 0),
-    'ISO7045':  ("Screw",  iso7045def,   iso7045length,  iso7045range,  -1, 0),
-    'ISO7046':  ("Screw",  iso2009def,   iso7045length,  iso7046range,  4, 5),
-    'ISO7047':  ("Screw",  iso2009def,   iso7045length,  iso7046range,  4, 5),
-    'ISO7048':  ("Screw",  iso7048def,   iso7048length,  iso7048range,  -1, 0),
-    'DIN967':   ("Screw",  din967def,    din967length,   din967range,   -1, 0),
-    #'ISO7380':  ("Screw", iso7380def, iso7380length, iso7380range, -1),
-    'ISO7380-1':("Screw",  iso7380def,   iso7380length,  iso7380range,  -1, 0),
-    'ISO7380-2':("Screw",  iso7380_2def, iso7380length,  iso7380range,  -1, 0),
-    'ISO14579': ("Screw",  iso14579def,  iso14579length, iso14579range, -1, 0),
-    'ISO14580': ("Screw",  iso14580def,  iso14580length, iso1207range,  -1, 0),
-    'ISO14582': ("Screw",  iso14582def,  iso14582length, iso14582range, 4, 5),
-    'ISO14583': ("Screw",  iso14583def,  iso7045length,  iso7046range,  -1, 0),
-    'ISO14584': ("Screw",  iso14584def,  iso7045length, iso14584range,  3, 5),
-    'DIN7984':  ("Screw",  din7984def,   din7984length, din7984range, -1, 0),
-    'ISO7089':  ("Washer", iso7089def,   None,          None,           -1, 0),
-    'ISO7090':  ("Washer", iso7090def,   None,          None,           -1, 0),
-    #'ISO7091':  ("Washer", iso7091def,   None,          None,           -1, 0), # same as 7089 ??
-    'ISO7092':  ("Washer", iso7092def,   None,          None,           -1, 0),
-    'ISO7093-1':("Washer", iso7093def,   None,          None,           -1, 0),
-    'ISO7094':  ("Washer", iso7094def,   None,          None,           -1, 0),
-    'ISO4032':  ("Nut",    iso4032def,   None,          None,           -1, 0),
-    'ISO4033':  ("Nut",    iso4033def,   None,          None,           -1, 0),
-    'ISO4035':  ("Nut",    iso4035def,   None,          None,           -1, 0),
-    #'ISO4036':  ("Nut",    iso4036def,   None,          None,           -1),
-    'EN1661':   ("Nut",    en1661def,    None,          None,           -1, 0),
-    'DIN557':   ("Nut",    din557def,    None,          None,           -1, 0),
-    'DIN562':   ("Nut",    din562def,    None,          None,           -1, 0),
-    'DIN985':   ("Nut",    din985def,    None,          None,           -1, 0),
-    'ScrewTap': ("ScrewTap", tuningTable, None,         None,           -1, 0),
-    
-    # * diam pos = the position within the def table to be used for auto diameter selection, -1 = get size from Mxx
-    # * K Pos = the position within the def table to be used for countersunk holes creation
-}
+# the square and nyloc nuts are generated by FSNuts
+def FSBuildNut(screw, type, diam, l):
+  return FSNuts.createNut(type, diam)
+
+registerCatalogStandard('DIN557', FSBuildNut)
+registerCatalogStandard('DIN562', FSBuildNut)
+registerCatalogStandard('DIN985', FSBuildNut)
+
+def FSScrewTableEntry(type):
+  std = ScrewStandards[type]
+  return (std.kind, std.table, std.lengths, std.ranges, std.diamPos, std.kPos)
+
+# fastener types of the workbench, taken from the screw_maker registry:
+#   name, def table, length table, range table, diam pos*, K pos**
+# * diam pos = the position within the def table to be used for auto diameter selection, -1 = get size from Mxx
+# * K Pos = the position within the def table to be used for countersunk holes creation
+screwTables = {}
+for item in FSCatalog.types():
+  screwTables[item] = FSScrewTableEntry(item)
+
+def FSRegisterScrewStandard(type, kind, table, lengths, ranges, builder, diamPos = -1, kPos = 0):
+  ''' Add a fastener standard to the workbench, e.g. from a plugin module.
+      See screw_maker.registerScrewStandard for the parameters. A toolbar
+      command can be added with FastenersCmd.FSAddScrewCommand '''
+  registerScrewStandard(type, kind, table, lengths, ranges, builder, diamPos, kPos)
+  screwTables[type] = FSScrewTableEntry(type)
+  FSTypeIndexes.pop(type, None)
+  for mode in ('head', 'outer', 'inner'):
+    FastenerBase.FSSizeArrays.pop((type, mode), None)
+  FastenerBase.FSAddItemsToType(kind, type)
+
+# built on first use of a fastener type
+FSTypeIndexes = {}
+def FSGetTypeIndex(type):
+  if not(type in FSTypeIndexes):
+    name, diam_table, len_table, range_table, table_pos, k_pos = screwTables[type]
+    FSTypeIndexes[type] = FSCatalog.FSSizeIndex(diam_table, len_table, range_table)
+  return FSTypeIndexes[type]
 
 FSNutsList = ['DIN562', 'DIN557', 'DIN985']
 
+FastenerBase.FSRegisterPartCache('Thread part', ThreadCache)
+FastenerBase.FSRegisterPartCache('Tool', ToolCache)
+FastenerBase.FSRegisterPartCache('Head recess', HeadCache)
+
+class FSParamObserver:
+  '''Flags the screw maker when fastener preferences change'''
+  def __init__(self, screwMaker):
+    self.screwMaker = screwMaker
+
+  def OnChange(self, grp, name):
+    self.screwMaker.paramsChanged = True
+
 class FSScrewMaker(Screw):
     def FindClosest(self, type, diam, len):
       ''' Find closest standard screw to given parameters '''        
       if not (type in screwTables):
         return (diam, len)
-      name, diam_table, len_table, range_table, table_pos, k_pos = screwTables[type]
-      
-      # auto find diameter
-      if not (diam in diam_table):
-        origdia = FastenerBase.MToFloat(diam)
-        mindif = 100.0
-        for m in diam_table:
-          diff = abs(FastenerBase.MToFloat(m) - origdia)
-          if (diff < mindif):
-            mindif = diff
-            diam = m
-
-      # auto find length
-      if (len_table != None) and not (len in len_table):
-        origlen = float(len)
-        mindif = 100.0
-        for l in len_table:
-          diff = abs(float(l) - origlen)
-          if (diff < mindif):
-            mindif = diff
-            len = l
-              
-      # make sure length in range
-      if range_table != None:
-        minl , maxl = range_table[diam]
-        if float(len) < float(minl):
-          len = minl
-        if float(len) > float(maxl):
-          len = maxl
-        
-      return (diam, len)
+      return FSGetTypeIndex(type).closest(diam, len)
         
         
     def AutoDiameter(self, type, holeObj, baseobj = None, matchOuter = FastenerBase.FSMatchOuter):
       ''' Calculate screw diameter automatically based on given hole '''
-      res = 'M6'
       #matchOuter = FastenerBase.FSMatchOuter
       if baseobj != None and baseobj.Name.startswith("Washer"):
         matchOuter = True
-      if holeObj != None and hasattr(holeObj, 'Curve') and hasattr(holeObj.Curve, 'Radius') and (type in screwTables):
-        d = holeObj.Curve.Radius * 2
-        table = screwTables[type][1]
-        tablepos = screwTables[type][4]
-        mindif = 10.0
-        dif = mindif
-        for m in table:
-            #FreeCAD.Console.PrintLog("Test M:" + m + "\n")
-            if (tablepos == -1):
-              if matchOuter:
-                dia = FastenerBase.MToFloat(m) - 0.01
-                if (d > dia):
-                  dif = d - dia
-              else:
-                dia = FSCGetInnerThread(m)
-                dif = math.fabs(dia - d)
-              
-            else:
-              dia = table[m][tablepos]
-              if (d > dia):
-                dif = d - dia
-            if dif < mindif:
-              mindif = dif
-              res = m
-      return res
-    
+      return self.AutoDiameters(type, [holeObj], matchOuter)[0]
+
+    def AutoDiameters(self, type, holeObjs, matchOuter = FastenerBase.FSMatchOuter):
+      ''' Calculate screw diameters for a list of hole edges or radii at once '''
+      if not(type in screwTables):
+        return ['M6'] * len(holeObjs)
+      table = screwTables[type][1]
+      tablepos = screwTables[type][4]
+      if tablepos != -1:
+        # largest head smaller than the hole
+        sizes = FastenerBase.FSGetSizeArrays((type, 'head'), table, lambda m: table[m][tablepos])
+        mode = 'below'
+      elif matchOuter:
+        sizes = FastenerBase.FSGetSizeArrays((type, 'outer'), table, lambda m: FastenerBase.MToFloat(m) - 0.01)
+        mode = 'below'
+      else:
+        sizes = FastenerBase.FSGetSizeArrays((type, 'inner'), table, FSCGetInnerThread)
+        mode = 'nearest'
+      return FastenerBase.FSMatchSizes(sizes, FastenerBase.FSHoleDiameters(holeObjs), mode, 10.0, 'M6')
+
     def GetAllTypes(self, typeName):
       list = []
       for key in screwTables:
@@ -200,20 +169,10 @@ class FSScrewMaker(Screw):
     
     def GetAllDiams(self, type):
       FreeCAD.Console.PrintLog("Get diams for type:" + str(type) + "\n")
-      return sorted(screwTables[type][1], key = FastenerBase.MToFloat)
+      return list(FSGetTypeIndex(type).diams)
 
     def GetAllLengths(self, type, diam):
-      lens = screwTables[type][2]
-      range = screwTables[type][3][diam]
-      list = []
-      min = float(range[0])
-      max = float(range[1])
-      for len in lens:
-        l = float(len)
-        if l >= min and l <= max:
-          list.append(len)
-      list.sort(key = FastenerBase.MToFloat)
-      return list
+      return FSGetTypeIndex(type).lengths(diam)
 
     def GetAllCountersunkTypes(self):
       list = []
@@ -244,9 +203,17 @@ class FSScrewMaker(Screw):
         return (0,0)
       return (table[diam][dpos], table[diam][kpos])
       
+    def __init__(self):
+      Screw.__init__(self)
+      # re-read the thread parameters only after they have been changed
+      self.paramsChanged = True
+      self.paramObserver = FSParamObserver(self)
+      FSParam.Attach(self.paramObserver)
+
     def updateFastenerParameters(self):
-      global FSParam
-      oldState = str(self.sm3DPrintMode) + str(self.smNutThrScaleA) + str(self.smNutThrScaleB) + str(self.smScrewThrScaleA) + str(self.smScrewThrScaleB)
+      if not self.paramsChanged:
+        return
+      self.paramsChanged = False
       self.sm3DPrintMode = False
       threadMode = FSParam.GetInt("ScrewToolbarThreadGeneration", 0) # 0 = standard, 1 = 3dprint
       if threadMode == 1:
@@ -255,15 +222,83 @@ class FSScrewMaker(Screw):
       self.smNutThrScaleB = FSParam.GetFloat("NutThrScaleB", 0.1)
       self.smScrewThrScaleA = FSParam.GetFloat("ScrewThrScaleA", 0.99)
       self.smScrewThrScaleB = FSParam.GetFloat("ScrewThrScaleB", -0.05)
-      newState = str(self.sm3DPrintMode) + str(self.smNutThrScaleA) + str(self.smNutThrScaleB) + str(self.smScrewThrScaleA) + str(self.smScrewThrScaleB)
-      if (oldState != newState):
-        FastenerBase.FSCacheRemoveThreaded() # thread parameters have changed, remove cached ones    
+      self.smThreadEngine = 'sweep'
+      if FSParam.GetInt("ThreadEngine", 0) == 1:
+        self.smThreadEngine = 'ruled'
+      partCacheEntries = FSParam.GetInt("PartCacheEntries", 500)
+      ThreadCache.setLimit(partCacheEntries)
+      ToolCache.setLimit(partCacheEntries)
+      HeadCache.setLimit(partCacheEntries)
+
+    def GetScalingFingerprint(self):
+      ''' Part of the cache key that depends on the generator settings: 3D print
+          thread scaling and the thread engine. See Screw.applySettings '''
+      fingerprint = ()
+      if self.sm3DPrintMode:
+        fingerprint = (self.smScrewThrScaleA, self.smScrewThrScaleB, self.smNutThrScaleA, self.smNutThrScaleB)
+      if self.smThreadEngine != 'sweep':
+        fingerprint += (self.smThreadEngine,)
+      if len(fingerprint) == 0:
+        return None
+      return fingerprint
 
     def createFastener(self, type, diam, len, threadType, shapeOnly = False):
       if type in FSNutsList :
         return FSNuts.createNut(type, diam)
       return self.createScrew(type, diam, len, threadType, shapeOnly)
 
+    def createCachedFastener(self, type, diam, len, threadType):
+      ''' Get a fastener shape from the cache, generate it if not found '''
+      self.updateFastenerParameters()
+      (key, s) = FastenerBase.FSGetKey(self.GetTypeName(type), type, diam, len, threadType, self.GetScalingFingerprint())
+      if s == None:
+        s = self.createFastener(type, diam, len, threadType, True)
+        FastenerBase.FSCache[key] = s
+      return (key, s)
+
+    def createDeferredFastener(self, obj, type, diam, len, threadType):
+      ''' Like createCachedFastener, but missing real threads are generated in the
+          background. Until then the simple shape is returned '''
+      if threadType != 'real' or not FSBackground.isEnabled():
+        FSBackground.cancel(obj)
+        return self.createCachedFastener(type, diam, len, threadType)
+      self.updateFastenerParameters()
+      (key, s) = FastenerBase.FSGetKey(self.GetTypeName(type), type, diam, len, threadType, self.GetScalingFingerprint())
+      if s != None:
+        FSBackground.cancel(obj)
+        return (key, s)
+      FSBackground.request(obj, key, self.Tuner)
+      return (key, self.createCachedFastener(type, diam, len, 'simple')[1])
+
+    def createFasteners(self, specs):
+      ''' Generate many fasteners at once. specs is a list of (type, diam, len, threadType).
+          Identical specs are generated once, screws missing from the cache are
+          built in parallel by FreeCADCmd worker processes. Returns a list of
+          (key, shape) in the order of specs '''
+      self.updateFastenerParameters()
+      keys = []
+      shapes = {}
+      remote = []
+      for type, diam, length, threadType in specs:
+        key = FastenerBase.FSKey(self.GetTypeName(type), type, diam, length, threadType, self.GetScalingFingerprint())
+        keys.append(key)
+        if key in shapes:
+          continue
+        shapes[key] = FastenerBase.FSGetKey(*key)[1]
+        if shapes[key] == None and not(type in FSNutsList) and FSGetWorkerExecutable() != '':
+          remote.append(key)
+      if len(remote) > 1:
+        FreeCAD.Console.PrintLog("Generating " + str(len(remote)) + " fasteners in worker processes\n")
+        results = FSBuildInWorkers(remote, self.Tuner)
+        for key in results:
+          FastenerBase.FSCache[key] = results[key]
+          shapes[key] = results[key]
+      # nuts, single shapes and failed workers are generated here
+      for key in shapes:
+        if shapes[key] == None:
+          shapes[key] = self.createCachedFastener(key.standard, key.diameter, key.length, key.thread)[1]
+      return [(key, shapes[key]) for key in keys]
+
 
 ScrewMakerInstance = None      
 def Instance():
@@ -271,3 +306,361 @@ def Instance():
   if ScrewMakerInstance == None:
     ScrewMakerInstance = FSScrewMaker()
   return ScrewMakerInstance
+
+# parse the warm-up list from the preferences. entries are separated by ';'
+# and have the form: "ISO4762 M6x20 real", "ISO4032 M6", "ScrewTap M5x12 symbol"
+def FSParseWarmupList(text):
+  screwMaker = Instance()
+  keys = []
+  for entry in text.replace('\n', ';').split(';'):
+    tokens = entry.split()
+    if len(tokens) < 2 or not(tokens[0] in screwTables):
+      continue
+    type = tokens[0]
+    diam = tokens[1]
+    length = None
+    if 'x' in diam:
+      diam, length = diam.rsplit('x', 1)
+    if not(diam in screwTables[type][1]):
+      FreeCAD.Console.PrintWarning("Fastener warm-up: unknown size " + entry + "\n")
+      continue
+    typeName = screwMaker.GetTypeName(type)
+    threadType = 'simple'
+    for mode in ('real', 'symbol'):
+      if mode in tokens[2:] and typeName != 'Washer':
+        threadType = mode
+    if typeName == 'Screw':
+      diam, length = screwMaker.FindClosest(type, diam, length or '0')
+    elif typeName == 'ScrewTap':
+      length = str(max(float(length or 10), 2.0))
+    else:
+      length = 1
+    keys.append(FastenerBase.FSKey(typeName, type, diam, length, threadType, screwMaker.GetScalingFingerprint()))
+  return keys
+
+# pre-generate frequently used fasteners after workbench activation. shapes are
+# created one at a time from the event loop so the gui stays responsive. real
+# threads take too long for that, they are handed to the background workers and
+# skipped if there is no worker executable
+class FSCacheWarmup:
+  def __init__(self):
+    self.keys = []
+    self.started = False
+
+  def start(self):
+    if self.started or not FSParam.GetBool("WarmupEnabled", False):
+      return
+    self.started = True
+    Instance().updateFastenerParameters()
+    keys = FSParseWarmupList(FSParam.GetString("WarmupList", ""))
+    for key in FastenerBase.FSUsage.mostUsed(FSParam.GetInt("WarmupCount", 30)):
+      if key.standard in screwTables and not(key in keys):
+        keys.append(key)
+    self.keys = keys
+    FreeCAD.Console.PrintLog("Fastener cache warm-up: " + str(len(keys)) + " shapes\n")
+    QtCore.QTimer.singleShot(0, self.step)
+
+  def step(self):
+    if len(self.keys) == 0:
+      return
+    key = self.keys.pop(0)
+    if key.thread == 'real' and not(key in FastenerBase.FSCache):
+      if FSGetWorkerExecutable() != '':
+        FSBackground.prefetch(key, Instance().Tuner)
+      else:
+        FreeCAD.Console.PrintLog("Fastener warm-up skips real thread without worker: " + FastenerBase.FSKeyText(key) + "\n")
+    elif not(key in FastenerBase.FSCache):
+      try:
+        Instance().createCachedFastener(key.standard, key.diameter, key.length, key.thread)
+      except Exception:
+        FreeCAD.Console.PrintWarning("Fastener warm-up failed for: " + FastenerBase.FSKeyText(key) + "\n")
+    QtCore.QTimer.singleShot(0, self.step)
+
+FSWarmup = FSCacheWarmup()
+
+# locate the console executable used for background generation
+FSWorkerExecutable = None
+def FSGetWorkerExecutable():
+  global FSWorkerExecutable
+  if FSWorkerExecutable == None:
+    FSWorkerExecutable = ''
+    bindir = os.path.join(FreeCAD.getHomePath(), 'bin')
+    for name in ('FreeCADCmd', 'freecadcmd', 'FreeCADCmd.exe'):
+      if os.path.isfile(os.path.join(bindir, name)):
+        FSWorkerExecutable = os.path.join(bindir, name)
+        break
+  return FSWorkerExecutable
+
+def FSGetWorkerCount():
+  workers = FSParam.GetInt("AsyncWorkers", 0)
+  if workers <= 0:
+    workers = max(multiprocessing.cpu_count() - 1, 1)
+  return workers
+
+# start FSWorker.py in FreeCADCmd to generate the fasteners of the given cache
+# keys. returns the process, the brep file name for each key and the file
+# collecting the error output of the worker
+def FSStartWorker(keys, tuner):
+  path = os.path.dirname(os.path.abspath(__file__))
+  items = []
+  for key in keys:
+    fd, outname = tempfile.mkstemp('.brep')
+    os.close(fd)
+    items.append({'type': key.standard, 'diam': key.diameter, 'len': str(key.length),
+        'thread': key.thread, 'scaling': key.scaling, 'out': outname})
+  env = dict(os.environ)
+  env['FSWORKER_SPEC'] = json.dumps({'path': path, 'tuner': tuner, 'items': items})
+  outnames = [item['out'] for item in items]
+  fd, errname = tempfile.mkstemp('.log')
+  os.close(fd)
+  try:
+    devnull = open(os.devnull, 'w')
+    errfile = open(errname, 'w')
+    try:
+      proc = subprocess.Popen([FSGetWorkerExecutable(), os.path.join(path, 'FSWorker.py')], env = env,
+          stdin = subprocess.PIPE, stdout = devnull, stderr = errfile)
+      proc.stdin.close()
+    finally:
+      devnull.close()
+      errfile.close()
+  except Exception as e:
+    FreeCAD.Console.PrintWarning("Can not start fastener worker: " + str(e) + "\n")
+    for outname in outnames:
+      FSRemoveFile(outname)
+    FSRemoveFile(errname)
+    return None
+  return (proc, outnames, errname)
+
+# read and remove a shape written by a worker. returns None if the worker failed
+def FSReadWorkerShape(outname):
+  shape = None
+  try:
+    if os.path.getsize(outname) > 0:
+      shape = Part.Shape()
+      shape.importBrep(outname)
+      if shape.isNull():
+        shape = None
+  except Exception:
+    shape = None
+  FSRemoveFile(outname)
+  return shape
+
+def FSRemoveFile(name):
+  try:
+    os.remove(name)
+  except OSError:
+    pass
+
+# read and remove the error output of a worker
+def FSReadWorkerErrors(errname):
+  try:
+    with open(errname, 'r') as f:
+      text = f.read().strip()
+  except Exception:
+    text = ''
+  FSRemoveFile(errname)
+  return text
+
+def FSReportWorkerError(message, keys, errors):
+  text = message + ', '.join([FastenerBase.FSKeyText(key) for key in keys]) + "\n"
+  if errors != '':
+    text += errors + "\n"
+  FreeCAD.Console.PrintError(text)
+
+def FSKillWorker(proc, outnames, errname):
+  try:
+    proc.kill()
+    proc.wait()
+  except Exception:
+    pass
+  for outname in outnames:
+    FSRemoveFile(outname)
+  return FSReadWorkerErrors(errname)
+
+# generate the shapes of the given keys with a pool of worker processes and wait
+# for them. each worker builds a few fasteners to spread the FreeCADCmd startup
+# time. a worker taking longer than the timeout per fastener is killed. in the
+# gui a progress dialog keeps the event loop running, cancelling it kills all
+# workers and raises FastenerBase.FSCancelled. returns a dictionary of the
+# generated shapes, failed keys are missing
+def FSBuildInWorkers(keys, tuner):
+  results = {}
+  if len(keys) == 0:
+    return results
+  workers = FSGetWorkerCount()
+  timeout = FSParam.GetInt("WorkerTimeout", 60)
+  chunk = max(1, min(8, int(math.ceil(len(keys) / float(2 * workers)))))
+  pending = [keys[i:i + chunk] for i in range(0, len(keys), chunk)]
+  running = []
+  progress = None
+  if FreeCAD.GuiUp:
+    progress = QtGui.QProgressDialog("Generating fasteners...", "Cancel", 0, len(keys), FreeCADGui.getMainWindow())
+    progress.setWindowModality(QtCore.Qt.WindowModal)
+    progress.setMinimumDuration(500)
+  done = 0
+  try:
+    while len(pending) > 0 or len(running) > 0:
+      while len(running) < workers and len(pending) > 0:
+        batch = pending.pop(0)
+        job = FSStartWorker(batch, tuner)
+        if job != None:
+          running.append((batch, job, time.time()))
+      for item in list(running):
+        batch, (proc, outnames, errname), started = item
+        if proc.poll() == None:
+          if timeout > 0 and time.time() - started > timeout * len(batch):
+            running.remove(item)
+            done += len(batch)
+            errors = FSKillWorker(proc, outnames, errname)
+            FSReportWorkerError("Fastener worker timed out for: ", batch, errors)
+          continue
+        running.remove(item)
+        done += len(batch)
+        failed = []
+        for key, outname in zip(batch, outnames):
+          shape = FSReadWorkerShape(outname)
+          if shape != None:
+            results[key] = shape
+          else:
+            failed.append(key)
+        errors = FSReadWorkerErrors(errname)
+        if len(failed) > 0:
+          FSReportWorkerError("Fastener worker failed for: ", failed, errors)
+      if progress != None:
+        progress.setValue(done)
+        QtGui.QApplication.processEvents()
+        if progress.wasCanceled():
+          raise FastenerBase.FSCancelled("Fastener generation cancelled")
+      time.sleep(0.05)
+  finally:
+    for batch, (proc, outnames, errname), started in running:
+      FSKillWorker(proc, outnames, errname)
+    if progress != None:
+      progress.close()
+  return results
+
+# generate real threads with FreeCADCmd running FSWorker.py. objects get the simple
+# shape first. when the real shape is ready it is stored in the shape cache and the
+# objects waiting for it are recomputed. jobs of objects whose parameters changed
+# in the meantime are cancelled
+class FSBackgroundBuilder:
+  def __init__(self):
+    self.jobs = {}      # key -> running process, output and error file, None while queued
+    self.queue = []     # keys waiting for a free worker
+    self.owners = {}    # (document, object) name -> key of the shape it waits for
+    self.timer = None
+    self.finished = 0
+
+  def isEnabled(self):
+    return FreeCAD.GuiUp and FSParam.GetBool("AsyncRealThread", False) and FSGetWorkerExecutable() != ''
+
+  def request(self, obj, key, tuner):
+    owner = (obj.Document.Name, obj.Name)
+    old = self.owners.get(owner)
+    if old == key:
+      return
+    self.owners[owner] = key
+    if old != None:
+      self.release(old)
+    if not(key in self.jobs):
+      self.jobs[key] = None
+      self.queue.append((key, tuner))
+    self.schedule()
+
+  # generate a shape for the cache only, without an object waiting for it
+  def prefetch(self, key, tuner):
+    if key in self.jobs:
+      return
+    self.jobs[key] = None
+    self.queue.append((key, tuner))
+    self.schedule()
+
+  def cancel(self, obj):
+    owner = (obj.Document.Name, obj.Name)
+    if owner in self.owners:
+      self.release(self.owners.pop(owner))
+      self.showProgress()
+
+  # stop generating a shape nobody waits for anymore
+  def release(self, key):
+    if key in self.owners.values() or not(key in self.jobs):
+      return
+    job = self.jobs.pop(key)
+    self.queue = [q for q in self.queue if q[0] != key]
+    if job != None:
+      proc, outname, errname = job
+      FSKillWorker(proc, [outname], errname)
+
+  def schedule(self):
+    running = len(self.jobs) - len(self.queue)
+    while running < FSGetWorkerCount() and len(self.queue) > 0:
+      key, tuner = self.queue.pop(0)
+      job = FSStartWorker([key], tuner)
+      if job == None:
+        del self.jobs[key]
+        self.dropOwners(key)
+      else:
+        proc, outnames, errname = job
+        self.jobs[key] = (proc, outnames[0], errname)
+        FreeCAD.Console.PrintLog("Fastener worker started for: " + FastenerBase.FSKeyText(key) + "\n")
+        running += 1
+    if self.timer == None:
+      self.timer = QtCore.QTimer()
+      self.timer.timeout.connect(self.poll)
+    if len(self.jobs) > 0 and not self.timer.isActive():
+      self.timer.start(200)
+    self.showProgress()
+
+  def poll(self):
+    for key in list(self.jobs.keys()):
+      job = self.jobs[key]
+      if job == None or job[0].poll() == None:
+        continue
+      proc, outname, errname = job
+      del self.jobs[key]
+      shape = FSReadWorkerShape(outname)
+      errors = FSReadWorkerErrors(errname)
+      if shape == None:
+        FSReportWorkerError("Fastener worker failed for: ", [key], errors)
+        self.dropOwners(key)
+        continue
+      self.finished += 1
+      FastenerBase.FSCache[key] = shape
+      self.updateOwners(key)
+    if len(self.jobs) == 0:
+      self.timer.stop()
+    self.schedule()
+
+  def dropOwners(self, key):
+    for owner in [o for o in self.owners if self.owners[o] == key]:
+      del self.owners[owner]
+
+  # recompute the objects using the new shape, they will find it in the cache
+  def updateOwners(self, key):
+    docs = []
+    for owner in [o for o in self.owners if self.owners[o] == key]:
+      del self.owners[owner]
+      try:
+        doc = FreeCAD.getDocument(owner[0])
+      except Exception:
+        continue
+      obj = doc.getObject(owner[1])
+      if obj == None:
+        continue
+      obj.touch()
+      if not(doc in docs):
+        docs.append(doc)
+    for doc in docs:
+      doc.recompute()
+
+  def showProgress(self):
+    mw = FreeCADGui.getMainWindow()
+    if mw == None:
+      return
+    if len(self.jobs) > 0:
+      mw.statusBar().showMessage("Fasteners: generating real threads, " + str(self.finished) + " done, " + str(len(self.jobs)) + " remaining")
+    elif self.finished > 0:
+      mw.statusBar().showMessage("Fasteners: " + str(self.finished) + " real threads generated", 5000)
+      self.finished = 0
+
+FSBackground = FSBackgroundBuilder()
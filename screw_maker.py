@@ -85,9 +85,10 @@ __author__ = "Ulrich Brammer <ulrich1a@users.sourceforge.net>"
 
 
 
-import FreeCAD, FreeCADGui, Part, math
+import FreeCAD, FreeCADGui, Part, math, os, json, collections
 from FreeCAD import Base
 import DraftVecUtils
+from FSCatalog import FSGetCatalogTable, FSGetCatalogStandards
 
 try:
   from PySide import QtCore, QtGui
@@ -110,685 +111,142 @@ DEBUG = False # set to True to show debug messages; does not work, still todo.
 # Diameters included in this library/macro
 # some ISO-standards may include more diameters!
 # Dictionary used for user messages
-standard_diameters = {
-  'ISO4017': ('M1.6', 'M64'), # ISO 4017 Hex-head-screw
-  'ISO4014': ('M1.6', 'M64'), # ISO 4014 Hex-head-bolt
-  'EN1662':  ('M5',   'M16'), # EN 1662 Hexagon bolts with flange, small series
-  'EN1665':  ('M5',   'M20'), # EN 1665 Hexagon bolts with flange, heavy series
-  'ISO4762': ('M1.6', 'M64'), # ISO 4762 Hexagon socket head cap screws
-  'DIN7984': ('M3',   'M24'), # DIN 7984 Hexagon socket head cap screws with low head
-  'ISO2009': ('M1.6', 'M10'), # ISO 2009 Slotted countersunk flat head screws
-  'ISO2010': ('M1.6', 'M10'), # ISO 2010 Slotted raised countersunk head screws
-  'ISO1580': ('M1.6', 'M10'), # ISO 1580 Slotted pan head screws
-  'ISO7045': ('M1.6', 'M10'), # ISO 7045 Pan head screws type H cross recess
-  'ISO7046': ('M1.6', 'M10'),
-  'ISO7047': ('M1.6', 'M10'),
-  'ISO1207': ('M3',   'M10'), # ISO 1207 Slotted cheese head screws
-  'ISO7048': ('M2.5', 'M8'),  # ISO 7048 Cross-recessed cheese head screws with type H cross recess
-  'ISO7380-1':('M3',  'M16'), # ISO 7380 Hexagon socket button head screws
-  'ISO7380-2':('M3',  'M16'), # ISO 7380 Hexagon socket button head screws with collar
-  'DIN967'  :('M3',   'M8'),  # DIN 967 Cross recessed pan head screws with collar
-  'ISO10642':('M3',   'M20'), # ISO 10642 Hexagon socket countersunk head screws
-  'ISO14579':('M2',   'M20'), # ISO 14579 Hexalobular socket head cap screws
-  'ISO14580':('M2',   'M10'), # ISO 14580 Hexalobular socket cheese head screws
-  'ISO14581':('M2',   'M10'), # ISO 14581 Hexalobular socket countersunk flat head screws (to do!!)
-  'ISO14582':('M3',   'M10'), # ISO 14582 Hexalobular socket countersunk head screws, high head
-  'ISO14583':('M2',   'M10'), # ISO 14583 Hexalobular socket pan head screws
-  'ISO14584':('M2',   'M10'), # ISO 14584 Hexalobular socket raised countersunk head screws
-  'ISO7089': ('M1.6', 'M64'), # Washer
-  'ISO7090': ('M5',   'M64'), # ISO 7090 definitions Plain washers, chamfered - Normal series
-  'ISO7091': ('M1.6', 'M64'), # ISO 7091 definitions  Plain washer - Normal series Product Grade C
-  'ISO7092': ('M1.6', 'M36'), # ISO 7092 definitions  Plain washers - Small series
-  'ISO7093-1': ('M3', 'M36'), # ISO 7093-1 Plain washer - Large series
-  'ISO7094': ('M5',   'M36'), # ISO 7094 definitions  Plain washers - Extra large series
-  'ISO4032': ('M1.6', 'M64'), # ISO 4032 Hexagon nuts, Style 1
-  'ISO4033': ('M5',   'M36'), # ISO 4033 Hexagon nuts, Style 2
-  'ISO4035': ('M1.6', 'M64'), # ISO 4035 Hexagon thin nuts, chamfered
-  'ISO4036': ('M1.6', 'M10'), # ISO 4035 Hexagon thin nuts, unchamfered, todo no function coded
-  'EN1661':  ('M5',   'M20')} # EN 1661 Hexagon nuts with flange
+standard_diameters = FSGetCatalogTable('standard_diameters')
 
 # ISO 4017 Hex-head-screw
 #           P,    c,  dw,    e,     k,   r,   s
-iso4017head={
-  'M1.6':  (0.35, 0.2, 2.9,  3.4,   1.1, 0.1,  3.2),
-  'M2':    (0.40, 0.2, 3.7,  4.4,   1.4, 0.1,  4.0),
-  'M2.5':  (0.45, 0.2, 4.6,  5.5,   1.7, 0.1,  5.0),
-  'M3':    (0.5,  0.2, 5.2,  6.1,   2.0, 0.1,  5.5),
-  '(M3.5)':(0.6,  0.2, 5.2,  6.6,   2.4, 0.1,  5.5),
-  'M4':    (0.7,  0.2, 6.6,  7.7,   2.8, 0.2,  7.0),
-  'M5':    (0.8,  0.2, 7.5,  8.9,   3.5, 0.2,  8.0),
-  'M6':    (1.0,  0.2, 9.5,  11.05, 4.0, 0.25, 10.0),
-  'M8':    (1.25, 0.3, 11.7, 14.5,  5.3, 0.25, 13.0),
-  'M10':   (1.50, 0.3, 14.7, 17.9,  6.4, 0.4,  16.0),
-  'M12':   (1.75, 0.3, 16.7, 20.1,  7.5, 0.6,  18.0),
-  '(M14)': (2.00, 0.3, 20.5, 24.5,  8.8, 0.6,  22.0),
-  'M16':   (2.00, 0.4, 22.4, 26.9, 10.0, 0.6,  24.0),
-  '(M18)': (2.50, 0.4, 25.4, 30.2, 11.5, 0.6,  27.0),
-  'M20':   (2.50, 0.4, 28.2, 33.7, 12.5, 0.8,  30.0),
-  '(M22)': (2.50, 0.4, 31.8, 37.7, 14.0, 0.8,  34.0),
-  'M24':   (3.00, 0.4, 33.7, 40.1, 15.0, 0.8,  36.0),
-  '(M27)': (3.00, 0.4, 38.0, 45.2, 17.0, 1.0,  41.0),
-  'M30':   (3.50, 0.4, 42.8, 50.9, 18.7, 1.0,  46.0), #dw not in class A, e not in class A
-  '(M33)': (3.50, 0.4, 46.6, 55.4, 21.0, 1.0,  50.0),
-  'M36':   (4.00, 0.4, 51.2, 61.0, 22.5, 1.0,  55.0), #dw not in class A, e not in class A
-  '(M39)': (4.00, 0.5, 55.9, 66.5, 25.0, 1.0,  60.0),
-  'M42':   (4.50, 0.7, 60.0, 71.3, 26.0, 1.2,  65.0),
-  '(M45)': (4.50, 0.7, 64.7, 77.0, 28.0, 1.2,  70.0),
-  'M48':   (5.00, 0.7, 69.5, 82.6, 30.0, 1.6,  75.0),
-  '(M52)': (5.00, 0.7, 74.5, 88.3, 33.0, 1.6,  80.0),
-  'M56':   (5.50, 0.7, 78.7, 93.6, 35.0, 2.0,  85.0),
-  '(M60)': (5.50, 0.7, 82.7, 99.2, 38.0, 2.0,  90.0),
-  'M64':   (6.00, 0.7, 88.2,104.9, 40.0, 2.0,  95.0)
-  }
-
-
-
-iso4017length = {
-  '2': ( 1.8,  2.2),
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '100':(99.3, 100.7),
-  '110':(109.3, 110.7),
-  '120':(119.3, 120.7),
-  '130':(129.2, 130.8),
-  '140':(139.2, 130.8),
-  '150':(149.2, 150.8),
-  '160':(159.2, 160.8),
-  '180':(179.2, 180.8),
-  '200':(199.1, 200.9)
-  }
+iso4017head = FSGetCatalogTable('iso4017head')
+
+
+
+iso4017length = FSGetCatalogTable('iso4017length')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso4017range = {
-  'M1.6':  ('2', '16'),
-  'M2':    ('4', '20'),
-  'M2.5':  ('5', '25'),
-  'M3':    ('5', '30'),
-  '(M3.5)':('8', '35'),
-  'M4':    ('6', '40'),
-  'M5':    ('8', '50'),
-  'M6':   ('12', '60'),
-  'M8':   ('16', '80'),
-  'M10':  ('20','100'),
-  'M12':  ('25','120'),
-  '(M14)':('25','140'),
-  'M16':  ('30','150'),
-  '(M18)':('35','200'),
-  'M20':  ('40','160'),
-  '(M22)':('45','200'),
-  'M24':  ('50','180'),
-  '(M27)':('50','100'),
-  'M30':  ('60','200'),
-  '(M33)':('65','200'),
-  'M36':  ('70','200'),
-  '(M39)':('80','200'),
-  'M42':  ('70','200'),
-  '(M45)':('90','200'),
-  'M48': ('100','200'),
-  '(M52)':('100','200'),
-  'M56':  ('110','200'),
-  '(M60)':('120','200'),
-  'M64':  ('120','200')
-  }
+iso4017range = FSGetCatalogTable('iso4017range')
 
 
 # ISO 4014 Hex-head-bolt
 #          P,      b1,    b2,    b3,  c,   dw,    e,    k,   r,   s
-iso4014head={
-  'M1.6':  (0.35,   9.0,  15.0,  28.0, 0.2,  2.3,  3.4,  1.1, 0.1,  3.2),
-  'M2':    (0.40,  10.0,  16.0,  29.0, 0.2,  3.0,  4.4,  1.4, 0.1,  4.0),
-  'M2.5':  (0.45,  11.0,  17.0,  30.0, 0.2,  4.0,  5.5,  1.7, 0.1,  5.0),
-  'M3':    (0.50,  12.0,  18.0,  31.0, 0.2,  4.6,  6.1,  2.0, 0.1,  5.5),
-  '(M3.5)':(0.60,  13.0,  19.0,  32.0, 0.2,  5.1,  6.6,  2.4, 0.1,  6.0),
-  'M4':    (0.70,  14.0,  20.0,  33.0, 0.2,  5.9,  7.7,  2.8, 0.2,  7.0),
-  'M5':    (0.80,  16.0,  22.0,  35.0, 0.2,  6.9,  8.9,  3.5, 0.2,  8.0),
-  'M6':    (1.00,  18.0,  24.0,  37.0, 0.2,  8.9, 11.05, 4.0, 0.25,10.0),
-  'M8':    (1.25,  22.0,  28.0,  41.0, 0.3, 11.7, 14.5,  5.3, 0.4, 13.0),
-  'M10':   (1.50,  26.0,  32.0,  45.0, 0.3, 14.7, 17.9,  6.4, 0.4, 16.0),
-  'M12':   (1.75,  30.0,  36.0,  49.0, 0.3, 16.7, 20.1,  7.5, 0.6, 18.0),
-  '(M14)': (2.00,  34.0,  40.0,  53.0, 0.3, 20.5, 24.5,  8.8, 0.6, 22.0),
-  'M16':   (2.00,  38.0,  44.0,  57.0, 0.4, 22.4, 26.9, 10.0, 0.6, 24.0),
-  '(M18)': (2.50,  42.0,  48.0,  61.0, 0.4, 25.4, 30.2, 11.5, 0.6, 27.0),
-  'M20':   (2.50,  46.0,  52.0,  65.0, 0.4, 28.2, 33.7, 12.5, 0.8, 30.0),
-  '(M22)': (2.50,  50.0,  56.0,  69.0, 0.4, 31.8, 37.7, 14.0, 0.8, 34.0),
-  'M24':   (3.00,  54.0,  60.0,  73.0, 0.4, 33.7, 40.1, 15.0, 0.8, 36.0),
-  '(M27)': (3.00,  60.0,  66.0,  79.0, 0.4, 38.0, 45.2, 17.0, 1.0, 41.0),
-  'M30':   (3.50,  66.0,  72.0,  85.0, 0.4, 42.8, 50.9, 18.7, 1.0, 46.0), #dw not in class A, e not in class A
-  '(M33)': (3.50,  78.0,  78.0,  91.0, 0.4, 46.6, 55.4, 21.0, 1.0, 50.0),
-  'M36':   (4.00,  84.0,  84.0,  97.0, 0.4, 51.2, 60.8, 22.5, 1.0, 55.0),
-  '(M39)': (4.00,  90.0,  90.0, 103.0, 0.5, 55.9, 66.5, 25.0, 1.0, 60.0),
-  'M42':   (4.50,  96.0,  96.0, 109.0, 0.6, 60.0, 71.3, 26.0, 1.2, 65.0),
-  '(M45)': (4.50, 102.0, 102.0, 115.0, 0.7, 64.7, 77.0, 28.0, 1.2, 70.0),
-  'M48':   (5.00, 108.0, 108.0, 121.0, 0.6, 69.5, 82.6, 30.0, 1.6, 75.0),
-  '(M52)': (5.00, 116.0, 116.0, 129.0, 0.7, 74.5, 88.3, 33.0, 1.6, 80.0),
-  'M56':   (5.50, 137.0, 137.0, 137.0, 0.6, 78.7, 93.6, 35.0, 2.0, 85.0),
-  '(M60)': (5.50, 145.0, 145.0, 145.0, 0.7, 82.7, 99.2, 38.0, 2.0, 90.0),
-  'M64':   (6.00, 153.0, 153.0, 153.0, 0.6, 88.2,104.9, 40.0, 2.0, 55.0)
-  }
-
-
-iso4014length = {
-  '12':(11.65, 12.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '100':(99.3, 100.7),
-  '110':(109.3, 110.7),
-  '120':(119.3, 120.7),
-  '130':(129.2, 130.8),
-  '140':(139.2, 130.8),
-  '150':(149.2, 150.8),
-  '160':(159.2, 160.8),
-  '180':(179.2, 180.8),
-  '200':(199.1, 200.9),
-  '220':(219.1, 220.9),
-  '240':(237.7, 242.3),
-  '260':(219.1, 220.9),
-  '280':(219.1, 220.9),
-  '300':(219.1, 220.9),
-  '320':(219.1, 220.9),
-  '340':(219.1, 220.9),
-  '360':(219.1, 220.9),
-  '380':(219.1, 220.9),
-  '400':(219.1, 220.9),
-  '420':(219.1, 220.9),
-  '440':(219.1, 220.9),
-  '460':(219.1, 220.9),
-  '480':(219.1, 220.9),
-  '500':(496.85, 503.15)
-  }
+iso4014head = FSGetCatalogTable('iso4014head')
+
+
+iso4014length = FSGetCatalogTable('iso4014length')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso4014range = {
-  'M1.6':('12', '16'),
-  'M2':  ('16', '20'),
-  'M2.5':('16', '25'),
-  'M3':  ('20', '30'),
-  '(M3.5)':('20', '35'),
-  'M4':  ('25', '50'),
-  'M5':  ('25', '50'),
-  'M6':  ('30', '130'),
-  'M8':  ('30', '180'),
-  'M10': ('35', '150'),
-  'M12': ('50', '150'),
-  '(M14)': ('50', '160'),
-  'M16': ('55', '200'),
-  '(M18)':('70','180'),
-  'M20': ('60', '300'),
-  '(M22)':('70','220'),
-  'M24': ('80', '220'),
-  '(M27)':('90', '220'),
-  'M30': ('110','300'),
-  '(M33)':('130','320'),
-  'M36': ('140','360'),
-  '(M39)':('150','380'),
-  'M42': ('160','440'),
-  '(M45)':('180','440'),
-  'M48': ('180','480'),
-  '(M52)':('200','480'),
-  'M56': ('220','500'),
-  '(M60)':('220','500'),
-  'M64': ('260','500')
-  }
+iso4014range = FSGetCatalogTable('iso4014range')
 
 
 # EN 1662 Hexagon bolts with flange, small series
 #          P,   b0,    b1,   b2,   b3,   c,  dc,    dw,    e,     k,   kw,  lf,  r1,   s
-en1662def={
-  'M5': (0.80, 25.0, 16.0,  0.0,  0.0, 1.0, 11.4,  9.4,  7.59,  5.6, 2.3, 1.4, 0.2, 7.0),
-  'M6': (1.00, 30.0, 18.0,  0.0,  0.0, 1.1, 13.6, 11.6,  8.71,  6.9, 2.9, 1.6, 0.25, 8.0),
-  'M8': (1.25, 35.0, 22.0, 28.0,  0.0, 1.2, 17.0, 14.9, 10.95,  8.5, 3.8, 2.1, 0.4, 10.0),
-  'M10':(1.50, 40.0, 26.0, 32.0,  0.0, 1.5, 20.8, 18.7, 14.26,  9.7, 4.3, 2.1, 0.4, 13.0),
-  'M12':(1.75, 45.0, 30.0, 36.0,  0.0, 1.8, 24.7, 22.5, 17.62, 12.1, 5.4, 2.1, 0.6, 16.0),
-  '(M14)':(2.00, 50.0, 34.0, 40.0,  0.0, 2.1, 28.6, 26.4, 19.86, 12.9, 5.6, 2.1, 0.6, 18.0),
-  'M16':(2.00, 55.0, 38.0, 44.0, 57.0, 2.4, 32.8, 30.6, 23.15, 15.2, 6.8, 3.2, 0.6, 21.0)}
+en1662def = FSGetCatalogTable('en1662def')
 
 
 # range of typical screw lengths
 #    min_length,  max_length
-en1662range = {
-  'M5': ('10', '50'),
-  'M6': ('12', '60'),
-  'M8': ('16', '80'),
-  'M10':('20','100'),
-  'M12':('25','120'),
-  '(M14)':('30','140'),
-  'M16':('35','160')
-  }
-
-en1662length = {
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '90':(89.3, 90.7),
-  '100':(99.3, 100.7),
-  '110':(109.3, 110.7),
-  '120':(119.3, 120.7),
-  '130':(129.2, 130.8),
-  '140':(139.2, 130.8),
-  '150':(149.2, 150.8),
-  '160':(159.2, 160.8)
-  }
+en1662range = FSGetCatalogTable('en1662range')
+
+en1662length = FSGetCatalogTable('en1662length')
 
 
 # EN 1665 Hexagon bolts with flange, heavy series
 #          P,    b0,  b1,   b2,   b3,   c,  dc,    dw,    e,     k,   kw,  lf,  r1,   s
-en1665def={
-  'M5': (0.80, 25.0, 16.0,  0.0,  0.0, 1.0, 11.8,  9.8,  8.71,  5.8, 2.6, 1.4, 0.2,  8.0),
-  'M6': (1.00, 30.0, 18.0,  0.0,  0.0, 1.1, 14.2, 12.2, 10.95,  6.6, 3.0, 1.6, 0.25,10.0),
-  'M8': (1.25, 35.0, 22.0, 28.0,  0.0, 1.2, 18.0, 15.8, 14.26,  8.1, 3.9, 2.1, 0.4, 13.0),
-  'M10':(1.50, 40.0, 26.0, 32.0,  0.0, 1.5, 22.3, 19.6, 17.62, 10.4, 4.1, 2.1, 0.4, 16.0),
-  'M12':(1.75, 45.0, 30.0, 36.0,  0.0, 1.8, 26.6, 23.8, 19.86, 11.8, 5.6, 2.1, 0.6, 18.0),
-  '(M14)':(2.00, 50.0, 34.0, 40.0,  0.0, 2.1, 30.5, 27.6, 23.15, 13.7, 6.5, 2.1, 0.6, 21.0),
-  'M16':(2.00, 55.0, 38.0, 44.0, 57.0, 2.4, 35.0, 31.9, 26.51, 15.4, 7.3, 3.2, 0.6, 24.0),
-  'M20':(2.50, 65.0, 46.0, 52.0, 65.0, 3.0, 43.0, 39.9, 33.23, 18.9, 8.9, 4.2, 0.8, 30.0)}
+en1665def = FSGetCatalogTable('en1665def')
 
 
 # range of typical screw lengths
 #    min_length,  max_length
-en1665range = {
-  'M5': ('10', '50'),
-  'M6': ('12', '60'),
-  'M8': ('16', '80'),
-  'M10':('20','100'),
-  'M12':('25','120'),
-  '(M14)':('30','140'),
-  'M16':('35','160'),
-  'M20':('65','200')
-  }
-
-en1665length = {
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '90':(89.3, 90.7),
-  '100':(99.3, 100.7),
-  '110':(109.3, 110.7),
-  '120':(119.3, 120.7),
-  '130':(129.2, 130.8),
-  '140':(139.2, 130.8),
-  '150':(149.2, 150.8),
-  '160':(159.2, 160.8),
-  '180':(179.2, 180.8),
-  '200':(199.1, 200.9)
-  }
+en1665range = FSGetCatalogTable('en1665range')
+
+en1665length = FSGetCatalogTable('en1665length')
 
 
 
 # ISO 1207 definitions Class A, Slotted cheese head screws
 #          P,     a,   b,   dk,  dk_mean, da,  k,  n_min, r, t_min, x
-iso1207def={
-  'M1.6':(0.35, 0.7, 25.0,  3.0,  2.9,  2.0, 1.1, 0.46, 0.1, 0.45, 0.9),
-  'M2':  (0.40, 0.8, 25.0,  3.8,  3.7,  2.6, 1.4, 0.56, 0.1, 0.6, 1.0),
-  'M2.5':(0.45, 0.9, 25.0,  4.5,  4.4,  3.1, 1.8, 0.66, 0.1, 0.7, 1.1),
-  'M3':  (0.50, 1.0, 25.0,  5.5,  5.4,  3.6, 2.0, 0.86, 0.1, 0.85, 1.25),
-  '(M3.5)':(0.60, 1.2, 38.0,  6.0,  5.9,  4.1, 2.4, 1.06, 0.1, 1.0, 1.5),
-  'M4':  (0.70, 1.4, 38.0,  7.0,  6.9,  4.7, 2.6, 1.26, 0.2, 1.1, 1.75),
-  'M5':  (0.80, 1.6, 38.0,  8.5,  8.4,  5.7, 3.3, 1.26, 0.2, 1.3, 2.0),
-  'M6':  (1.00, 2.0, 38.0, 10.0,  9.9,  6.8, 3.9, 1.66, 0.25,1.6, 2.5),
-  'M8':  (1.25, 2.5, 38.0, 13.0, 12.85, 9.2, 5.0, 2.06, 0.4, 2.0, 3.2),
-  'M10': (1.50, 3.0, 38.0, 16.0, 15.85, 11.2,6.0, 2.56, 0.4, 2.4, 3.8)}
+iso1207def = FSGetCatalogTable('iso1207def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso1207range = {
-  'M1.6':('2', '16'),
-  'M2':  ('3', '20'),
-  'M2.5':('3', '25'),
-  'M3':  ('4', '30'),
-  '(M3.5)':('5', '35'),
-  'M4':  ('5', '40'),
-  'M5':  ('6', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '80'),
-  'M10':('12', '80')}
+iso1207range = FSGetCatalogTable('iso1207range')
 
 # slotted cheese head screws
 # nom length: l_min, l_max
-iso1207length = {
-  '2': (1.8,  2.2),
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.05, 55.95),
-  '60':(59.05, 60.95),
-  '65':(64.05, 65.95),
-  '70':(69.05, 70.95),
-  '75':(74.05, 75.95),
-  '80':(79.05, 80.95)
-  }
+iso1207length = FSGetCatalogTable('iso1207length')
 
 
 # ISO 14580 definitions , Hexalobular socket cheese head screws
 #          P,     a,   b,   dk,  dk_mean, da,  k,  n_min, r, t_min, x
 #           tt,    k,    A,  t_mean
-iso14580def={
-  'M2':  ('T6',  1.55, 1.75, 0.8),
-  'M2.5':('T8',  1.85, 2.40, 0.9),
-  'M3':  ('T10', 2.40, 2.80, 1.2),
-  '(M3.5)':('T15', 2.60, 3.35, 1.3),
-  'M4':  ('T20', 3.10, 3.95, 1.5),
-  'M5':  ('T25', 3.65, 4.50, 1.7),
-  'M6':  ('T30', 4.40, 5.60, 2.1),
-  'M8':  ('T45', 5.80, 7.95, 2.9),
-  'M10': ('T50', 6.90, 8.95, 3.3)}
+iso14580def = FSGetCatalogTable('iso14580def')
 
 # range of typical screw lengths
 #    min_length,  max_length
 # iso14580range = iso1207range
 
 # nom length: l_min, l_max
-iso14580length = {
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.05, 55.95),
-  '60':(59.05, 60.95),
-  '65':(64.05, 65.95),
-  '70':(69.05, 70.95),
-  '75':(74.05, 75.95),
-  '80':(79.05, 80.95)
-  }
+iso14580length = FSGetCatalogTable('iso14580length')
 
 
 
 # ISO 7048 definitions Class A,
 # Cross-recessed cheese head screws with type H or Z cross recess
 #          P,     a,   b,   dk,  dk_mean, da,  k,   r,   x, cT,   mH,   mZ
-iso7048def={
-  'M2.5':(0.45, 0.9, 25.0,  4.5,  4.4,  3.1, 1.8, 0.1, 1.1, '1', 2.7, 2.4),
-  'M3':  (0.50, 1.0, 25.0,  5.5,  5.4,  3.6, 2.0, 0.1, 1.25,'2', 3.5, 3.5),
-  '(M3.5)':(0.60, 1.2, 38.0,  6.0,  5.9,  4.1, 2.4, 0.1, 1.5, '2', 3.8, 3.7),
-  'M4':  (0.70, 1.4, 38.0,  7.0,  6.9,  4.7, 2.6, 0.2, 1.75,'2', 4.1, 4.0),
-  'M5':  (0.80, 1.6, 38.0,  8.5,  8.4,  5.7, 3.3, 0.2, 2.0, '2', 4.8, 4.6),
-  'M6':  (1.00, 2.0, 38.0, 10.0,  9.9,  6.8, 3.9, 0.25,2.5, '3', 6.2, 6.1),
-  'M8':  (1.25, 2.5, 38.0, 13.0, 12.85, 9.2, 5.0, 0.4, 3.2, '3', 7.7, 7.5)
-  }
+iso7048def = FSGetCatalogTable('iso7048def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso7048range = {
-  'M2.5':('3', '25'),
-  'M3':  ('4', '30'),
-  '(M3.5)':('5', '35'),
-  'M4':  ('5', '40'),
-  'M5':  ('6', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '80')}
+iso7048range = FSGetCatalogTable('iso7048range')
 
 # nom length: l_min, l_max
-iso7048length = {
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '60':(59.05, 60.95),
-  '70':(69.05, 70.95),
-  '80':(79.05, 80.95)
-  }
+iso7048length = FSGetCatalogTable('iso7048length')
 
 
 # Button Head Screw
 # nom length: l_min, l_max
-iso7380length = {
-  #'2.5':(2.3,  2.7),
-  #'3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.05, 55.95),
-  '60':(59.05, 60.95),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '90':(89.3, 90.7)
-  }
+#'2.5':(2.3,  2.7),
+#'3': ( 2.8,  3.2),
+iso7380length = FSGetCatalogTable('iso7380length')
 
 # ISO 7380-1 definitions Class A
 # http://www.agrati.com/it/unificati/it/gamma/unificati/home02.htm
 #          P,   b,     a,   da, dk,  dk_mean,s_mean,t_min, r, k,   e,    w,
-iso7380def={
-  'M3':  (0.50, 18.0, 1.0,  3.6,  5.7,  5.5, 2.03, 1.04, 0.1, 1.65, 2.3,  0.2),
-  'M4':  (0.70, 20.0, 1.4,  4.7,  7.6,  7.4, 2.54, 1.30, 0.2, 2.20, 2.87, 0.3),
-  'M5':  (0.80, 22.0, 1.6,  5.7,  9.5,  9.3, 3.05, 1.56, 0.2, 2.75, 3.44, 0.38),
-  'M6':  (1.00, 24.0, 2.0,  6.8, 10.5, 10.3, 4.05, 2.08, 0.25,3.3,  4.58, 0.74),
-  'M8':  (1.25, 28.0, 2.5,  9.2, 14.0, 13.8, 5.05, 2.60, 0.4, 4.4,  5.72, 1.05),
-  'M10': (1.50, 32.0, 3.0, 11.2, 17.5, 17.3, 6.05, 3.12, 0.4, 5.5,  6.86, 1.45),
-  'M12': (1.75, 36.0, 3.5, 13.7, 21.0, 20.7, 8.06, 4.16, 0.6, 6.6,  9.15, 1.63),
-  'M16': (2.00, 44.0, 3.5, 17.7, 28.0, 27.8, 10.06,5.20, 0.6, 8.8, 11.43, 2.25)
-  }
+iso7380def = FSGetCatalogTable('iso7380def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso7380range = {
-  'M3':  ('6', '30'),
-  'M4':  ('6', '40'),
-  'M5':  ('8', '50'),
-  'M6':  ('10', '60'),
-  'M8': ('12', '80'),
-  'M10':('16', '90'),
-  'M12':('20', '90'),
-  'M16':('25', '90')}
+iso7380range = FSGetCatalogTable('iso7380range')
 
 # ISO 7380-2 definitions
 #          P,   b,     c,   da, dk,    dk_c,s_mean,t_min, r,  k,   e,    w,
-iso7380_2def={
-  'M3':  (0.50, 18.0, 0.7,  3.6,  5.2,  6.9, 2.03, 1.04, 0.1, 1.65, 2.3,  0.2),
-  'M4':  (0.70, 20.0, 0.8,  4.7,  7.2,  9.4, 2.54, 1.30, 0.2, 2.20, 2.87, 0.3),
-  'M5':  (0.80, 22.0, 1.0,  5.7,  8.8, 11.8, 3.05, 1.56, 0.2, 2.75, 3.44, 0.38),
-  'M6':  (1.00, 24.0, 1.2,  6.8, 10.0, 13.6, 4.05, 2.08, 0.25,3.3,  4.58, 0.74),
-  'M8':  (1.25, 28.0, 1.5,  9.2, 13.2, 17.8, 5.05, 2.60, 0.4, 4.4,  5.72, 1.05),
-  'M10': (1.50, 32.0, 2.0, 11.2, 16.5, 21.9, 6.05, 3.12, 0.4, 5.5,  6.86, 1.45),
-  'M12': (1.75, 36.0, 2.4, 13.7, 19.4, 26.0, 8.06, 4.16, 0.6, 6.6,  9.15, 1.63),
-  'M16': (2.00, 44.0, 2.8, 17.7, 26.0, 34.0, 10.06,5.20, 0.6, 8.8, 11.43, 2.25)
-  }
+iso7380_2def = FSGetCatalogTable('iso7380_2def')
 
 
 # DIN 967 definitions: Cross recessed pan head screw with collar
 #          P,   b,     c,   da,   dk,   r,  k,    rf,  x,    cT,  mH,   mZ
-din967def={
-  'M3':  (0.50, 25.0, 0.7,  3.6,  7.5, 0.1, 2.35,  3.8, 1.25, '1', 3.0, 2.9),
-  '(M3.5)':(0.60, 38.0, 0.8,  4.1,  9.0, 0.1, 2.60,  4.6, 1.5,  '2', 4.2, 3.9),
-  'M4':  (0.70, 38.0, 1.0,  4.7, 10.0, 0.2, 3.05,  5.8, 1.75, '2', 4.6, 4.3),
-  'M5':  (0.80, 38.0, 1.2,  5.7, 11.5, 0.2, 3.55,  6.6, 2.0,  '2', 5.0, 4.7),
-  'M6':  (1.00, 38.0, 1.6,  6.8, 14.5, 0.25,4.55,  8.2, 2.5,  '3', 7.1, 6.7),
-  'M8':  (1.25, 38.0, 2.0,  9.2, 19.0, 0.4, 5.90, 11.0, 3.2,  '4', 9.0, 8.8)
-  }
+din967def = FSGetCatalogTable('din967def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-din967range = {
-  'M3':  ('4', '30'),
-  '(M3.5)':  ('5', '35'),
-  'M4':  ('5', '40'),
-  'M5':  ('6', '45'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '60')
-}
+din967range = FSGetCatalogTable('din967range')
 # Button Head Screw
 # nom length: l_min, l_max
-din967length = {
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.05, 55.95),
-  '60':(59.05, 60.95)
-  }
-
-
-L_iso2009length =['2.5','3','4','5','6','8','10','12','14','16','20', \
-   '25','30','35','40','45','50','55','60','65','70','75','80']
+din967length = FSGetCatalogTable('din967length')
+
+
+L_iso2009length = FSGetCatalogTable('L_iso2009length')
 # nom length: l_min, l_max
-iso2009length = {
-  '2.5':(2.3,  2.7),
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.05, 55.95),
-  '60':(59.05, 60.95),
-  '65':(64.05, 65.95),
-  '70':(69.05, 70.95),
-  '75':(74.05, 75.95),
-  '80':(79.05, 80.95)
-  }
+iso2009length = FSGetCatalogTable('iso2009length')
 
 
 # ISO 2009 definitions Class A
 #          P, a, b, dk_theo, dk_mean, k, n_min, r, t_mean, x
-iso2009def={
-   'M1.6':(0.35, 0.7, 25, 3.6, 2.8,  1.0,  0.46, 0.2, 0.4, 0.9),
-   'M2':  (0.40, 0.8, 25, 4.4, 3.6,  1.2,  0.56, 0.3, 0.5, 1.0),
-   'M2.5':(0.45, 0.9, 25, 5.5, 4.5,  1.5,  0.66, 0.3, 0.6, 1.1),
-   'M3':  (0.50, 1.0, 25, 6.3, 5.3,  1.65, 0.86, 0.4, 0.7, 1.25),
-   '(M3.5)':(0.60, 1.2, 38, 8.2, 7.1,  2.35, 1.06, 0.4, 1.0, 1.5),
-   'M4':  (0.70, 1.4, 38, 9.4, 8.2,  2.7,  1.26, 0.5, 1.1, 1.75),
-   'M5':  (0.80, 1.6, 38,10.4, 9.2,  2.7,  1.26, 0.6, 1.2, 2.0),
-   'M6':  (1.00, 2.0, 38,12.6, 11.2, 3.3,  1.66, 0.7, 1.4, 2.5),
-   'M8':  (1.25, 2.5, 38,17.3, 15.6, 4.65, 2.06, 1.0, 2.0, 3.2),
-   'M10': (1.50, 3.0, 38,20.0, 18.1, 5.0,  2.56, 1.2, 2.3, 3.8)}
+iso2009def = FSGetCatalogTable('iso2009def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso2009range = {
-  'M1.6':('2.5', '16'),
-  'M2':  ('3', '20'),
-  'M2.5':('4', '25'),
-  'M3':  ('5', '30'),
-  '(M3.5)':('6', '35'),
-  'M4':  ('6', '40'),
-  'M5':  ('8', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '80'),
-  'M10':('12', '80')}
+iso2009range = FSGetCatalogTable('iso2009range')
 
 
 # ISO 7046 definitions Class A
@@ -797,31 +255,11 @@ iso2009range = {
 # Parameters P, a, b, dk_theo, dk_mean, k, r, x to be read from iso2009def
 # Length = iso7045length
 #          cT,   mH,   mZ
-iso7046def={
-  'M1.6':('0', 1.6, 1.6),
-  'M2':  ('0', 1.9, 1.9),
-  'M2.5':('1', 2.9, 2.8),
-  'M3':  ('1', 3.2, 3.0),
-  '(M3.5)':('2', 4.4, 4.1),
-  'M4':  ('2', 4.6, 4.4),
-  'M5':  ('2', 5.2, 4.0),
-  'M6':  ('3', 6.8, 6.6),
-  'M8':  ('4', 8.9, 8.8),
-  'M10': ('4', 10.0,9.8)}
+iso7046def = FSGetCatalogTable('iso7046def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso7046range = {
-  'M1.6':('3', '16'),
-  'M2':  ('3', '20'),
-  'M2.5':('3', '25'),
-  'M3':  ('4', '30'),
-  '(M3.5)':('5', '35'),
-  'M4':  ('5', '40'),
-  'M5':  ('6', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '60'),
-  'M10':('12', '60')}
+iso7046range = FSGetCatalogTable('iso7046range')
 
 # ISO 2010, ISO 7047 definitions Class A: Raised Countersunk head screws
 # ISO 2010 slotted screws (common head style)   range = iso2009range
@@ -829,78 +267,26 @@ iso7046range = {
 # Parameters P, a, b, dk_theo, dk_mean, k, r, x to be read from iso2009def
 # Length = iso7045length
 #          rf, t_mean, cT,   mH,   mZ
-Raised_countersunk_def={
-  'M1.6':(3.0,  0.7, '0', 1.9,  1.9),
-  'M2':  (4.0,  0.9, '0', 2.0,  2.2),
-  'M2.5':(5.0,  1.1, '1', 3.0,  2.8),
-  'M3':  (6.0,  1.3, '1', 3.4,  3.1),
-  '(M3.5)':(8.5,  1.5, '2', 4.8,  4.6),
-  'M4':  (9.5,  1.8, '2', 5.2,  5.0),
-  'M5':  (9.5,  2.2, '2', 5.4,  5.3),
-  'M6':  (12.0, 2.6, '3', 7.3,  7.1),
-  'M8':  (16.5, 3.5, '4', 9.6,  9.5),
-  'M10': (19.5, 4.1, '4', 10.4,10.3)}
+Raised_countersunk_def = FSGetCatalogTable('Raised_countersunk_def')
 
 
 
 # ISO 14582 definitions
 #          P,    a,    b, dk_theo, dk_mean,k,   r,  tt, A, t_mean
-iso14582def={
-  'M3':  (0.50, 1.0, 18.0,  7.40,  6.5, 2.20, 0.10, 'T10', 2.80, 1.1),
-  'M4':  (0.70, 1.4, 20.0, 10.02,  9.0, 3.01, 0.20, 'T20', 3.95, 1.6),
-  'M5':  (0.80, 1.6, 22.0, 12.00, 10.8, 3.50, 0.20, 'T25', 4.50, 1.8),
-  'M6':  (1.00, 2.0, 24.0, 14.44, 13.1, 4.22, 0.25, 'T30', 5.60, 2.2),
-  'M8':  (1.25, 2.5, 28.0, 19.38, 17.8, 5.69, 0.40, 'T45', 7.93, 2.8),
-  'M10': (1.50, 3.0, 32.0, 23.00, 21.1, 6.50, 0.40, 'T50', 8.95, 3.3)}
+iso14582def = FSGetCatalogTable('iso14582def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso14582range = {
-  'M3':  ('8', '30'),
-  'M4':  ('8', '40'),
-  'M5':  ('8', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '80'),
-  'M10':('12', '100')}
+iso14582range = FSGetCatalogTable('iso14582range')
 
 # nom length: l_min, l_max
-iso14582length = {
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '90':(89.3, 90.7),
-  '100':(99.3, 100.7)
-  }
+iso14582length = FSGetCatalogTable('iso14582length')
 
 
 
 # ISO 1580 definitions Class A, Slotted pan head screws
 #           P,    a,   b, dk_max,da,  k, n_min,  r,  rf, t_mean, x
-iso1580def={
-  'M1.6':(0.35, 0.7, 25,  3.2, 2.0, 1.0, 0.46, 0.1, 0.5, 0.4, 0.9),
-  'M2':  (0.4,  0.8, 25,  4.0, 2.6, 1.3, 0.56, 0.1, 0.6, 0.5, 1.0),
-  'M2.5':(0.45, 0.9, 25,  5.0, 3.1, 1.5, 0.66, 0.1, 0.8, 0.6, 1.1),
-  'M3':  (0.5,  1.0, 25,  5.6, 3.6, 1.8, 0.86, 0.1, 0.9, 0.7, 1.25),
-  '(M3.5)':(0.6,  1.2, 38,  7.0, 4.1, 2.1, 1.06, 0.1, 1.0, 0.8, 1.5),
-  'M4':  (0.7,  1.4, 38,  8.0, 4.7, 2.4, 1.26, 0.2, 1.2, 1.0, 1.75),
-  'M5':  (0.8,  1.6, 38,  9.5, 5.7, 3.0, 1.26, 0.2, 1.5, 1.2, 2.0),
-  'M6':  (1.0,  2.0, 38, 12.0, 6.8, 3.6, 1.66, 0.25,1.8, 1.4, 2.5),
-  'M8':  (1.25, 2.5, 38, 16.0, 9.2, 4.8, 2.06, 0.4, 2.4, 1.9, 3.2),
-  'M10': (1.50, 3.0, 38, 20.0,11.2, 6.0, 2.56, 0.4, 3.0, 2.4, 3.8)}
+iso1580def = FSGetCatalogTable('iso1580def')
 
 
 
@@ -908,69 +294,21 @@ iso1580def={
 # partly used also for ISO 14583 Hexalobular socket pan head screws
 #   cross recess;    cT = size of cross recess
 #           P,    a,   b, dk_max,da,  k,   r,   rf,  x,  cT,   mH,   mZ
-iso7045def={
-  'M1.6':(0.35, 0.7, 25,  3.2, 2.0, 1.3, 0.1, 2.5, 0.9, '0', 1.7, 1.6),
-  'M2':  (0.4,  0.8, 25,  4.0, 2.6, 1.6, 0.1, 3.2, 1.0, '0', 1.9, 2.1),
-  'M2.5':(0.45, 0.9, 25,  5.0, 3.1, 2.1, 0.1, 4.0, 1.1, '1', 2.7, 2.6),
-  'M3':  (0.5,  1.0, 25,  5.6, 3.6, 2.4, 0.1, 5.0, 1.25,'1', 3.0, 2.8),
-  '(M3.5)':(0.6,  1.2, 38,  7.0, 4.1, 2.6, 0.1, 6.0, 1.5, '2', 3.9, 3.9),
-  'M4':  (0.7,  1.4, 38,  8.0, 4.7, 3.1, 0.2, 6.5, 1.75,'2', 4.4, 4.3),
-  'M5':  (0.8,  1.6, 38,  9.5, 5.7, 3.7, 0.2, 8.0, 2.0, '2', 4.9, 4.7),
-  'M6':  (1.0,  2.0, 38, 12.0, 6.8, 4.6, 0.25,10., 2.5, '3', 6.9, 6.7),
-  'M8':  (1.25, 2.5, 38, 16.0, 9.2, 6.0, 0.4, 13., 3.2, '4', 9.0, 8.8),
-  'M10': (1.50, 3.0, 38, 20.0,11.2, 7.5, 0.4, 16., 3.8, '4', 10.1,9.9)}
+iso7045def = FSGetCatalogTable('iso7045def')
 
 # nom length: l_min, l_max
-iso7045length = {
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.05, 55.95),
-  '60':(59.05, 60.95)
-  }
+iso7045length = FSGetCatalogTable('iso7045length')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso7045range = {
-  'M1.6':('3', '16'),
-  'M2':  ('3', '20'),
-  'M2.5':('3', '25'),
-  'M3':  ('4', '30'),
-  '(M3.5)':('5', '35'),
-  'M4':  ('5', '40'),
-  'M5':  ('6', '45'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '60'),
-  'M10':('12', '60')}
+iso7045range = FSGetCatalogTable('iso7045range')
 
 
 # ISO 14583 Hexalobular socket pan head screws
 #   hexalobular recess;    tt = size of hexalobular recess
 
 #           tt,    A,  t_mean
-iso14583def={
-  'M2':  ('T6',  1.75, 0.7),
-  'M2.5':('T8',  2.40, 1.0),
-  'M3':  ('T10', 2.80, 1.2),
-  '(M3.5)':('T15', 3.35, 1.3),
-  'M4':  ('T20', 3.95, 1.5),
-  'M5':  ('T25', 4.50, 1.7),
-  'M6':  ('T30', 5.60, 2.2),
-  'M8':  ('T45', 7.95, 3.0),
-  'M10': ('T50', 8.95, 3.8)}
+iso14583def = FSGetCatalogTable('iso14583def')
 
 
 #iso14583range = iso7046range
@@ -978,30 +316,12 @@ iso14583def={
 
 # ISO 14584 Hexalobular socket raised countersunk head screws
 #           P,   b, dk_theo, dk_mean, f,  k,   r,   rf,    x,    tt,    A,  t_mean
-iso14584def={
-  'M2':  (0.40, 25.0,  4.4,  3.8,  0.5, 1.20, 0.2,  4.0, 1.00, 'T6',  1.75, 0.7),
-  'M2.5':(0.45, 25.0,  5.5,  4.7,  0.6, 1.50, 0.3,  5.0, 1.10, 'T8',  2.40, 1.0),
-  'M3':  (0.50, 25.0,  6.3,  5.5,  0.7, 1.65, 0.4,  6.0, 1.25, 'T10', 2.80, 1.2),
-  '(M3.5)':(0.60, 38.0,  8.2,  7.3,  0.8, 2.35, 0.4,  8.5, 1.50, 'T15', 3.35, 1.3),
-  'M4':  (0.70, 38.0,  9.4,  8.4,  1.0, 2.70, 0.5,  9.5, 1.75, 'T20', 3.95, 1.5),
-  'M5':  (0.80, 38.0, 10.4,  9.3,  1.2, 2.70, 0.6,  9.5, 2.00, 'T25', 4.50, 1.7),
-  'M6':  (1.00, 38.0, 12.6, 11.3,  1.4, 3.30, 0.7, 12.0, 2.50, 'T30', 5.60, 2.2),
-  'M8':  (1.25, 38.0, 17.3, 15.8,  2.0, 4.65, 1.0, 16.5, 3.20, 'T45', 7.95, 3.0),
-  'M10': (1.50, 38.0, 20.0, 18.3,  2.3, 5.00, 1.2, 19.5, 3.80, 'T50', 8.95, 3.8)}
+iso14584def = FSGetCatalogTable('iso14584def')
 
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso14584range = {
-  'M2':  ('3', '20'),
-  'M2.5':('3', '25'),
-  'M3':  ('4', '30'),
-  '(M3.5)':('5', '35'),
-  'M4':  ('5', '40'),
-  'M5':  ('6', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '60'),
-  'M10':('12', '60')}
+iso14584range = FSGetCatalogTable('iso14584range')
 
 #iso14584length = iso7045length
 
@@ -1009,506 +329,106 @@ iso14584range = {
 # ISO 4762 Hexagon socket head cap screws ( Allan screw)
 # ISO 4762 definitions
 #           P,   b,  dk_max,  da,  ds_min,   e,    lf,   k,   r,   s_mean, t,    v,   dw,   w
-iso4762def={
-  'M1.6':(0.35,  15.0,  3.0,  2.0,  1.46,  1.73, 0.34,  1.6, 0.1,  1.56,  0.7, 0.16, 2.72, 0.55),
-  'M2':  (0.40,  16.0,  3.8,  2.6,  1.86,  1.73, 0.51,  2.0, 0.1,  1.56,  1.0, 0.2,  3.48, 0.55),
-  'M2.5':(0.45,  17.0,  4.5,  3.1,  2.36,  2.30, 0.51,  2.5, 0.1,  2.06,  1.1, 0.25, 4.18, 0.85),
-  'M3':  (0.50,  18.0,  5.5,  3.6,  2.86,  2.87, 0.51,  3.0, 0.1,  2.56,  1.3, 0.3,  5.07, 1.15),
-  'M4':  (0.70,  20.0,  7.0,  4.7,  3.82,  3.44, 0.60,  4.0, 0.2,  3.06,  2.0, 0.4,  6.53, 1.40),
-  'M5':  (0.80,  22.0,  8.5,  5.7,  4.82,  4.58, 0.60,  5.0, 0.2,  4.06,  2.5, 0.5,  8.03, 1.9),
-  'M6':  (1.00,  24.0, 10.0,  6.8,  5.82,  5.72, 0.68,  6.0, 0.25, 5.06,  3.0, 0.6,  9.38, 2.3),
-  'M8':  (1.25,  28.0, 13.0,  9.2,  7.78,  6.86, 1.02,  8.0, 0.4,  6.06,  4.0, 0.8, 12.33, 3.3),
-  'M10': (1.50,  32.0, 16.0, 11.2,  9.78,  9.15, 1.02, 10.0, 0.4,  8.07,  5.0, 1.0, 15.33, 4.0),
-  'M12': (1.75,  36.0, 18.0, 13.7, 11.73, 11.43, 1.45, 12.0, 0.6, 10.07,  6.0, 1.2, 17.23, 4.8),
-  '(M14)':(2.00,  40.0, 21.0, 15.7, 13.73, 13.72, 1.45, 14.0, 0.6, 12.07,  7.0, 1.4, 20.17, 5.8),
-  'M16': (2.00,  44.0, 24.0, 17.7, 15.73, 16.00, 1.45, 16.0, 0.6, 14.08,  8.0, 1.6, 23.17, 6.8),
-  'M20': (2.50,  52.0, 30.0, 22.4, 19.67, 19.44, 2.04, 20.0, 0.8, 17.10, 10.0, 2.0, 28.87, 8.6),
-  'M24': (3.00,  60.0, 36.0, 26.4, 23.67, 21.73, 2.04, 24.0, 0.8, 19.15, 12.0, 2.0, 34.81, 10.4),
-  'M30': (3.50,  72.0, 45.0, 33.4, 29.67, 25.15, 2.89, 30.0, 1.0, 22.15, 15.5, 2.4, 43.61, 13.1),
-  'M36': (4.00,  84.0, 54.0, 39.4, 35.61, 30.85, 2.89, 36.0, 1.0, 27.15, 19.0, 3.0, 52.54, 15.3),
-  'M42': (4.50,  96.0, 63.0, 45.6, 41.61, 36.58, 3.06, 42.0, 1.2, 32.15, 24.0, 4.2, 61.34, 16.3),
-  'M48': (5.00, 108.0, 72.0, 52.6, 47.61, 41.14, 3.91, 48.0, 1.6, 36.15, 28.0, 4.8, 70.34, 17.5),
-  'M56': (5.50, 124.0, 84.0, 63.0, 55.54, 46.84, 5.95, 56.0, 2.0, 41.15, 34.0, 5.6, 82.26, 19.0),
-  'M64': (6.00, 140.0, 96.0, 71.0, 63.54, 52.54, 5.95, 64.0, 2.0, 46.15, 38.0, 6.4, 94.26, 22.0)
-  }
+iso4762def = FSGetCatalogTable('iso4762def')
 
 # nom length: l_min, l_max
-iso4762length = {
-  '2.5':(2.3,  2.7),
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '14':(13.65, 14.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '75':(74.4, 75.6),
-  '80':(79.4, 80.6),
-  '100':(99.3, 100.7),
-  '110':(109.3, 110.7),
-  '120':(119.3, 120.7),
-  '130':(129.2, 130.8),
-  '140':(139.2, 130.8),
-  '150':(149.2, 150.8),
-  '160':(159.2, 160.8),
-  '180':(179.2, 180.8),
-  '200':(199.1, 200.9),
-  '220':(219.1, 220.9),
-  '240':(237.7, 242.3),
-  '260':(219.1, 220.9),
-  '280':(219.1, 220.9),
-  '300':(219.1, 220.9)
-  }
+iso4762length = FSGetCatalogTable('iso4762length')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso4762range = {
-  'M1.6':('2.5', '16'),
-  'M2':  ('3', '20'),
-  'M2.5':('4', '25'),
-  'M3':  ('5', '30'),
-  '(M3.5)':('6', '35'),
-  'M4':  ('6', '40'),
-  'M5':  ('8', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '80'),
-  'M10':('16', '100'),
-  'M12':('20', '120'),
-  '(M14)':('25', '140'),
-  'M16':('25', '160'),
-  'M20':('16', '100'),
-  'M24':('40', '200'),
-  'M30':('45', '200'),
-  'M36':('55', '200'),
-  'M42':('60', '300'),
-  'M48':('100','300'),
-  'M56':('110','300'),
-  'M64':('120','300')
-  }
+iso4762range = FSGetCatalogTable('iso4762range')
 
 # DIN 7984 Hexagon socket head cap screws with low head
 # DIN 7984 definitions
 #
 # P,   b,  dk_max,  da,  ds_min,   e,   k,   r,   s_mean, t,    v,   dw
-din7984def = {
-  'M3':    (0.50,   12,  5.5,  3.6,  2.86,  2.30,  2.0, 0.10,  2.0,  1.5,  0.3,  4.84),
-  'M4':    (0.70,   14,  7.0,  4.7,  3.82,  2.87,  2.8, 0.20,  2.5,  2.3,  0.4,  6.20),
-  'M5':    (0.80,   16,  8.5,  5.7,  4.82,  3.44,  3.5, 0.20,  3.0,  2.7,  0.5,  7.70),
-  'M6':    (1.00,   18, 10.0,  6.8,  5.82,  4.58,  4.0, 0.25,  4.0,  3.0,  0.6,  9.20),
-  'M8':    (1.25,   22, 13.0,  9.2,  7.70,  5.72,  5.0, 0.40,  5.0,  3.8,  0.8, 12.03),
-  'M10':   (1.50,   26, 16.0, 11.2,  9.78,  8.01,  6.0, 0.40,  7.0,  4.5,  1.0, 15.03),
-  'M12':   (1.75,   30, 18.0, 13.7, 11.73,  9.15,  7.0, 0.60,  8.0,  5.0,  1.2, 17.03),
-  '(M14)': (2.00,   34, 21.0, 15.7, 13.73, 11.43,  8.0, 0.60, 10.0,  5.3,  1.4, 19.83),
-  'M16':   (2.00,   38, 24.0, 17.7, 15.73, 13.72,  9.0, 0.60, 12.0,  5.5,  1.6, 22.83),
-  '(M18)': (2.50,   42, 27.0, 20.2, 17.73, 13.72, 10.0, 0.60, 12.0,  6.5,  1.8, 25.83),
-  'M20':   (2.50,   46, 30.0, 22.4, 19.67, 16.00, 11.0, 0.80, 14.0,  7.5,  2.0, 28.83),
-  '(M22)': (2.50,   50, 33.0, 24.4, 21.67, 16.00, 12.0, 0.80, 14.0,  8.0,  2.2, 31.61),
-  'M24':   (3.00,   54, 36.0, 26.4, 23.67, 19.44, 13.0, 0.80, 17.0,  8.0,  2.4, 34.61)
-}
+din7984def = FSGetCatalogTable('din7984def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-din7984range = {
-  'M3':  ('5', '20'),
-  'M4':  ('6', '25'),
-  'M5':  ('8', '30'),
-  'M6': ('10', '40'),
-  'M8': ('12', '60'),
-  'M10':('16', '70'),
-  'M12':('20', '80'),
-  '(M14)':('30','80'),
-  'M16':('30', '80'),
-  '(M18)':('40','100'),
-  'M20':('40','100'),
-  '(M22)':('50','100'),
-  'M24':('50','100')
-  }
-
-din7984length = {
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '90':(89.3, 90.7),
-  '100':(99.3, 100.7)
-  }
+din7984range = FSGetCatalogTable('din7984range')
+
+din7984length = FSGetCatalogTable('din7984length')
 
 # ISO 14579 Hexalobular socket head cap screws
 #   hexalobular recess;    tt = size of hexalobular recess
 
 #           tt,    A,  t_mean
-iso14579def={
-  'M2':  ( 'T6',  1.75, 0.8),
-  'M2.5':( 'T8',  2.40, 1.0),
-  'M3':  ('T10',  2.80, 1.2),
-  'M4':  ('T20',  3.95, 1.7),
-  'M5':  ('T25',  4.50, 1.9),
-  'M6':  ('T30',  5.60, 2.3),
-  'M8':  ('T45',  7.95, 3.2),
-  'M10': ('T50',  8.95, 3.8),
-  'M12': ('T55', 11.35, 5.0),
-  '(M14)': ('T60', 13.45, 5.8),
-  'M16': ('T70', 15.70, 6.8),
-  '(M18)': ('T80', 17.75, 7.8),
-  'M20': ('T90', 20.20, 9.0),
-  }
+iso14579def = FSGetCatalogTable('iso14579def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso14579range = {
-  'M2':  ('3', '20'),
-  'M2.5':('4', '25'),
-  'M3':  ('5', '30'),
-  'M4':  ('6', '40'),
-  'M5':  ('8', '50'),
-  'M6': ('10', '60'),
-  'M8': ('12', '80'),
-  'M10':('16','100'),
-  'M12':('20','120'),
-  '(M14)':('25','140'),
-  'M16':('25','160'),
-  '(M18)':('30','180'),
-  'M20':('30','200'),
-  }
-
-iso14579length = {
-  '3': ( 2.8,  3.2),
-  '4': ( 3.76, 4.24),
-  '5': ( 4.76, 5.24),
-  '6': ( 5.76, 6.24),
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '90':(89.3, 90.7),
-  '100':(99.3, 100.7),
-  '110':(109.3, 110.7),
-  '120':(119.3, 120.7),
-  '130':(129.2, 130.8),
-  '140':(139.2, 130.8),
-  '150':(149.2, 150.8),
-  '160':(159.2, 160.8),
-  '180':(179.2, 180.8),
-  '200':(199.1, 200.9)
-  }
+iso14579range = FSGetCatalogTable('iso14579range')
+
+iso14579length = FSGetCatalogTable('iso14579length')
 
 
 # ISO 10642 Hexagon socket countersunk head screws ( Allan screw)
 # ISO 10642 definitions
 #           P,   b,  dk_theo, dk_mean,da,  ds_min,   e,  k,   r,   s_mean, t,    w
-iso10642def={
-  'M3':  (0.50, 18.0,  6.72,  6.0,  3.3,  2.86,  2.31, 1.86, 0.1,  2.06,  1.1, 0.25),
-  'M4':  (0.70, 20.0,  8.96,  8.0,  4.4,  3.82,  2.88, 2.48, 0.2,  2.56,  1.5, 0.45),
-  'M5':  (0.80, 22.0, 11.20, 10.0,  5.5,  4.82,  3.45, 3.10, 0.2,  3.06,  1.9, 0.66),
-  'M6':  (1.00, 24.0, 13.44, 12.0,  6.6,  5.82,  4.59, 3.72, 0.25, 4.06,  2.2, 0.70),
-  'M8':  (1.25, 28.0, 17.92, 16.0,  8.54, 7.78,  5.73, 4.96, 0.4,  5.06,  3.0, 1.16),
-  'M10': (1.50, 32.0, 22.40, 20.5, 10.62, 9.78,  6.87, 6.20, 0.4,  6.06,  3.6, 1.62),
-  'M12': (1.75, 36.0, 26.88, 25.0, 13.5, 11.73,  9.15, 7.44, 0.6,  8.07,  4.3, 1.80),
-  '(M14)': (2.00, 40.0, 30.80, 28.4, 15.5, 13.73, 11.43, 8.40, 0.6, 10.07,  4.5, 1.62),
-  'M16': (2.00, 44.0, 33.60, 31.0, 17.5, 15.73, 11.43, 8.80, 0.6, 10.07,  4.8, 2.20),
-  'M20': (2.50, 52.0, 40.32, 38.0, 22.0, 19.67, 13.72, 10.16, 0.8, 12.10,  5.6, 2.20)}
+iso10642def = FSGetCatalogTable('iso10642def')
 
 # range of typical screw lengths
 #    min_length,  max_length
-iso10642range = {
-  'M3':  ('8', '30'),
-  'M4':  ('8', '40'),
-  'M5':  ('8', '50'),
-  'M6':  ('8', '60'),
-  'M8': ('10', '80'),
-  'M10':('12','100'),
-  'M12':('20','100'),
-  '(M14)':('25','100'),
-  'M16':('30','100'),
-  'M20':('35','100'),
-  }
-
-iso10642length = {
-  '8': ( 7.71, 8.29),
-  '10':( 9.71, 10.29),
-  '12':(11.65, 12.35),
-  '16':(15.65, 16.35),
-  '20':(19.58, 20.42),
-  '25':(24.58, 25.42),
-  '30':(29.58, 30.42),
-  '35':(34.5,  35.5),
-  '40':(39.5,  40.5),
-  '45':(44.5,  45.5),
-  '50':(49.5,  50.5),
-  '55':(54.4, 55.6),
-  '60':(59.4, 60.6),
-  '65':(64.4, 65.6),
-  '70':(69.4, 70.6),
-  '80':(79.4, 80.6),
-  '90':(89.3, 90.7),
-  '100':(99.3, 100.7),
-  }
+iso10642range = FSGetCatalogTable('iso10642range')
+
+iso10642length = FSGetCatalogTable('iso10642length')
 
 
 # ISO 7089 definitions  Washer
 #           d1_min, d2_max, h, h_max
-iso7089def={
-  'M1.6':( 1.7,  4.0, 0.3, 0.35),
-  'M2':  ( 2.2,  5.0, 0.3, 0.35),
-  'M2.5':( 2.7,  6.0, 0.5, 0.55),
-  'M3':  ( 3.2,  7.0, 0.5, 0.55),
-  'M4':  ( 4.3,  9.0, 0.8, 0.90),
-  'M5':  ( 5.3, 10.0, 1.0, 1.10),
-  'M6':  ( 6.4, 12.0, 1.6, 1.80),
-  'M8':  ( 8.4, 16.0, 1.6, 1.80),
-  'M10': (10.5, 20.0, 2.0, 2.20),
-  'M12': (13.0, 24.0, 2.5, 2.70),
-  'M16': (17.0, 30.0, 3.0, 3.30),
-  'M20': (21.0, 37.0, 3.0, 3.30),
-  'M24': (25.0, 44.0, 4.0, 4.30),
-  'M30': (31.0, 56.0, 4.0, 4.30),
-  'M36': (37.0, 66.0, 5.0, 5.60),
-  'M42': (45.0, 78.0, 8.0, 9.0),
-  'M48': (52.0, 92.0, 8.0, 9.0),
-  'M56': (62.0,105.0,10.0, 11.0),
-  'M64': (70.0,115.0,10.0, 11.0)
-  }
+iso7089def = FSGetCatalogTable('iso7089def')
 
 
 # ISO 7090 definitions Plain washers, chamfered - Normal series
 # chamfer angle 30° / 45°
 # chamfer      h/4 / h/2
 #           d1_min, d2_max, h, h_max
-iso7090def={
-  'M5':  ( 5.3, 10.0, 1.0, 1.10),
-  'M6':  ( 6.4, 12.0, 1.6, 1.80),
-  'M8':  ( 8.4, 16.0, 1.6, 1.80),
-  'M10': (10.5, 20.0, 2.0, 2.20),
-  'M12': (13.0, 24.0, 2.5, 2.70),
-  'M16': (17.0, 30.0, 3.0, 3.30),
-  'M20': (21.0, 37.0, 3.0, 3.30),
-  'M24': (25.0, 44.0, 4.0, 4.30),
-  'M30': (31.0, 56.0, 4.0, 4.30),
-  'M36': (37.0, 66.0, 5.0, 5.60),
-  'M42': (45.0, 78.0, 8.0, 9.0),
-  'M48': (52.0, 92.0, 8.0, 9.0),
-  'M56': (62.0,105.0,10.0, 11.0),
-  'M64': (70.0,115.0,10.0, 11.0)
-  }
+iso7090def = FSGetCatalogTable('iso7090def')
 
 
 # ISO 7091 definitions  Plain washer - Normal series Product Grade C
 #           d1_min, d2_max, h, h_max
-iso7091def={
-  'M1.6':( 1.8,  4.0, 0.3, 0.35),
-  'M2':  ( 2.4,  5.0, 0.3, 0.35),
-  'M2.5':( 2.9,  6.0, 0.5, 0.55),
-  'M3':  ( 3.4,  7.0, 0.5, 0.55),
-  'M4':  ( 4.5,  9.0, 0.8, 0.90),
-  'M5':  ( 5.5, 10.0, 1.0, 1.10),
-  'M6':  ( 6.6, 12.0, 1.6, 1.80),
-  'M8':  ( 9.0, 16.0, 1.6, 1.80),
-  'M10': (11.0, 20.0, 2.0, 2.20),
-  'M12': (13.5, 24.0, 2.5, 2.70),
-  'M16': (17.5, 30.0, 3.0, 3.30),
-  'M20': (22.0, 37.0, 3.0, 3.30),
-  'M24': (26.0, 44.0, 4.0, 4.30),
-  'M30': (33.0, 56.0, 4.0, 4.30),
-  'M36': (39.0, 66.0, 5.0, 5.60),
-  'M42': (45.0, 78.0, 8.0, 9.0),
-  'M48': (52.0, 92.0, 8.0, 9.0),
-  'M56': (62.0,105.0,10.0, 11.0),
-  'M64': (70.0,115.0,10.0, 11.0)
-  }
+iso7091def = FSGetCatalogTable('iso7091def')
 
 
 # ISO 7092 definitions  Plain washers - Small series
 #           d1_min, d2_max, h, h_max
-iso7092def={
-  'M1.6':( 1.7,  3.5, 0.3, 0.35),
-  'M2':  ( 2.2,  4.5, 0.3, 0.35),
-  'M2.5':( 2.7,  5.0, 0.5, 0.55),
-  'M3':  ( 3.2,  6.0, 0.5, 0.55),
-  'M4':  ( 4.3,  8.0, 0.5, 0.55),
-  'M5':  ( 5.3,  9.0, 1.0, 1.10),
-  'M6':  ( 6.4, 11.0, 1.6, 1.80),
-  'M8':  ( 8.4, 15.0, 1.6, 1.80),
-  'M10': (10.5, 18.0, 1.6, 1.80),
-  'M12': (13.0, 20.0, 2.0, 2.20),
-  'M16': (17.0, 28.0, 2.5, 2.70),
-  'M20': (21.0, 34.0, 3.0, 3.30),
-  'M24': (25.0, 39.0, 4.0, 4.30),
-  'M30': (31.0, 50.0, 4.0, 4.30),
-  'M36': (37.0, 60.0, 5.0, 5.60)
-  }
+iso7092def = FSGetCatalogTable('iso7092def')
 
 
 
 # ISO 7093-1 definitions  Plain washers - Large series
 #           d1_min, d2_max, h, h_max
-iso7093def={
-  'M3':    ( 3.2,  9.0, 0.8, 0.90),
-  '(M3.5)':( 3.7, 11.0, 0.8, 0.90),
-  'M4':    ( 4.3, 12.0, 1.0, 1.10),
-  'M5':    ( 5.3, 15.0, 1.0, 1.10),
-  'M6':    ( 6.4, 18.0, 1.6, 1.80),
-  'M8':    ( 8.4, 24.0, 2.0, 2.20),
-  'M10':   (10.5, 30.0, 2.5, 2.70),
-  'M12':   (13.0, 37.0, 3.0, 3.30),
-  '(M14)': (15.0, 44.0, 3.0, 3.30),
-  'M16':   (17.0, 50.0, 3.0, 3.30),
-  '(M18)': (19.0, 56.0, 4.0, 4.30),
-  'M20':   (21.0, 60.0, 4.0, 4.30),
-  '(M22)': (23.0, 66.0, 5.0, 5.60),
-  'M24':   (25.0, 72.0, 5.0, 5.60),
-  '(M27)': (30.0, 85.0, 6.0, 6.60),
-  'M30':   (33.0, 92.0, 6.0, 6.60),
-  '(M33)': (36.0,105.0, 6.0, 6.60),
-  'M36':   (39.0,110.0, 8.0, 9.00)
-  }
+iso7093def = FSGetCatalogTable('iso7093def')
 
 
 # ISO 7094 definitions  Plain washers - Extra large series
 #           d1_min, d2_max, h, h_max
-iso7094def={
-  'M5':    ( 5.5, 18.0, 2.0, 2.3),
-  'M6':    ( 6.6, 22.0, 2.0, 2.3),
-  'M8':    ( 9.0, 28.0, 3.0, 3.6),
-  'M10':   (11.0, 34.0, 3.0, 3.6),
-  'M12':   (13.5, 44.0, 4.0, 4.6),
-  '(M14)': (15.5, 50.0, 4.0, 4.6),
-  'M16':   (17.5, 56.0, 5.0, 6.0),
-  '(M18)': (20.0, 60.0, 5.0, 6.0),
-  'M20':   (22.0, 72.0, 6.0, 7.0),
-  '(M22)': (24.0, 80.0, 6.0, 7.0),
-  'M24':   (26.0, 85.0, 6.0, 7.0),
-  '(M27)': (30.0, 98.0, 6.0, 7.0),
-  'M30':   (33.0,105.0, 6.0, 7.0),
-  '(M33)': (36.0,115.0, 8.0, 9.2),
-  'M36':   (39.0,125.0, 8.0, 9.2)
-  }
+iso7094def = FSGetCatalogTable('iso7094def')
 
 
 
 
 # ISO 4757:1983 Definition of cross recess type H
 #          b, e_min, g, f_mean, r, t1, alpha, beta
-iso4757def = {
-  '0': (0.61, 0.26, 0.81, 0.34, 0.3, 0.22, 138.0, 7.0 ),
-  '1': (0.97, 0.41, 1.27, 0.54, 0.5, 0.34, 138.0, 7.0 ),
-  '2': (1.47, 0.79, 2.29, 0.70, 0.6, 0.61, 140.0, 5.75),
-  '3': (2.41, 1.98, 3.81, 0.83, 0.8, 1.01, 146.0, 5.75),
-  '4': (3.48, 2.39, 5.08, 1.23, 1.0, 1.35, 153.0, 7.0 )
-  }
+iso4757def = FSGetCatalogTable('iso4757def')
 
 # ISO 10664 Hexalobular internal driving feature for bolts and screws
 #           A,     B,   Re
-iso10664def = {
-  'T6': ( 1.75,  1.205, 0.14),
-  'T8': ( 2.40,  1.67, 0.20),
-  'T10':( 2.80,  1.98, 0.24),
-  'T15':( 3.35,  2.35, 0.28),
-  'T20':( 3.95,  2.75, 0.32),
-  'T25':( 4.50,  3.16, 0.39),
-  'T30':( 5.60,  3.95, 0.46),
-  'T40':( 6.75,  4.76, 0.56),
-  'T45':( 7.93,  5.55, 0.59),
-  'T50':( 8.95,  6.36, 0.78),
-  'T55':(11.35,  7.92, 0.77),
-  'T60':(13.45,  9.48, 1.07),
-  'T70':(15.70, 11.08, 1.20),
-  'T80':(17.75, 12.64, 1.53),
-  'T90':(20.20, 14.22, 1.54),
-  'T100':(22.40,15.81, 1.73)
-  }
+iso10664def = FSGetCatalogTable('iso10664def')
 
 
 
 # ISO 4032 Hex-head-nut
 #           P,   c,  damax, dw,    e,     m,  mw,  s_nom
-iso4032def={
-  'M1.6':  (0.35, 0.2, 1.84, 2.9,  3.4,   1.3, 0.8,  3.2),
-  'M2':    (0.40, 0.2, 2.3,  3.7,  4.4,   1.6, 1.1,  4.0),
-  'M2.5':  (0.45, 0.2, 2.9,  4.6,  5.5,   2.0, 1.4,  5.0),
-  'M3':    (0.5,  0.2, 3.45, 5.2,  6.1,   2.4, 1.7,  5.5),
-  '(M3.5)':(0.6,  0.2, 4.00, 5.7,  6.6,   2.8, 2.0,  6.0),
-  'M4':    (0.7,  0.2, 4.6,  6.6,  7.7,   3.2, 2.3,  7.0),
-  'M5':    (0.8,  0.2, 5.75, 7.5,  8.9,   3.5, 3.5,  8.0),
-  'M6':    (1.0,  0.2, 6.75, 9.5,  11.05, 4.7, 3.9, 10.0),
-  'M8':    (1.25, 0.3, 8.75, 11.7, 14.5,  6.8, 5.2, 13.0),
-  'M10':   (1.50, 0.3, 10.8, 14.7, 17.9,  8.4, 6.4,  16.0),
-  'M12':   (1.75, 0.3, 13.0, 16.7, 20.1, 10.8, 8.3,  18.0),
-  '(M14)': (2.00, 0.3, 15.1, 20.5, 24.5, 12.8, 9.7,  22.0),
-  'M16':   (2.00, 0.4, 17.3, 22.4, 26.9, 14.8, 11.3,  24.0),
-  '(M18)': (2.50, 0.4, 19.5, 24.9, 29.6, 15.8, 12.3,  27.0),
-  'M20':   (2.50, 0.4, 21.6, 28.2, 33.7, 18.0, 13.5,  30.0),
-  '(M22)': (2.50, 0.4, 23.7, 31.4, 37.3, 19.4, 15.0,  34.0),
-  'M24':   (3.00, 0.4, 25.9, 33.7, 40.1, 21.5, 16.2,  36.0),
-  '(M27)': (3.00, 0.4, 29.1, 38.0, 45.2, 23.8, 18.0,  41.0),
-  'M30':   (3.50, 0.4, 32.4, 42.8, 50.9, 25.6, 19.4,  46.0),
-  '(M33)': (3.50, 0.4, 35.6, 46.6, 55.4, 28.7, 21.4,  50.0),
-  'M36':   (4.00, 0.4, 38.9, 51.2, 61.0, 31.0, 23.5,  55.0),
-  '(M39)': (4.00, 0.5, 42.1, 55.9, 66.5, 33.4, 24.5,  60.0),
-  'M42':   (4.50, 0.7, 45.4, 60.0, 71.3, 34.0, 25.9,  65.0),
-  '(M45)': (4.50, 0.7, 48.6, 64.7, 77.0, 36.0, 27.9,  70.0),
-  'M48':   (5.00, 0.7, 51.8, 69.5, 82.6, 38.0, 29.1,  75.0),
-  '(M52)': (5.00, 0.7, 56.2, 74.5, 88.3, 42.0, 32.1,  80.0),
-  'M56':   (5.50, 0.7, 60.5, 78.7, 93.6, 45.0, 34.7,  85.0),
-  '(M60)': (5.50, 0.7, 64.8, 82.7, 99.2, 48.0, 38.7,  90.0),
-  'M64':   (6.00, 0.7, 69.1, 88.2,104.9, 51.0, 39.3,  95.0)
-  }
+iso4032def = FSGetCatalogTable('iso4032def')
 
 
 
 # ISO 4033 Hexagon nuts style 2
 #           P,   c,  damax, dw,    e,     m,  mw,  s_nom
-iso4033def={
-  'M5':    (0.8,  0.2, 5.75, 7.5,  8.9,   5.1, 3.5,  8.0),
-  'M6':    (1.0,  0.2, 6.75, 9.5,  11.05, 5.7, 3.9, 10.0),
-  'M8':    (1.25, 0.3, 8.75, 11.7, 14.5,  7.5, 5.2, 13.0),
-  'M10':   (1.50, 0.3, 10.8, 14.7, 17.9,  9.3, 6.4,  16.0),
-  'M12':   (1.75, 0.3, 13.0, 16.7, 20.1, 12.0, 8.3,  18.0),
-  '(M14)': (2.00, 0.3, 15.1, 20.5, 24.5, 14.1, 9.7,  22.0),
-  'M16':   (2.00, 0.4, 17.3, 22.4, 26.9, 16.4, 11.3,  24.0),
-  'M20':   (2.50, 0.4, 21.6, 28.2, 33.7, 20.3, 13.5,  30.0),
-  'M24':   (3.00, 0.4, 25.9, 33.7, 40.1, 23.9, 16.2,  36.0),
-  'M30':   (3.50, 0.4, 32.4, 42.8, 50.9, 28.6, 19.4,  46.0),
-  'M36':   (4.00, 0.4, 38.9, 51.2, 61.0, 33.1, 23.5,  55.0)
-  }
+iso4033def = FSGetCatalogTable('iso4033def')
 
 
 
@@ -1517,37 +437,7 @@ iso4033def={
 
 # ISO 4035 Hexagon thin nuts, chamfered
 #           P,   c,  damax, dw,    e,     m,  mw,  s_nom
-iso4035def={
-  'M1.6':  (0.35, 0.2, 1.84, 2.9,  3.4,   1.0,  0.8,  3.2),
-  'M2':    (0.40, 0.2, 2.3,  3.7,  4.4,   1.2,  1.1,  4.0),
-  'M2.5':  (0.45, 0.2, 2.9,  4.6,  5.5,   1.6,  1.4,  5.0),
-  'M3':    (0.5,  0.2, 3.45, 5.2,  6.1,   1.8,  1.7,  5.5),
-  '(M3.5)':(0.6,  0.2, 4.00, 5.7,  6.6,   2.0,  2.0,  6.0),
-  'M4':    (0.7,  0.2, 4.6,  6.6,  7.7,   2.2,  2.3,  7.0),
-  'M5':    (0.8,  0.2, 5.75, 7.5,  8.9,   2.7,  3.5,  8.0),
-  'M6':    (1.0,  0.2, 6.75, 9.5,  11.05, 3.2,  3.9, 10.0),
-  'M8':    (1.25, 0.3, 8.75, 11.7, 14.5,  4.0,  5.2, 13.0),
-  'M10':   (1.50, 0.3, 10.8, 14.7, 17.9,  5.0,  6.4, 16.0),
-  'M12':   (1.75, 0.3, 13.0, 16.7, 20.1,  6.0,  8.3, 18.0),
-  '(M14)': (2.00, 0.3, 15.1, 20.5, 24.5,  7.0,  9.7, 22.0),
-  'M16':   (2.00, 0.4, 17.3, 22.4, 26.9,  8.0, 11.3, 24.0),
-  '(M18)': (2.50, 0.4, 19.5, 24.9, 29.6,  9.0, 12.3, 27.0),
-  'M20':   (2.50, 0.4, 21.6, 28.2, 33.7, 10.0, 13.5, 30.0),
-  '(M22)': (2.50, 0.4, 23.7, 31.4, 37.3, 11.0, 15.0, 34.0),
-  'M24':   (3.00, 0.4, 25.9, 33.7, 40.1, 12.0, 16.2, 36.0),
-  '(M27)': (3.00, 0.4, 29.1, 38.0, 45.2, 13.5, 18.0, 41.0),
-  'M30':   (3.50, 0.4, 32.4, 42.8, 50.9, 15.0, 19.4, 46.0),
-  '(M33)': (3.50, 0.4, 35.6, 46.6, 55.4, 16.5, 21.4, 50.0),
-  'M36':   (4.00, 0.4, 38.9, 51.2, 61.0, 18.0, 23.5, 55.0),
-  '(M39)': (4.00, 0.5, 42.1, 55.9, 66.5, 19.5, 24.5, 60.0),
-  'M42':   (4.50, 0.7, 45.4, 60.0, 71.3, 21.0, 25.9, 65.0),
-  '(M45)': (4.50, 0.7, 48.6, 64.7, 77.0, 22.5, 27.9, 70.0),
-  'M48':   (5.00, 0.7, 51.8, 69.5, 82.6, 24.0, 29.1, 75.0),
-  '(M52)': (5.00, 0.7, 56.2, 74.5, 88.3, 26.0, 32.1, 80.0),
-  'M56':   (5.50, 0.7, 60.5, 78.7, 93.6, 28.0, 34.7, 85.0),
-  '(M60)': (5.50, 0.7, 64.8, 82.7, 99.2, 30.0, 38.7, 90.0),
-  'M64':   (6.00, 0.7, 69.1, 88.2,104.9, 32.0, 39.3, 95.0)
-  }
+iso4035def = FSGetCatalogTable('iso4035def')
 
 
 
@@ -1556,63 +446,18 @@ iso4035def={
 
 # ISO 4036 Hexagon thin nuts, unchamfered
 #           P,      e,   m,  s_nom
-iso4036def={
-  'M1.6':  (0.35,  3.4, 1.0,  3.2),
-  'M2':    (0.40,  4.4, 1.2,  4.0),
-  'M2.5':  (0.45,  5.5, 1.6,  5.0),
-  'M3':    (0.5,   6.1, 1.8,  5.5),
-  '(M3.5)':(0.6,   6.6, 2.0,  6.0),
-  'M4':    (0.7,   7.7, 2.2,  7.0),
-  'M5':    (0.8,   8.9, 2.7,  8.0),
-  'M6':    (1.0,  10.9, 3.2, 10.0),
-  'M8':    (1.25, 14.5, 4.0, 13.0),
-  'M10':   (1.50, 17.9, 5.0, 16.0)}
+iso4036def = FSGetCatalogTable('iso4036def')
 
 
 
 # EN 1661 Hexagon nuts with flange
 #          P,    damax,  c,  dc,    dw,    e,     m,   mw,   r,   s
-en1661def={
-  'M5'   :(0.80,  5.75, 1.0, 11.8,  9.8,  8.79,  5.0, 2.5,  0.30,  8.0),
-  'M6'   :(1.00,  6.75, 1.1, 14.2, 12.2, 11.05,  6.0, 3.1,  0.36, 10.0),
-  'M8'   :(1.25,  8.75, 1.2, 17.9, 15.8, 14.38,  8.0, 4.6,  0.48, 13.0),
-  'M10'  :(1.50, 10.80, 1.5, 21.8, 19.6, 17.77, 10.0, 5.9,  0.60, 16.0),
-  'M12'  :(1.75, 13.00, 1.8, 26.0, 23.8, 20.03, 12.0, 6.8,  0.72, 18.0),
-  '(M14)':(2.00, 15.10, 2.1, 29.9, 27.6, 23.36, 14.0, 7.7,  0.88, 21.0),
-  'M16'  :(2.00, 17.30, 2.4, 34.5, 31.9, 26.75, 16.0, 8.9,  0.96, 24.0),
-  'M20'  :(2.50, 21.60, 3.0, 42.8, 39.9, 33.23, 20.0,10.7,  1.20, 30.0)}
+en1661def = FSGetCatalogTable('en1661def')
 
 
 # Tuning table to get valid shapes
 #         P, tunIn, tunEx
-tuningTable={
-  'M1.6':(0.35, 516, 516),
-  'M2':  (0.40, 515, 516),
-  'M2.5':(0.45, 515, 515),
-  'M3':  (0.5,  480, 502),
-  '(M3.5)':(0.6,  480, 502),
-  'M4':  (0.7,  510, 519), #last value needed for ISO7380
-  'M5':  (0.8,  510, 510),
-  'M6':  (1.0,  515, 515),
-  'M8':  (1.25, 516, 516),
-  'M10': (1.50, 515, 515),
-  'M12': (1.75, 513, 513),
-  '(M14)': (2.00, 513, 513),
-  'M16': (2.00, 513, 513),
-  'M20': (2.50, 513, 513),
-  'M24': (3.00, 513, 513),
-  '(M27)': (3.00, 513, 513),
-  'M30': (3.50, 513, 513),
-  '(M33)': (3.50, 513, 513),
-  'M36': (4.00, 513, 513),
-  'M42': (4.50, 515, 515),
-  '(M45)': (4.50, 515, 515),
-  'M48': (5.00, 515, 505), # ISO4014: 505, 502 or 488; ISO4017: above 505
-  '(M52)': (5.00, 508, 508),
-  'M56': (5.50, 508, 508),
-  '(M60)': (5.50, 508, 508),
-  'M64': (6.00, 489, 489) # Nut ISO4032: 489
-  }
+tuningTable = FSGetCatalogTable('tuningTable')
 
 
 
@@ -1896,14 +741,91 @@ class Ui_ScrewMaker(object):
 
 
 
-
-
+class PartCache(object):
+  '''Least recently used cache of intermediate shapes with an entry limit.
+     Lookups with "in" are counted as hits or misses'''
+  def __init__(self, maxEntries):
+    self.items = collections.OrderedDict()
+    self.maxEntries = maxEntries
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def __contains__(self, key):
+    if key in self.items:
+      self.hits += 1
+      return True
+    self.misses += 1
+    return False
+
+  def __len__(self):
+    return len(self.items)
+
+  def __getitem__(self, key):
+    value = self.items.pop(key)
+    self.items[key] = value # mark as most recently used
+    return value
+
+  def __setitem__(self, key, value):
+    self.items.pop(key, None)
+    self.items[key] = value
+    self.evict()
+
+  def setLimit(self, maxEntries):
+    self.maxEntries = maxEntries
+    self.evict()
+
+  # the most recent entry is always kept
+  def evict(self):
+    while len(self.items) > max(self.maxEntries, 1):
+      self.items.popitem(False)
+      self.evictions += 1
+
+  def clear(self):
+    self.items.clear()
+
+  def stats(self):
+    return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+        'entries': len(self.items), 'maxEntries': self.maxEntries}
+
+# thread geometry that does not depend on the fastener length, shared by all
+# screws of the same diameter, pitch and tuner value
+ThreadCache = PartCache(500)
+
+# cutting tools for heads and recesses, keyed by tool type and parameters.
+# the tools don't depend on the tuner or the thread scaling
+ToolCache = PartCache(500)
+
+# recess faces of screw heads, keyed by standard and size
+HeadCache = PartCache(500)
+
+# helix radius tuning of the thread sweeps (per mille of the diameter) for outer
+# and inner threads, keyed by diameter and pitch. made by FSCalibrateTuner.py,
+# sizes that are not in the table use Screw.Tuner
+TunerTableFile = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'FSTunerTable.json')
+TunerTable = None
+
+def getTunerTable():
+  global TunerTable
+  if TunerTable == None:
+    TunerTable = {'outer': {}, 'inner': {}}
+    try:
+      with open(TunerTableFile) as f:
+        TunerTable.update(json.load(f))
+    except Exception:
+      FreeCAD.Console.PrintWarning("Failed reading thread tuner table: " + TunerTableFile + "\n")
+  return TunerTable
+
+def tunerKey(d, P):
+  return '%g:%g' % (d, P)
 
 
 class Screw(object):
   def __init__(self):
     self.objAvailable = True
     self.Tuner = 510
+    # use Tuner for all threads instead of the tuner table
+    self.fixedTuner = False
     # thread scaling for 3D printers
     # scaled_diam = diam * ScaleA + ScaleB
     self.sm3DPrintMode = False
@@ -1911,198 +833,39 @@ class Screw(object):
     self.smNutThrScaleB = 0.0
     self.smScrewThrScaleA = 1.0
     self.smScrewThrScaleB = 0.0
+    # real thread construction: 'sweep' or 'ruled'
+    self.smThreadEngine = 'sweep'
+
+  # settings from a cache key fingerprint: the four 3D print scaling values
+  # when 3D print mode is on, followed by the thread engine if not 'sweep'
+  def applySettings(self, fingerprint):
+    fingerprint = list(fingerprint or [])
+    self.smThreadEngine = 'sweep'
+    if len(fingerprint) > 0 and fingerprint[-1] == 'ruled':
+      self.smThreadEngine = fingerprint.pop()
+    self.sm3DPrintMode = len(fingerprint) == 4
+    if self.sm3DPrintMode:
+      self.smScrewThrScaleA, self.smScrewThrScaleB, self.smNutThrScaleA, self.smNutThrScaleB = fingerprint
 
   def check_Data(self, ST_text, ND_text, NL_text):
     #FreeCAD.Console.PrintMessage("Data checking" + NL_text + "\n")
     #set screw not ok
     self.objAvailable = False
     M_text = "Select your screw type"
-    Type_text = ''
-    if ST_text == 'ISO4017':
-      table = iso4017head
-      tab_len = iso4017length
-      tab_range = iso4017range
-      Type_text = 'Screw'
-
-    if ST_text == 'EN1662':
-      table = en1662def
-      tab_len = en1662length
-      tab_range = en1662range
-      Type_text = 'Screw'
-
-    if ST_text == 'EN1665':
-      table = en1665def
-      tab_len = en1665length
-      tab_range = en1665range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO2009':
-      table = iso2009def
-      tab_len = iso2009length
-      tab_range = iso2009range
-      Type_text = 'Screw'
-    if ST_text == 'ISO2010':
-      table = iso2009def
-      tab_len = iso2009length
-      tab_range = iso2009range
-      Type_text = 'Screw'
-    if ST_text == 'ISO4762':
-      table = iso4762def
-      tab_len = iso4762length
-      tab_range = iso4762range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO10642':
-      table = iso10642def
-      tab_len = iso10642length
-      tab_range = iso10642range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO4014':
-      table = iso4014head
-      tab_len = iso4014length
-      tab_range = iso4014range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO1207':
-      table = iso1207def
-      tab_len = iso1207length
-      tab_range = iso1207range
-      Type_text = 'Screw'
-    if ST_text == 'ISO1580':
-      table = iso1580def
-      tab_len = iso2009length
-      tab_range = iso2009range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO7045':
-      table = iso7045def
-      tab_len = iso7045length
-      tab_range = iso7045range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO7046':
-      table = iso7046def  # contains only cross recess data
-      tab_len = iso7045length
-      tab_range = iso7046range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO7047':
-      table = iso2009def
-      tab_len = iso7045length
-      tab_range = iso7046range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO7048':
-      table = iso7048def
-      tab_len = iso7048length
-      tab_range = iso7048range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO7380-1':
-      table = iso7380def
-      tab_len = iso7380length
-      tab_range = iso7380range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO7380-2':
-      table = iso7380_2def
-      tab_len = iso7380length
-      tab_range = iso7380range
-      Type_text = 'Screw'
-
-    if ST_text == 'DIN967':
-      table = din967def
-      tab_len = din967length
-      tab_range = din967range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO14579':
-      table = iso14579def
-      tab_len = iso14579length
-      tab_range = iso14579range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO14580':
-      table = iso14580def
-      tab_len = iso14580length
-      tab_range = iso1207range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO14583':
-      table = iso14583def
-      tab_len = iso7045length
-      tab_range = iso7046range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO14584':
-      table = iso14584def
-      tab_len = iso7045length
-      tab_range = iso14584range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO14582':
-      table = iso14582def
-      tab_len = iso14582length
-      tab_range = iso14582range
-      Type_text = 'Screw'
-
-    if ST_text == 'ISO7089':
-      table = iso7089def
-      Type_text = 'Washer'
-
-    if ST_text == 'ISO7090':
-      table = iso7090def
-      Type_text = 'Washer'
-
-    if ST_text == 'ISO7091':
-      table = iso7091def
-      Type_text = 'Washer'
-
-    if ST_text == 'ISO7092':
-      table = iso7092def
-      Type_text = 'Washer'
-
-    if ST_text == 'ISO7093-1':
-      table = iso7093def
-      Type_text = 'Washer'
-
-    if ST_text == 'ISO7094':
-      table = iso7094def
-      Type_text = 'Washer'
-
-    if ST_text == 'ISO4032':
-      table = iso4032def
-      Type_text = 'Nut'
-
-    if ST_text == 'ISO4033':
-      table = iso4033def
-      Type_text = 'Nut'
-
-    if ST_text == 'ISO4035':
-      table = iso4035def
-      Type_text = 'Nut'
-
-    if ST_text == 'ISO4036':
-      table = iso4036def
-      Type_text = 'Nut'
-
-    if ST_text == 'EN1661':
-      table = en1661def
-      Type_text = 'Nut'
-
-    if ST_text == 'DIN7984':
-      table = din7984def
-      tab_len = din7984length
-      tab_range = din7984range
-      Type_text = 'Screw'
-
-    if ST_text == 'ScrewTap':
-      table = tuningTable
-      Type_text = 'Screw-Tap'
+    if not(ST_text in ScrewStandards):
+      return M_text, self.objAvailable
+    std = ScrewStandards[ST_text]
+    table = std.table
+    tab_len = std.lengths
+    tab_range = std.ranges
+    Type_text = ScrewKindLabels.get(std.kind, std.kind)
 
     if ND_text not in table:
-       ND_min, ND_max = standard_diameters[ST_text]
+       if ST_text in standard_diameters:
+         ND_min, ND_max = standard_diameters[ST_text]
+       else:
+         diams = sorted(table, key = lambda m: float(m.lstrip('(M').rstrip(')')))
+         ND_min, ND_max = diams[0], diams[-1]
        M_text = ST_text+' has diameters from '+ ND_min +' to ' + ND_max + ' and not ' + ND_text +'!'
        self.objAvailable = False
        # set scew not ok
@@ -2161,6 +924,9 @@ class Screw(object):
       self.rThread = True
     else:
       self.rThread = False
+    self.symThread = threadType == 'symbol'
+    # set by the builders: diameter, pitch and start and end depth of the thread
+    self.threadInfo = None
 
     if self.objAvailable:
       try:
@@ -2177,77 +943,7 @@ class Screw(object):
         #ST_text = ST_text.split(':')[0]
         #dia = float(ND_text.lstrip('M'))
         l = float(NL_text)
-        if ST_text == 'ISO4017':
-           table = iso4017head
-        if ST_text == 'ISO4014':
-           table = iso4014head
-        if ST_text == 'EN1662':
-           table = en1662def
-        if ST_text == 'EN1665':
-           table = en1665def
-        if ST_text == 'ISO2009':
-           table = iso2009def
-        if ST_text == 'ISO2010':
-           table = iso2009def
-        if ST_text == 'ISO4762':
-           table = iso4762def
-        if ST_text == 'ISO10642':
-           table = iso10642def
-        if ST_text == 'ISO1207':
-           table = iso1207def
-        if ST_text == 'ISO1580':
-           table = iso1580def
-        if ST_text == 'ISO7045':
-           table = iso7045def
-        if ST_text == 'ISO7046':
-           table = iso7045def
-        if ST_text == 'ISO7047':
-           table = iso7045def
-        if ST_text == 'ISO7048':
-           table = iso7048def
-        if ST_text == 'ISO7380-1':
-           table = iso7380def
-        if ST_text == 'ISO7380-2':
-           table = iso7380_2def
-        if ST_text == 'DIN967':
-           table = din967def
-        if ST_text == 'ISO14579':
-           table = iso14579def
-        if ST_text == 'ISO14580':
-           table = iso14580def
-        if ST_text == 'ISO14582':
-           table = iso14582def
-        if ST_text == 'ISO14583':
-           table = iso14583def
-        if ST_text == 'ISO14584':
-           table = iso14584def
-        if ST_text == 'ISO7089':
-           table = iso7089def
-        if ST_text == 'ISO7090':
-           table = iso7090def
-        if ST_text == 'ISO7091':
-           table = iso7091def
-        if ST_text == 'ISO7092':
-           table = iso7092def
-        if ST_text == 'ISO7093-1':
-           table = iso7093def
-        if ST_text == 'ISO7094':
-           table = iso7094def
-        if ST_text == 'ISO4032':
-           table = iso4032def
-        if ST_text == 'ISO4033':
-           table = iso4033def
-        if ST_text == 'ISO4035':
-           table = iso4035def
-        if ST_text == 'ISO4036':
-           table = iso4036def
-        if ST_text == 'EN1661':
-           table = en1661def
-        if ST_text == 'DIN7984':
-           table = din7984def
-        if ST_text == 'ScrewTap':
-           table = tuningTable
-        if ND_text not in table:
+        if ST_text in ScrewStandards and not(ND_text in ScrewStandards[ST_text].table):
            FreeCAD.Console.PrintMessage("Combination of type "+ST_text \
               + " and diameter " + ND_text +" not available!" + "\n")
         #self.MessageLabel.setText(_translate("ScrewMaker", "not implemented", None))
@@ -2257,59 +953,12 @@ class Screw(object):
         FreeCAD.Console.PrintMessage("Error! nom_dia and length values must be valid numbers!\n")
       else:
         doc=FreeCAD.activeDocument()
-        done = False
-        if (ST_text == 'ISO4014') or (ST_text == 'ISO4017'):
-          screw = self.makeIso4017_2(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'EN1662') or (ST_text == 'EN1665'):
-          screw = self.makeEN1662_2(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'ISO2009') or (ST_text == 'ISO2010') or (ST_text == 'ISO1580'):
-          screw = self.makeSlottedScrew(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'ISO4762') or (ST_text == 'ISO14579') or (ST_text == 'DIN7984'):
-          screw = self.makeIso4762(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'ISO1207') or (ST_text == 'ISO14580') or (ST_text == 'ISO7048'):
-          screw = self.makeIso1207(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'ISO7045') or (ST_text == 'ISO14583'):
-          screw = self.makeIso7045(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'ISO7046') or (ST_text == 'ISO7047') or \
-          (ST_text == 'ISO14582') or (ST_text == 'ISO14584') or (ST_text == 'ISO10642'):
-          screw = self.makeIso7046(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'ISO7380-1') or (ST_text == 'ISO7380-2') or (ST_text == 'DIN967'):
-          screw = self.makeIso7380(ST_text, ND_text,l)
-          Type_text = 'Screw'
-          done = True
-        if (ST_text == 'ISO7089') or (ST_text == 'ISO7090') or (ST_text == 'ISO7093-1') or \
-          (ST_text == 'ISO7091') or (ST_text == 'ISO7092') or (ST_text == 'ISO7094'):
-          screw = self.makeIso7089(ST_text, ND_text)
-          Type_text = 'Washer'
-          done = True
-        if (ST_text == 'ISO4032') or (ST_text == 'ISO4033') or (ST_text == 'ISO4035'):
-          screw = self.makeIso4032(ST_text, ND_text)
-          Type_text = 'Nut'
-          done = True
-        if ST_text == 'EN1661':
-          screw = self.makeEN1661(ND_text)
-          Type_text = 'Nut'
-          done = True
-        if ST_text == 'ScrewTap':
-          screw = self.makeScrewTap(ND_text,l)
-          Type_text = 'Screw-Tap'
-          done = True
-        if not done:
+        if not(ST_text in ScrewStandards):
           FreeCAD.Console.PrintMessage("No valid Screw Type!" +  "\n")
+          return None
+        std = ScrewStandards[ST_text]
+        screw = std.builder(self, ST_text, ND_text, l)
+        Type_text = ScrewKindLabels.get(std.kind, std.kind)
         if '(' in ND_text:
           ND_text = ND_text.lstrip('(').rstrip(')')
 
@@ -2323,6 +972,10 @@ class Screw(object):
               label = ST_text + '-' + ND_text +'x'+ NL_text +'_'
             else: # washer
               label = ST_text + '-' + ND_text.lstrip('M') +'_'
+        if self.symThread and self.threadInfo != None:
+          screw = self.addThreadSymbol(screw)
+        elif self.symThread:
+          FreeCAD.Console.PrintLog("No thread symbol for " + ST_text + " " + ND_text + ", it has no thread information\n")
         if shapeOnly:
           return screw
         ScrewObj = doc.addObject("Part::Feature")
@@ -2568,6 +1221,7 @@ class Screw(object):
       a_point = l - (turns+2.0) * P
     #halfturns = halfturns + 2
     offSet = headEnd - a_point
+    self.threadInfo = (dia, P, a_point, l)
     PntA = Base.Vector(dia/2.0,0.0,-a_point)        # Start of thread
 
 
@@ -2686,6 +1340,7 @@ class Screw(object):
       a_point = l - (turns+2.0) * P
     #halfturns = halfturns + 2
     offSet = r - a_point
+    self.threadInfo = (dia, P, a_point, l)
     #FreeCAD.Console.PrintMessage("The transition at a: " + str(a) + " turns " + str(turns) + "\n")
 
     sqrt2_ = 1.0/math.sqrt(2.0)
@@ -2773,13 +1428,9 @@ class Screw(object):
 
     if (SType == 'ISO14583'):
       recess, recessShell = self.makeIso10664_3(tt, t_mean, k)
-      recessShell = recessShell.cut(hCut)
-      topFace = hCut.Faces[1]
-      topFace = topFace.cut(recess)
-      #Part.show(topFace)
+      recessFaces = self.cutRecessFaces((SType, ThreadType), recess, recessShell, hCut, hCut.Faces[1])
       #Part.show(recessShell)
       #Part.show(headShell)
-      headFaces.append(topFace.Faces[0])
       #headFaces.append(hCut.Faces[2])
 
     else:
@@ -2792,16 +1443,12 @@ class Screw(object):
 
       #Parameter for cross-recess type H: cT, mH
       recess, recessShell = self.makeCross_H3(cT, mH, hcr)
-      recessShell = recessShell.cut(hCut)
-      topFace = hCut.Faces[0]
-      topFace = topFace.cut(recess)
-      #Part.show(topFace)
+      recessFaces = self.cutRecessFaces((SType, ThreadType), recess, recessShell, hCut, hCut.Faces[0])
       #Part.show(recessShell)
       #Part.show(headShell)
-      headFaces.append(topFace.Faces[0])
 
     #Part.show(hCut)
-    headFaces.extend(recessShell.Faces)
+    headFaces.extend(recessFaces)
 
 
     #if self.RealThread.isChecked():
@@ -2873,6 +1520,7 @@ class Screw(object):
       a_point = l - (turns+2.0) * P
     #halfturns = halfturns + 2
     offSet = r - a_point
+    self.threadInfo = (dia, P, a_point, l)
 
     sqrt2_ = 1.0/math.sqrt(2.0)
 
@@ -2985,10 +1633,7 @@ class Screw(object):
         # hCut should be just a cylinder
         hCut = Part.makeCylinder(fillet_center_x,k,Pnt0)
         recess, recessShell = self.makeCross_H3(cT, mH, k)
-        recessShell = recessShell.cut(hCut)
-        topFace = headShell.Faces[0].cut(recess)
-        screwFaces = [topFace.Faces[0]]
-        screwFaces.extend(recessShell.Faces)
+        screwFaces = self.cutRecessFaces((SType, ThreadType), recess, recessShell, hCut, headShell.Faces[0])
       if (SType == 'ISO14580'):
         # Ring-cutter for recess shell
         PntH2 = Base.Vector(A/8.0,0.0, 2.0*k)
@@ -3001,10 +1646,7 @@ class Screw(object):
         #Part.show(hWire)
 
         recess, recessShell = self.makeIso10664_3(tt, t_min, k)
-        recessShell = recessShell.cut(hCut)
-        topFace = headShell.Faces[0].cut(recess)
-        screwFaces = [topFace.Faces[0]]
-        screwFaces.extend(recessShell.Faces)
+        screwFaces = self.cutRecessFaces((SType, ThreadType), recess, recessShell, hCut, headShell.Faces[0])
 
       for i in range(1, len(headShell.Faces)):
         screwFaces.append(headShell.Faces[i])
@@ -3059,6 +1701,7 @@ class Screw(object):
       a = l - (turns+2.0) * P
     #halfturns = halfturns + 2
     offSet = r - a
+    self.threadInfo = (dia, P, a, l)
 
     sqrt2_ = 1.0/math.sqrt(2.0)
     cham = (e-s)*math.sin(math.radians(15)) # needed for chamfer at head top
@@ -3201,6 +1844,7 @@ class Screw(object):
       a_point = l - (turns+2.0) * P
     #halfturns = halfturns + 2
     offSet = r1 - a_point
+    self.threadInfo = (dia, P, a_point, l)
 
     sqrt2_ = 1.0/math.sqrt(2.0)
 
@@ -3467,6 +2111,7 @@ class Screw(object):
       a_point = l - (turns+2.0) * P
     #halfturns = halfturns + 2
     offSet = k + rtan - a_point
+    self.threadInfo = (dia, P, a_point, l)
 
     #Head Points
     Pnt1 = Base.Vector(dk_mean/2.0,0.0,0.0)
@@ -3583,13 +2228,9 @@ class Screw(object):
       #Part.show(hWire)
       topFace = hCut.Faces[0]
 
-    recessShell = recessShell.cut(hCut)
-    topFace = topFace.cut(recess)
-    #Part.show(topFace)
+    headFaces.extend(self.cutRecessFaces((SType, ThreadType), recess, recessShell, hCut, topFace))
     #Part.show(recessShell)
     #Part.show(headShell)
-    headFaces.append(topFace.Faces[0])
-    headFaces.extend(recessShell.Faces)
 
 
     if (SType == 'ISO10642') or (SType == 'ISO14582'):
@@ -3760,6 +2401,7 @@ class Screw(object):
       a_point = l - (turns+2.0) * P
     #halfturns = halfturns + 2
     offSet = r - a_point
+    self.threadInfo = (dia, P, a_point, l)
     #FreeCAD.Console.PrintMessage("The transition at a: " + str(a) + " turns " + str(turns) + "\n")
 
 
@@ -3842,19 +2484,14 @@ class Screw(object):
     else:
       recess, recessShell = self.makeAllen2(s_mean, t, k )
 
-    recessShell = recessShell.cut(hCut)
-    topFace = hCut.Faces[1]
     #topFace = hCut.Faces[0]
-    topFace = topFace.cut(recess)
-    #Part.show(topFace)
+    headFaces.extend(self.cutRecessFaces((SType, ThreadType), recess, recessShell, hCut, hCut.Faces[1]))
     #Part.show(recessShell)
     #Part.show(headShell)
-    headFaces.append(topFace.Faces[0])
     #headFaces.append(hCut.Faces[2])
 
     #allenscrew = head.cut(recess)
     #Part.show(hCut)
-    headFaces.extend(recessShell.Faces)
 
     #if self.RealThread.isChecked():
     if self.rThread:
@@ -3988,6 +2625,7 @@ class Screw(object):
       halfturns = halfturns + 2
       a_point = l - (turns+2.0) * P
     offSet = r - a_point
+    self.threadInfo = (dia, P, a_point, l)
 
 
     Pnt5 = Base.Vector(dia/2.0+r-r*sqrt2_,0.0,-r+r*sqrt2_) #arc-point of fillet
@@ -4039,13 +2677,9 @@ class Screw(object):
     #Part.show(hWire)
     topFace = hCut.Faces[0]
 
-    recessShell = recessShell.cut(hCut)
-    topFace = topFace.cut(recess)
-    #Part.show(topFace)
+    headFaces.extend(self.cutRecessFaces((SType, ThreadType), recess, recessShell, hCut, topFace))
     #Part.show(recessShell)
     #Part.show(headShell)
-    headFaces.append(topFace.Faces[0])
-    headFaces.extend(recessShell.Faces)
 
 
     if self.rThread:
@@ -4080,7 +2714,33 @@ class Screw(object):
 
 
 
+  # the recess shell trimmed by the head cutter and the top face with the
+  # recess cut out don't depend on the length or the thread mode. the
+  # boolean cuts are only done once per standard and size
+  def cutRecessFaces(self, key, recess, recessShell, hCut, topFace):
+    if not key in HeadCache:
+      recessShell = recessShell.cut(hCut)
+      topFace = topFace.cut(recess)
+      HeadCache[key] = [topFace.Faces[0]] + recessShell.Faces
+    return list(HeadCache[key])
+
+
+  # cutting tools only depend on their parameters and are shared by all
+  # fasteners. a copy is returned, so callers may move it
+  def getCachedTool(self, key, buildTool, *args):
+    if not key in ToolCache:
+      ToolCache[key] = buildTool(*args)
+    tool = ToolCache[key]
+    if isinstance(tool, tuple):
+      return tuple(t.copy() for t in tool)
+    return tool.copy()
+
+
   def makeHextool(self,s_hex, k_hex, cir_hex):
+    return self.getCachedTool(('hex', s_hex, k_hex, cir_hex), self.buildHextool, s_hex, k_hex, cir_hex)
+
+
+  def buildHextool(self,s_hex, k_hex, cir_hex):
     # makes a cylinder with an inner hex hole, used as cutting tool
     # create hexagon face
     mhex=Base.Matrix()
@@ -4107,26 +2767,61 @@ class Screw(object):
     # Part.show(exHex)
     return exHex
 
-  def makeShellthread(self, d, P, halfrots, withcham, offSet):
-    d = float(d)
-
-    #rotations = int(rots)-1
-    halfrots_int = int(halfrots)
-    rotations = (halfrots_int // 2)-1
-    if halfrots_int % 2 == 1:
-      #FreeCAD.Console.PrintMessage("got half turn: " + str(halfrots_int) + "\n")
-      halfturn = True
-      # bot_off = - P/2.0 # transition of half a turn
-      bot_off = 0.0 # nominal length
-    else:
-      halfturn = False
-      bot_off = 0.0 # nominal length
+  # get the faces of a cached shape moved along z. the cached shape itself is
+  # not modified, the faces share its underlying geometry
+  def movedFaces(self, shape, z):
+    faces = shape.Faces
+    for flaeche in faces:
+      flaeche.translate(FreeCAD.Vector(0.0, 0.0, z))
+    return faces
+
+
+  # faces of count thread turns (inner or outer), the first one moved down by first pitches.
+  # the turns are located copies of the cached turn: compounds of 1, 2, 4, ...
+  # turns are built by doubling and kept in the thread cache, so a long thread
+  # needs only a few translations and all turns share the same geometry
+  def getThreadTurnFaces(self, d, P, first, count, inner = False):
+    key = ('turns', d, P, self.getTuner(d, P, inner), inner)
+    if not key in ThreadCache:
+      if inner:
+        TurnShell = self.getInnerThreadTurn(d, P)
+      else:
+        pipe0, TurnShell = self.getThreadTurn(d, P)
+      ThreadCache[key] = [Part.Compound([TurnShell])]
+    blocks = ThreadCache[key]
+
+    parts = []
+    offset = first
+    k = 0
+    while count > 0:
+      if k == len(blocks):
+        moved = Part.Compound([blocks[k-1]])
+        moved.translate(FreeCAD.Vector(0.0, 0.0, -(2**(k-1))*P))
+        blocks.append(Part.Compound([blocks[k-1], moved]))
+      if count & 1:
+        part = Part.Compound([blocks[k]])
+        part.translate(FreeCAD.Vector(0.0, 0.0, -offset*P))
+        parts.append(part)
+        offset += 2**k
+      count >>= 1
+      k += 1
+    if not parts:
+      return []
+    return Part.Compound(parts).Faces
+
+
+  # one turn of the outer thread: the solid sweep and a shell of its thread faces
+  def getThreadTurn(self, d, P):
+    tuner = self.getTuner(d, P, False)
+    key = ('turn', d, P, tuner)
+    if key in ThreadCache:
+      return ThreadCache[key]
 
     H=P*math.cos(math.radians(30)) # Gewindetiefe H
     r=d/2.0
 
     # helix = Part.makeHelix(P,P,d*511/1000.0,0) # make just one turn, length is identical to pitch
-    helix = Part.makeHelix(P,P,d*self.Tuner/1000.0,0) # make just one turn, length is identical to pitch
+    helix = Part.makeHelix(P,P,d*tuner/1000.0,0) # make just one turn, length is identical to pitch
     helix.translate(FreeCAD.Vector(0.0, 0.0,-P*9.0/16.0))
 
     extra_rad = P
@@ -4167,24 +2862,66 @@ class Screw(object):
 
     TheShell = Part.Shell(TheFaces)
     # print "Shellpoints: ", len(TheShell.Vertexes)
+    ThreadCache[key] = (pipe0, TheShell)
+    return (pipe0, TheShell)
 
 
-    i = 1
-    for i in range(rotations-2):
-       TheShell.translate(FreeCAD.Vector(0.0, 0.0,- P))
+  # transition from the thread to the cylinder below the head: the sweeps and
+  # the cut ring up to the top of the cutting sweeps are shared by all lengths.
+  # the cylinder from there up to P-offSet is added for each length. only if
+  # the thread ends within the cut region, the cached ring is trimmed
+  def getThreadTransition(self, d, P, halfturn, offSet):
+    Shell_helix, ring, zCut = self.getThreadTransitionRing(d, P, halfturn)
+    r=d/2.0
+    zTop = P-offSet
+    if zTop > zCut + 1.0e-7:
+      edge_r9 = Part.makeLine((r, 0.0, zTop), (r, 0.0, zCut))
+      band = edge_r9.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
+      ringFaces = ring.Faces + band.Faces
+    elif zTop < zCut - 1.0e-7:
+      box = Part.makeBox(d*2.0, d*2.0, zTop + 3.0*P, Base.Vector(-d, -d, -3.0*P))
+      ringFaces = ring.common(box).Faces
+    else:
+      ringFaces = ring.Faces
+    return (Shell_helix, Part.Compound(self.movedFaces(Part.Compound(ringFaces), P)))
+
+
+  # the transition sweeps and the cylinder from -P up to the top of the
+  # cutting sweeps, cut by them. zCut is the top of the ring
+  def getThreadTransitionRing(self, d, P, halfturn):
+    key = ('transition', d, P, self.getTuner(d, P, False), halfturn)
+    if key in ThreadCache:
+      return ThreadCache[key]
+    pipe_cut, rect_helix, Shell_helix = self.getThreadTransitionSweeps(d, P, halfturn)
 
-       for flaeche in TheShell.Faces:
-         TheFaces.append(flaeche)
+    r=d/2.0
+    zCut = max(pipe_cut.BoundBox.ZMax, rect_helix.BoundBox.ZMax) + P/16.0
+    # shell_ring, the transition to a cylinder
+    pr9 = (r, 0.0, zCut)
+    pr10 = (r, 0.0, -P )
+    edge_r9 = Part.makeLine(pr9,pr10)
+    shell_ring= edge_r9.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
 
-    #FreeCAD.Console.PrintMessage("Base-Shell: " + str(i) + "\n")
-    # Make separate faces for the tip of the screw
-    botFaces = []
-    for i in range(rotations-2, rotations, 1):
-       TheShell.translate(FreeCAD.Vector(0.0, 0.0,- P))
+    shell_ring = shell_ring.cut(pipe_cut)
+    #Part.show(shell_ring)
+    shell_ring = shell_ring.cut(rect_helix)
+    #Part.show(shell_ring)
+    ThreadCache[key] = (Shell_helix, shell_ring, zCut)
+    return (Shell_helix, shell_ring, zCut)
 
-       for flaeche in TheShell.Faces:
-         botFaces.append(flaeche)
-    #FreeCAD.Console.PrintMessage("Bottom-Shell: " + str(i) + "\n")
+
+  def getThreadTransitionSweeps(self, d, P, halfturn):
+    tuner = self.getTuner(d, P, False)
+    key = ('transition_sweeps', d, P, tuner, halfturn)
+    if key in ThreadCache:
+      return ThreadCache[key]
+
+    H=P*math.cos(math.radians(30)) # Gewindetiefe H
+    r=d/2.0
+    isFrenet=True
+
+    helix = Part.makeHelix(P,P,d*tuner/1000.0,0) # make just one turn, length is identical to pitch
+    helix.translate(FreeCAD.Vector(0.0, 0.0,-P*9.0/16.0))
 
     # making additional faces for transition to cylinder
 
@@ -4205,13 +2942,13 @@ class Screw(object):
     alpha = math.degrees(alpha_rad)
     Hyp = P/math.cos(alpha_rad)
     # tuning = 511/1000.0
-    tuning = self.Tuner/1000.0
+    tuning = tuner/1000.0
     angled_Helix = Part.makeHelix(Hyp,Hyp*1.002/2.0,d*tuning,alpha)
 
     SH_faces = []
 
     if halfturn:
-      half_Helix = Part.makeHelix(P,P/2.0,d*self.Tuner/1000.0,0) # make just half a turn
+      half_Helix = Part.makeHelix(P,P/2.0,d*tuner/1000.0,0) # make just half a turn
       angled_Helix.rotate(Base.Vector(0,0,0),Base.Vector(0,0,1),180)
       angled_Helix.translate(FreeCAD.Vector(0.0, 0.0,P/2.0))
       # Part.show(half_Helix)
@@ -4271,131 +3008,141 @@ class Screw(object):
     Shell_helix = Shell_helix.cut(rect_ring)
     Shell_helix.translate(FreeCAD.Vector(0.0, 0.0, P))
     # Part.show(Shell_helix)
+    ThreadCache[key] = (pipe_cut, rect_helix, Shell_helix)
+    return (pipe_cut, rect_helix, Shell_helix)
 
-    # shell_ring, the transition to a cylinder
-    pr9 = (r, 0.0, P-offSet)
-    pr10 = (r, 0.0, -P )
-    edge_r9 = Part.makeLine(pr9,pr10)
-    shell_ring= edge_r9.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
 
-    shell_ring = shell_ring.cut(pipe_cut)
-    #Part.show(shell_ring)
-    shell_ring = shell_ring.cut(rect_helix)
-    shell_ring.translate(FreeCAD.Vector(0.0, 0.0, P))
-    #Part.show(shell_ring)
+  # chamfered tip of the thread, built with the tip at z = 0. botShift is the
+  # position of the lowest thread turn relative to the tip, in pitches
+  def getThreadChamfer(self, d, P, botShift):
+    key = ('chamfer', d, P, self.getTuner(d, P, False), botShift)
+    if key in ThreadCache:
+      return ThreadCache[key]
+    pipe0, TurnShell = self.getThreadTurn(d, P)
 
-    for flaeche in shell_ring.Faces:
-      TheFaces.append(flaeche)
+    H=P*math.cos(math.radians(30)) # Gewindetiefe H
+    r=d/2.0
+    botFaces = self.movedFaces(TurnShell, -(botShift-1)*P) + self.movedFaces(TurnShell, -botShift*P)
 
-    for flaeche in Shell_helix.Faces:
-      TheFaces.append(flaeche)
+    #FreeCAD.Console.PrintMessage("with chamfer: " + str(i) + "\n")
+    # cutting of the bottom Faces
+    cham_off = H/8.0
+    cham_t = P*math.sqrt(3.0)/2.0*17.0/24.0
 
+    # points for chamfer: common-Method
+    pch0 =  (0.0, 0.0, 0.0) # bottom center
+    pch1 =  (r-cham_t,0.0, 0.0)
+    pch2 =  (r+cham_off, 0.0, cham_t +cham_off)
+    pch3 =  (r+cham_off, 0.0, 3.0*P)
+    pch4 =  (0.0, 0.0, 3.0*P)
+
+    edgech0 = Part.makeLine(pch0,pch1)
+    edgech1 = Part.makeLine(pch1,pch2)
+    edgech2 = Part.makeLine(pch2,pch3)
+    edgech3 = Part.makeLine(pch3,pch4)
+    edgech4 = Part.makeLine(pch4,pch0)
+
+    Wch_wire = Part.Wire([edgech0, edgech1, edgech2, edgech3, edgech4])
+    cham_Face =Part.Face(Wch_wire)
+    cham_Solid = cham_Face.revolve(Base.Vector(0.0,0.0,P),Base.Vector(0.0,0.0,1.0),360)
+    # Part.show(cham_Solid)
+
+    BotShell = Part.Shell(botFaces)
+    BotShell = BotShell.common(cham_Solid)
+    # Part.show(BotShell)
+
+    cham_faces = []
+    cham_faces.append(cham_Solid.Faces[0])
+    cham_faces.append(cham_Solid.Faces[1])
+    cham_Shell = Part.Shell(cham_faces)
+    # Part.show(cham_Shell)
+
+    pipe1 = pipe0.copy()
+    pipe1.translate(FreeCAD.Vector(0.0, 0.0, P))
+    # Part.show(pipe1)
+    cham_Shell = cham_Shell.cut(pipe1)
+    pipe1.translate(FreeCAD.Vector(0.0, 0.0, -P))
+    # Part.show(pipe1)
+    cham_Shell = cham_Shell.cut(pipe1)
+    ThreadCache[key] = (BotShell, cham_Shell)
+    return (BotShell, cham_Shell)
+
+
+  # finished tip faces of an outer thread, with the screw end at z=0. botShift
+  # is the position of the lowest thread turn in pitches relative to the end
+  def getThreadTip(self, d, P, botShift, withcham):
+    key = ('tip', d, P, self.getTuner(d, P, False), withcham, botShift)
+    if key in ThreadCache:
+      return ThreadCache[key]
     if withcham:
-      #FreeCAD.Console.PrintMessage("with chamfer: " + str(i) + "\n")
-      # cutting of the bottom Faces
-      # bot_off = 0.0 # nominal length
-      cham_off = H/8.0
-      cham_t = P*math.sqrt(3.0)/2.0*17.0/24.0
+      BotShell, cham_Shell = self.getThreadChamfer(d, P, botShift)
+      ThreadCache[key] = Part.Compound(BotShell.Faces + cham_Shell.Faces)
+      return ThreadCache[key]
 
-      # points for chamfer: common-Method
-      pch0 =  (0.0, 0.0, -(rotations)*P + bot_off) # bottom center
-      pch1 =  (r-cham_t,0.0, -(rotations)*P + bot_off)
-      pch2 =  (r+cham_off, 0.0, -(rotations)*P + cham_t +cham_off  + bot_off)
-      pch3 =  (r+cham_off, 0.0, -(rotations)*P + 3.0*P + bot_off)
-      pch4 =  (0.0, 0.0, -(rotations)*P + 3.0*P + bot_off)
-
-      edgech0 = Part.makeLine(pch0,pch1)
-      edgech1 = Part.makeLine(pch1,pch2)
-      edgech2 = Part.makeLine(pch2,pch3)
-      edgech3 = Part.makeLine(pch3,pch4)
-      edgech4 = Part.makeLine(pch4,pch0)
-
-      Wch_wire = Part.Wire([edgech0, edgech1, edgech2, edgech3, edgech4])
-      cham_Face =Part.Face(Wch_wire)
-      cham_Solid = cham_Face.revolve(Base.Vector(0.0,0.0,-(rotations-1)*P),Base.Vector(0.0,0.0,1.0),360)
-      # Part.show(cham_Solid)
-
-      BotShell = Part.Shell(botFaces)
-      BotShell = BotShell.common(cham_Solid)
-      # Part.show(BotShell)
-
-      cham_faces = []
-      cham_faces.append(cham_Solid.Faces[0])
-      cham_faces.append(cham_Solid.Faces[1])
-      cham_Shell = Part.Shell(cham_faces)
-      # Part.show(cham_Shell)
-
-      pipe0.translate(FreeCAD.Vector(0.0, 0.0, -(rotations-1)*P))
-      # Part.show(pipe0)
-
-      # Part.show(Fillet_shell)
-      cham_Shell = cham_Shell.cut(pipe0)
-      pipe0.translate(FreeCAD.Vector(0.0, 0.0, -P))
-      # Part.show(pipe0)
-      cham_Shell = cham_Shell.cut(pipe0)
+    #FreeCAD.Console.PrintMessage("without chamfer: " + str(i) + "\n")
+    pipe0, TurnShell = self.getThreadTurn(d, P)
+    botFaces = self.movedFaces(TurnShell, -(botShift-1)*P) + self.movedFaces(TurnShell, -botShift*P)
 
-      '''
-      botFaces2 = []
-      for flaeche in BotShell.Faces:
-        botFaces2.append(flaeche)
-      for flaeche in cham_Shell.Faces:
-        botFaces2.append(flaeche)
-      '''
+    commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 3.0*P)
+    commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0, 0.0))
+    #Part.show(commonbox)
 
-    else: # tip of screw without chamfer
-      #FreeCAD.Console.PrintMessage("without chamfer: " + str(i) + "\n")
+    BotShell = Part.Shell(botFaces)
+    #Part.show(BotShell)
 
-      commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 3.0*P)
-      commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-(rotations)*P+bot_off))
-      #commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-(rotations+3)*P+bot_off))
-      #Part.show(commonbox)
+    BotShell = BotShell.common(commonbox)
+    bot_edges =[]
+    bot_z =  1.0e-5
 
-      BotShell = Part.Shell(botFaces)
-      #Part.show(BotShell)
+    for kante in BotShell.Edges:
+       if (kante.Vertexes[0].Point.z<=bot_z) and (kante.Vertexes[1].Point.z<=bot_z):
+          bot_edges.append(kante)
+          # Part.show(kante)
+    bot_wire = Part.Wire(Part.__sortEdges__(bot_edges))
 
-      BotShell = BotShell.common(commonbox)
-      #BotShell = BotShell.cut(commonbox)
-      bot_edges =[]
-      bot_z =  1.0e-5 -(rotations)*P + bot_off
+    bot_face = Part.Face(bot_wire)
+    bot_face.reverse()
 
-      for kante in BotShell.Edges:
-         if (kante.Vertexes[0].Point.z<=bot_z) and (kante.Vertexes[1].Point.z<=bot_z):
-            bot_edges.append(kante)
-            # Part.show(kante)
-      bot_wire = Part.Wire(Part.__sortEdges__(bot_edges))
+    ThreadCache[key] = Part.Compound(BotShell.Faces + [bot_face])
+    return ThreadCache[key]
 
-      #botFaces2 = []
-      #for flaeche in BotShell.Faces:
-      #  botFaces2.append(flaeche)
 
-      bot_face = Part.Face(bot_wire)
-      bot_face.reverse()
-      #botFaces2.append(bot_face)
+  def makeShellthread(self, d, P, halfrots, withcham, offSet):
+    d = float(d)
 
-    '''
+    #rotations = int(rots)-1
+    halfrots_int = int(halfrots)
+    rotations = (halfrots_int // 2)-1
+    if halfrots_int % 2 == 1:
+      #FreeCAD.Console.PrintMessage("got half turn: " + str(halfrots_int) + "\n")
+      halfturn = True
+      # bot_off = - P/2.0 # transition of half a turn
+      bot_off = 0.0 # nominal length
+    else:
+      halfturn = False
+      bot_off = 0.0 # nominal length
 
-    BotShell2 = Part.Shell(botFaces2)
-    # Part.show(BotShell2)
+    H=P*math.cos(math.radians(30)) # Gewindetiefe H
+    r=d/2.0
 
-    TheShell2 = Part.Shell(TheFaces)
+    if self.smThreadEngine == 'ruled':
+      TheShell = self.makeRuledShellthread(d, P, rotations, withcham, offSet)
+      if TheShell != None:
+        return TheShell
 
-    # This gives a shell
-    FaceList = []
-    for flaeche in TheShell2.Faces:
-      FaceList.append(flaeche)
-    for flaeche in BotShell2.Faces:
-      FaceList.append(flaeche)
+    # the thread turn, the transition and the tip do not depend on the
+    # length and are taken from the thread cache
+    firstBot = max(rotations-2, 0)
+    TheFaces = self.getThreadTurnFaces(d, P, 0, firstBot+1)
+
+    Shell_helix, shell_ring = self.getThreadTransition(d, P, halfturn, offSet)
+    TheFaces.extend(shell_ring.Faces)
+    TheFaces.extend(Shell_helix.Faces)
+
+    # tip of the screw, with or without chamfer, moved to the screw end
+    tip = self.getThreadTip(d, P, firstBot + 2 - rotations, withcham)
+    TheFaces.extend(self.movedFaces(tip, -(rotations)*P + bot_off))
 
-    TheShell = Part.Shell(FaceList)
-    # Part.show(TheShell)
-    '''
-    for flaeche in BotShell.Faces:
-      TheFaces.append(flaeche)
-    if withcham:
-      for flaeche in cham_Shell.Faces:
-        TheFaces.append(flaeche)
-    else:
-      TheFaces.append(bot_face)
     TheShell = Part.Shell(TheFaces)
 
     #print self.Tuner, " ", TheShell.ShapeType, " ", TheShell.isValid(), " hrots: ", halfrots_int, " Shellpunkte: ", len(TheShell.Vertexes)
@@ -4405,16 +3152,173 @@ class Screw(object):
 
 
 
+  # thread engine without sweeps and booleans. the faces between the points of
+  # the thread profile are ruled surfaces between helices through these points.
+  # at both ends the thread runs out within one turn, the depth going down to
+  # zero, so the thread ends on the cylinder of radius r. the run-out turns are
+  # closed by ruled faces between their outer helix and a circle
+  def makeRuledShellthread(self, d, P, rotations, withcham, offSet):
+    r = d/2.0
+    H=P*math.cos(math.radians(30)) # Gewindetiefe H
+    zTop = 2.0*P - offSet
+    turns = rotations - 1
+    if turns < 2 or zTop < P:
+      return None
+
+    profile = [(r, 0.0), (r-H*5.0/8.0, -P*5.0/16.0), (r-H*17.0/24.0, -P*7.0/16.0),
+        (r-H*5.0/8.0, -P*9.0/16.0), (r, -P*14.0/16.0), (r, -P)]
+    TheFaces = []
+    if zTop > P + 1.0e-7: # transition to the shank
+      shell_ring = Part.makeLine((r,0.0,zTop),(r,0.0,P)).revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
+      TheFaces.extend(shell_ring.Faces)
+    TheFaces.extend(self.getRuledThreadFaces(r, P, profile, turns, P))
+
+    # tip: cone down to the minor diameter or cylinder, closed by a flat face
+    zBot = P - (turns+1)*P
+    zTip = -rotations*P
+    if withcham:
+      rTip = r - H*5.0/8.0
+    else:
+      rTip = r
+    cham_Shell = Part.makeLine((r,0.0,zBot),(rTip,0.0,zTip)).revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
+    TheFaces.extend(cham_Shell.Faces)
+    bot_face = Part.Face(Part.Wire(Part.makeCircle(rTip, Base.Vector(0.0,0.0,zTip))))
+    bot_face.reverse()
+    TheFaces.append(bot_face)
+    return Part.Shell(TheFaces)
+
+
+  # screw tap with the ruled thread engine, from z=0 down to -rotations*P
+  def makeRuledScrewTap(self, d, P, rotations):
+    r = d/2.0
+    H=P*math.cos(math.radians(30)) # Gewindetiefe H
+    turns = rotations - 1
+    if turns < 2:
+      return None
+
+    profile = [(r, 0.0), (r-H*5.0/8.0, -P*5.0/16.0), (r-H*5.0/8.0, -P*9.0/16.0),
+        (r, -P*14.0/16.0), (r+H*1/24.0, -P*31.0/32.0), (r, -P)]
+    TheFaces = self.getRuledThreadFaces(r, P, profile, turns, 0.0)
+    top_face = Part.Face(Part.Wire(Part.makeCircle(r, Base.Vector(0.0,0.0,0.0))))
+    bot_face = Part.Face(Part.Wire(Part.makeCircle(r, Base.Vector(0.0,0.0,-rotations*P))))
+    bot_face.reverse()
+    TheFaces.append(top_face)
+    TheFaces.append(bot_face)
+    return Part.Solid(Part.Shell(TheFaces))
+
+
+  # faces of a thread with the given profile, a list of (radius, z) points from
+  # (r, 0) to (r, -P). the thread lies between the circles of radius r at zTop
+  # and zTop-(turns+1)*P, the first and last of the turns are run-out turns
+  def getRuledThreadFaces(self, r, P, profile, turns, zTop):
+    topShell, botShell = self.getRuledThreadEnds(r, P, profile)
+    TheFaces = self.movedFaces(topShell, zTop - P)
+    if turns > 2:
+      helices = []
+      for rad, z in profile:
+        helix = Part.makeHelix(P, (turns-2)*P, rad)
+        helix.translate(FreeCAD.Vector(0.0, 0.0, zTop - (turns-1)*P + z))
+        helices.append(helix)
+      TheFaces.extend(self.makeRuledFaces(helices))
+    TheFaces.extend(self.movedFaces(botShell, zTop - turns*P))
+    return TheFaces
+
+
+  # the run-out turns with their closing faces. the upper one starts at z=0
+  # and ends at the circle at z=P, the lower one starts at the circle at z=-P
+  def getRuledThreadEnds(self, r, P, profile):
+    key = ('ruled_ends', r, P, tuple(profile))
+    if key in ThreadCache:
+      return ThreadCache[key]
+    topCurves = self.makeRunoutCurves(r, P, profile, True)
+    topFaces = self.makeRuledFaces(topCurves)
+    topCap = Part.makeRuledSurface(Part.makeCircle(r, FreeCAD.Vector(0.0, 0.0, P)), topCurves[0])
+    topFaces.extend(topCap.Faces)
+    botCurves = self.makeRunoutCurves(r, P, profile, False)
+    botFaces = self.makeRuledFaces(botCurves)
+    botCap = Part.makeRuledSurface(Part.makeCircle(r, FreeCAD.Vector(0.0, 0.0, -P)), botCurves[-1])
+    botFaces.extend(botCap.Faces)
+    ThreadCache[key] = (Part.Compound(topFaces), Part.Compound(botFaces))
+    return ThreadCache[key]
+
+
+  # one turn of helix like curves through the profile points, with the depth of
+  # the profile going down to zero at the end (upper run-out) or coming up
+  # from zero at the start (lower run-out)
+  def makeRunoutCurves(self, r, P, profile, upper):
+    steps = 32
+    params = [float(i)/steps for i in range(steps+1)]
+    curves = []
+    for rad, z in profile:
+      points = []
+      for t in params:
+        if upper:
+          depth = (1.0 + math.cos(math.pi*t))/2.0
+        else:
+          depth = (1.0 - math.cos(math.pi*t))/2.0
+        rt = r + (rad - r)*depth
+        angle = 2.0*math.pi*t
+        points.append(FreeCAD.Vector(rt*math.cos(angle), rt*math.sin(angle), z + P*t))
+      curve = Part.BSplineCurve()
+      curve.interpolate(points, Parameters = params)
+      curves.append(curve.toShape())
+    return curves
+
+
+  # ruled faces between consecutive curves
+  def makeRuledFaces(self, curves):
+    TheFaces = []
+    for i in range(len(curves)-1):
+      TheFaces.extend(Part.makeRuledSurface(curves[i], curves[i+1]).Faces)
+    return TheFaces
+
 
   # if da is not None: make Shell for a nut else: make a screw tap
   def makeInnerThread_2(self, d, P, rotations, da, l):
     d = float(d)
-    bot_off = 0.0 # nominal length
+    if da is None and self.smThreadEngine == 'ruled':
+      screwTap = self.makeRuledScrewTap(d, P, rotations)
+      if screwTap != None:
+        return screwTap
+
+    # the thread turn and the chamfered or flat ends do not depend on the nut
+    # height or the tap length and are taken from the thread cache. only the
+    # number of turns in between changes
+    if da is not None:
+      offSet = rotations*P - l
+      #FreeCAD.Console.PrintMessage("Der Offset: " + str(offSet/P) + "\n")
+      TheFaces = self.getInnerThreadNutTop(d, P, da, offSet)
+      TheFaces.extend(self.getThreadTurnFaces(d, P, 3, rotations-4, True))
+      BotShell, cham_face = self.getInnerThreadNutBottom(d, P, da)
+      TheFaces.extend(self.movedFaces(BotShell, -rotations*P))
+      TheFaces.extend(self.movedFaces(cham_face, -rotations*P))
+      TheShell = Part.Shell(TheFaces)
+
+      #print self.Tuner, " ", TheShell.ShapeType, " ", TheShell.isValid(), " hrots: ", halfrots_int, " Shellpunkte: ", len(TheShell.Vertexes)
+
+      return TheShell
+
+    else: # make of screw tap
+      TheFaces = self.getInnerThreadTapTop(d, P)
+      TheFaces.extend(self.getThreadTurnFaces(d, P, 1, rotations-2, True))
+      TheFaces.extend(self.movedFaces(self.getInnerThreadTapBottom(d, P), -rotations*P))
+      TheShell = Part.Shell(TheFaces)
+      TheSolid = Part.Solid(TheShell)
+
+      return TheSolid
+
+
+  # one turn of the inner thread as shell
+  def getInnerThreadTurn(self, d, P):
+    tuner = self.getTuner(d, P, True)
+    key = ('inner_turn', d, P, tuner)
+    if key in ThreadCache:
+      return ThreadCache[key]
 
     H=P*math.cos(math.radians(30)) # Gewindetiefe H
     r=d/2.0
 
-    helix = Part.makeHelix(P,P,d*self.Tuner/1000.0,0) # make just one turn, length is identical to pitch
+    helix = Part.makeHelix(P,P,d*tuner/1000.0,0) # make just one turn, length is identical to pitch
     helix.translate(FreeCAD.Vector(0.0, 0.0,-P*9.0/16.0))
 
     extra_rad = P
@@ -4456,197 +3360,227 @@ class Screw(object):
 
     TheShell = Part.Shell(TheFaces)
     # print "Shellpoints: ", len(TheShell.Vertexes)
-
-    # Handling of the top faces
-    if da is not None:
-      TheShell.translate(FreeCAD.Vector(0.0, 0.0,- P))
-      for flaeche in TheShell.Faces:
-       TheFaces.append(flaeche)
-      TheShell.translate(FreeCAD.Vector(0.0, 0.0,- P))
-      for flaeche in TheShell.Faces:
-       TheFaces.append(flaeche)
-
-      cham_i_delta = da/2.0 - (r-H)
-      cham_i = cham_i_delta * math.tan(math.radians(15.0))
-
-      offSet = rotations*P - l
-      #FreeCAD.Console.PrintMessage("Der Offset: " + str(offSet/P) + "\n")
-
-      # points for chamfer: common-Method
-      pch0 =  (da/2.0-cham_i_delta, 0.0, -cham_i - offSet) # bottom chamfer
-      pch1 =  (da/2.0, 0.0, 0.0 - offSet)  #
-      pch2 =  (da/2.0, 0.0, -4.0*P - offSet)
-      pch3 =  (da/2.0-cham_i_delta, 0.0, -4.0*P - offSet)
-
-      edgech0 = Part.makeLine(pch0,pch1)
-      edgech1 = Part.makeLine(pch1,pch2)
-      edgech2 = Part.makeLine(pch2,pch3)
-      edgech3 = Part.makeLine(pch3,pch0)
-
-      Wch_wire = Part.Wire([edgech0, edgech1, edgech2, edgech3])
-      cham_Face =Part.Face(Wch_wire)
-      cham_Solid = cham_Face.revolve(Base.Vector(0.0,0.0,-(rotations-1)*P),Base.Vector(0.0,0.0,1.0),360)
-      #Part.show(cham_Solid)
-      #Part.show(Wch_wire)
-
-      rawTopShell = Part.Shell(TheFaces)
-      topShell = rawTopShell.common(cham_Solid)
-
-      # Making a Cutter for the cham face
-      commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 2.0*P)
-      commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-2.0*P))
-      #Part.show(commonbox)
-
-      cutterShell = rawTopShell.common(commonbox)
-      bot_edges =[]
-      bot_z =  1.0e-5 -2.0*P
-
-      for kante in cutterShell.Edges:
-         if (kante.Vertexes[0].Point.z<=bot_z) and (kante.Vertexes[1].Point.z<=bot_z):
-            bot_edges.append(kante)
-            # Part.show(kante)
-      bot_wire = Part.Wire(Part.__sortEdges__(bot_edges))
-
-      bot_face = Part.Face(bot_wire)
-      bot_face.reverse()
-      t_face = bot_face.copy()
-      t_face.translate(Base.Vector(0.0, 0.0, 2.0*P))
-      cutterFaces = cutterShell.Faces
-      cutterFaces.append(bot_face.Faces[0])
-      cutterFaces.append(t_face.Faces[0])
-      cutShell = Part.Shell(cutterFaces)
-      chamFcutter = Part.Solid(cutShell)
-
-      #Part.show(chamFcutter)
-      topCham = cham_Solid.Faces[0]
-      topCham = topCham.cut(chamFcutter)
-
-      #Part.show(topCham)
-      TheFaces = [topCham.Faces[0]]
-      TheFaces.extend(topShell.Faces)
-
-      for i in range(rotations-4):
-         TheShell.translate(FreeCAD.Vector(0.0, 0.0,- P))
-         for flaeche in TheShell.Faces:
-           TheFaces.append(flaeche)
-
-
-    else:
-      commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 3.0*P)
-      commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-(3.0)*P))
-      topShell = TheShell.common(commonbox)
-      top_edges =[]
-      top_z =  -1.0e-5
-
-      for kante in topShell.Edges:
-         if (kante.Vertexes[0].Point.z>=top_z) and (kante.Vertexes[1].Point.z>=top_z):
-            top_edges.append(kante)
-            # Part.show(kante)
-      top_wire = Part.Wire(Part.__sortEdges__(top_edges))
-      top_face = Part.Face(top_wire)
-
-      TheFaces = [top_face.Faces[0]]
-      TheFaces.extend(topShell.Faces)
-
-      for i in range(rotations-2):
-         TheShell.translate(FreeCAD.Vector(0.0, 0.0,- P))
-         for flaeche in TheShell.Faces:
-           TheFaces.append(flaeche)
-
-    #FreeCAD.Console.PrintMessage("Base-Shell: " + str(i) + "\n")
-    # Make separate faces for the tip of the screw
-    botFaces = []
-    for i in range(rotations-2, rotations, 1):
-       TheShell.translate(FreeCAD.Vector(0.0, 0.0,- P))
-
-       for flaeche in TheShell.Faces:
-         botFaces.append(flaeche)
-    #FreeCAD.Console.PrintMessage("Bottom-Shell: " + str(i) + "\n")
-
-    if da is not None:
-      # points for chamfer: common-Method
-      pch0 =  (da/2.0-cham_i_delta, 0.0, -(rotations)*P + cham_i) # bottom chamfer
-      pch1 =  (da/2.0, 0.0, -(rotations)*P)  #
-      pch2 =  (da/2.0, 0.0, -(rotations)*P + 3.0*P)
-      pch3 =  (da/2.0-cham_i_delta, 0.0, -(rotations)*P + 3.0*P)
-      #pch4 =  (r-2.0*cham_i_delta, 0.0, -(rotations)*P + 3.0*P)
-
-      edgech0 = Part.makeLine(pch0,pch1)
-      edgech1 = Part.makeLine(pch1,pch2)
-      edgech2 = Part.makeLine(pch2,pch3)
-      edgech3 = Part.makeLine(pch3,pch0)
-
-      Wch_wire = Part.Wire([edgech0, edgech1, edgech2, edgech3])
-      cham_Face =Part.Face(Wch_wire)
-      cham_Solid = cham_Face.revolve(Base.Vector(0.0,0.0,-(rotations-1)*P),Base.Vector(0.0,0.0,1.0),360)
-      #Part.show(cham_Solid)
-      #Part.show(Wch_wire)
-
-      BotShell = Part.Shell(botFaces)
-      #Part.show(BotShell)
-      chamFcutter.translate(FreeCAD.Vector(0.0, 0.0,-(rotations-1)*P))
-      #Part.show(chamFcutter)
-
-
-      BotShell = BotShell.common(cham_Solid)
-      #Part.show(BotShell)
-
-      cham_face = cham_Solid.Faces[0]
-      cham_face = cham_face.cut(chamFcutter)
-      #Part.show(cham_face)
-
-      for flaeche in BotShell.Faces:
-        TheFaces.append(flaeche)
-      if da is not None:
-        TheFaces.append(cham_face.Faces[0])
-      else:
-        TheFaces.append(bot_face)
-      TheShell = Part.Shell(TheFaces)
-
-      #print self.Tuner, " ", TheShell.ShapeType, " ", TheShell.isValid(), " hrots: ", halfrots_int, " Shellpunkte: ", len(TheShell.Vertexes)
-
-      return TheShell
-
+    ThreadCache[key] = TheShell
+    return TheShell
 
 
-    else: # make of screw tap
-      #FreeCAD.Console.PrintMessage("without chamfer: " + str(i) + "\n")
-
-      commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 3.0*P)
-      commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-(rotations)*P+bot_off))
-      #commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-(rotations+3)*P+bot_off))
-      #Part.show(commonbox)
-
-      BotShell = Part.Shell(botFaces)
-      #Part.show(BotShell)
-
-      BotShell = BotShell.common(commonbox)
-      #BotShell = BotShell.cut(commonbox)
-      bot_edges =[]
-      bot_z =  1.0e-5 -(rotations)*P + bot_off
-
-      for kante in BotShell.Edges:
-         if (kante.Vertexes[0].Point.z<=bot_z) and (kante.Vertexes[1].Point.z<=bot_z):
-            bot_edges.append(kante)
-            # Part.show(kante)
-      bot_wire = Part.Wire(Part.__sortEdges__(bot_edges))
-
-      bot_face = Part.Face(bot_wire)
-      bot_face.reverse()
-
-      for flaeche in BotShell.Faces:
-        TheFaces.append(flaeche)
-      if da is not None:
-        for flaeche in cham_Shell.Faces:
-          TheFaces.append(flaeche)
-      else:
-        TheFaces.append(bot_face)
-      TheShell = Part.Shell(TheFaces)
-      TheSolid = Part.Solid(TheShell)
+  # chamfer size of a nut thread
+  def getInnerThreadCham(self, d, P, da):
+    H=P*math.cos(math.radians(30)) # Gewindetiefe H
+    r=d/2.0
+    cham_i_delta = da/2.0 - (r-H)
+    cham_i = cham_i_delta * math.tan(math.radians(15.0))
+    return cham_i_delta, cham_i
+
+
+  # the upper three turns of a nut thread, cut by the chamfer cutter
+  def getInnerThreadRawTop(self, d, P):
+    TurnShell = self.getInnerThreadTurn(d, P)
+    TheFaces = TurnShell.Faces
+    TheFaces.extend(self.movedFaces(TurnShell, -P))
+    TheFaces.extend(self.movedFaces(TurnShell, -2.0*P))
+    return Part.Shell(TheFaces)
+
+
+  # solid of the upper two turns of a nut thread, used to cut the chamfer faces
+  def getInnerThreadChamCutter(self, d, P):
+    key = ('inner_cham_cutter', d, P, self.getTuner(d, P, True))
+    if key in ThreadCache:
+      return ThreadCache[key]
+
+    rawTopShell = self.getInnerThreadRawTop(d, P)
+    # Making a Cutter for the cham face
+    commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 2.0*P)
+    commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-2.0*P))
+    #Part.show(commonbox)
+
+    cutterShell = rawTopShell.common(commonbox)
+    bot_edges =[]
+    bot_z =  1.0e-5 -2.0*P
+
+    for kante in cutterShell.Edges:
+       if (kante.Vertexes[0].Point.z<=bot_z) and (kante.Vertexes[1].Point.z<=bot_z):
+          bot_edges.append(kante)
+          # Part.show(kante)
+    bot_wire = Part.Wire(Part.__sortEdges__(bot_edges))
+
+    bot_face = Part.Face(bot_wire)
+    bot_face.reverse()
+    t_face = bot_face.copy()
+    t_face.translate(Base.Vector(0.0, 0.0, 2.0*P))
+    cutterFaces = cutterShell.Faces
+    cutterFaces.append(bot_face.Faces[0])
+    cutterFaces.append(t_face.Faces[0])
+    cutShell = Part.Shell(cutterFaces)
+    chamFcutter = Part.Solid(cutShell)
+    #Part.show(chamFcutter)
+    ThreadCache[key] = chamFcutter
+    return chamFcutter
+
+
+  # top of a nut thread: chamfer face and the chamfered upper three turns.
+  # the chamfer solid is cached per size and moved to z=-offSet. only the
+  # turns reaching into the chamfer are intersected with it, the turns below
+  # are taken from the thread cache
+  def getInnerThreadNutTop(self, d, P, da, offSet):
+    cham_i_delta, cham_i = self.getInnerThreadCham(d, P, da)
+    cham_Solid = self.getInnerThreadNutCham(d, P, da).copy()
+    cham_Solid.translate(FreeCAD.Vector(0.0, 0.0, -offSet))
+
+    # turn i reaches up to 7/16 P - i*P, the chamfer down to -offSet-cham_i
+    cutTurns = 3
+    while cutTurns > 1 and 7.0/16.0*P - (cutTurns-1)*P < -offSet - cham_i - P/16.0:
+      cutTurns -= 1
+    TurnShell = self.getInnerThreadTurn(d, P)
+    rawFaces = TurnShell.Faces
+    for i in range(1, cutTurns):
+      rawFaces.extend(self.movedFaces(TurnShell, -i*P))
+    topShell = Part.Shell(rawFaces).common(cham_Solid)
+
+    topCham = cham_Solid.Faces[0]
+    topCham = topCham.cut(self.getInnerThreadChamCutter(d, P))
+
+    #Part.show(topCham)
+    TheFaces = [topCham.Faces[0]]
+    TheFaces.extend(topShell.Faces)
+    TheFaces.extend(self.getThreadTurnFaces(d, P, cutTurns, 3-cutTurns, True))
+    return TheFaces
+
+
+  # solid of the nut material below the top chamfer, for a nut ending at z=0
+  def getInnerThreadNutCham(self, d, P, da):
+    key = ('inner_nut_cham', d, P, da)
+    if key in ThreadCache:
+      return ThreadCache[key]
+
+    cham_i_delta, cham_i = self.getInnerThreadCham(d, P, da)
+    # points for chamfer: common-Method
+    pch0 =  (da/2.0-cham_i_delta, 0.0, -cham_i) # bottom chamfer
+    pch1 =  (da/2.0, 0.0, 0.0)  #
+    pch2 =  (da/2.0, 0.0, -4.0*P)
+    pch3 =  (da/2.0-cham_i_delta, 0.0, -4.0*P)
+
+    edgech0 = Part.makeLine(pch0,pch1)
+    edgech1 = Part.makeLine(pch1,pch2)
+    edgech2 = Part.makeLine(pch2,pch3)
+    edgech3 = Part.makeLine(pch3,pch0)
+
+    Wch_wire = Part.Wire([edgech0, edgech1, edgech2, edgech3])
+    cham_Face =Part.Face(Wch_wire)
+    cham_Solid = cham_Face.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
+    #Part.show(cham_Solid)
+    #Part.show(Wch_wire)
+    ThreadCache[key] = cham_Solid
+    return cham_Solid
+
+
+  # bottom of a nut thread: the chamfered lower two turns and the chamfer face,
+  # made for a nut ending at z=0
+  def getInnerThreadNutBottom(self, d, P, da):
+    key = ('inner_nut_bottom', d, P, da, self.getTuner(d, P, True))
+    if key in ThreadCache:
+      return ThreadCache[key]
+
+    TurnShell = self.getInnerThreadTurn(d, P)
+    botFaces = self.movedFaces(TurnShell, P)
+    botFaces.extend(TurnShell.Faces)
+
+    cham_i_delta, cham_i = self.getInnerThreadCham(d, P, da)
+    # points for chamfer: common-Method
+    pch0 =  (da/2.0-cham_i_delta, 0.0, cham_i) # bottom chamfer
+    pch1 =  (da/2.0, 0.0, 0.0)  #
+    pch2 =  (da/2.0, 0.0, 3.0*P)
+    pch3 =  (da/2.0-cham_i_delta, 0.0, 3.0*P)
+    #pch4 =  (r-2.0*cham_i_delta, 0.0, 3.0*P)
+
+    edgech0 = Part.makeLine(pch0,pch1)
+    edgech1 = Part.makeLine(pch1,pch2)
+    edgech2 = Part.makeLine(pch2,pch3)
+    edgech3 = Part.makeLine(pch3,pch0)
+
+    Wch_wire = Part.Wire([edgech0, edgech1, edgech2, edgech3])
+    cham_Face =Part.Face(Wch_wire)
+    cham_Solid = cham_Face.revolve(Base.Vector(0.0,0.0,0.0),Base.Vector(0.0,0.0,1.0),360)
+    #Part.show(cham_Solid)
+    #Part.show(Wch_wire)
+
+    BotShell = Part.Shell(botFaces)
+    #Part.show(BotShell)
+    chamFcutter = self.getInnerThreadChamCutter(d, P).copy()
+    chamFcutter.translate(FreeCAD.Vector(0.0, 0.0, P))
+    #Part.show(chamFcutter)
+
+    BotShell = BotShell.common(cham_Solid)
+    #Part.show(BotShell)
+
+    cham_face = cham_Solid.Faces[0]
+    cham_face = cham_face.cut(chamFcutter)
+    #Part.show(cham_face)
+    ThreadCache[key] = (BotShell, Part.Compound([cham_face.Faces[0]]))
+    return ThreadCache[key]
+
+
+  # top of a screw tap: the upper turn cut flat at z=0 and the top face
+  def getInnerThreadTapTop(self, d, P):
+    key = ('inner_tap_top', d, P, self.getTuner(d, P, True))
+    if key in ThreadCache:
+      return ThreadCache[key].Faces
+
+    TheShell = self.getInnerThreadTurn(d, P)
+    commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 3.0*P)
+    commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0,-(3.0)*P))
+    topShell = TheShell.common(commonbox)
+    top_edges =[]
+    top_z =  -1.0e-5
+
+    for kante in topShell.Edges:
+       if (kante.Vertexes[0].Point.z>=top_z) and (kante.Vertexes[1].Point.z>=top_z):
+          top_edges.append(kante)
+          # Part.show(kante)
+    top_wire = Part.Wire(Part.__sortEdges__(top_edges))
+    top_face = Part.Face(top_wire)
+
+    TheFaces = [top_face.Faces[0]]
+    TheFaces.extend(topShell.Faces)
+    ThreadCache[key] = Part.Compound(TheFaces)
+    return ThreadCache[key].Faces
+
+
+  # bottom of a screw tap: the lower two turns cut flat and the bottom face,
+  # made for a tap ending at z=0
+  def getInnerThreadTapBottom(self, d, P):
+    key = ('inner_tap_bottom', d, P, self.getTuner(d, P, True))
+    if key in ThreadCache:
+      return ThreadCache[key]
+
+    TurnShell = self.getInnerThreadTurn(d, P)
+    botFaces = self.movedFaces(TurnShell, P)
+    botFaces.extend(TurnShell.Faces)
+
+    commonbox = Part.makeBox(d+4.0*P, d+4.0*P, 3.0*P)
+    commonbox.translate(FreeCAD.Vector(-(d+4.0*P)/2.0, -(d+4.0*P)/2.0, 0.0))
+    #Part.show(commonbox)
+
+    BotShell = Part.Shell(botFaces)
+    #Part.show(BotShell)
+
+    BotShell = BotShell.common(commonbox)
+    bot_edges =[]
+    bot_z =  1.0e-5
+
+    for kante in BotShell.Edges:
+       if (kante.Vertexes[0].Point.z<=bot_z) and (kante.Vertexes[1].Point.z<=bot_z):
+          bot_edges.append(kante)
+          # Part.show(kante)
+    bot_wire = Part.Wire(Part.__sortEdges__(bot_edges))
 
-      #print self.Tuner, " ", TheShell.ShapeType, " ", TheShell.isValid(), " hrots: ", halfrots_int, " Shellpunkte: ", len(TheShell.Vertexes)
+    bot_face = Part.Face(bot_wire)
+    bot_face.reverse()
 
-      return TheSolid
+    TheFaces = BotShell.Faces
+    TheFaces.append(bot_face)
+    ThreadCache[key] = Part.Compound(TheFaces)
+    return ThreadCache[key]
 
 
 
@@ -4927,6 +3861,8 @@ class Screw(object):
 
     residue, turns = math.modf((l)/P)
     turns += 1.0
+    # the tap reaches (1-residue)*P above the surface, the symbol starts at it
+    self.threadInfo = (dia, P, 0.0, l)
     #FreeCAD.Console.PrintMessage("ScrewTap residue: " + str(residue) + " turns: " + str(turns) + "\n")
 
 
@@ -4960,6 +3896,18 @@ class Screw(object):
 
 
 
+  # cosmetic thread: a helix at the minor diameter along the threaded part,
+  # added as separate sub-shape next to the simple solid
+  def addThreadSymbol(self, screw):
+    dia, P, a, l = self.threadInfo
+    if l - a < P:
+      return screw
+    H=P*math.cos(math.radians(30)) # Gewindetiefe H
+    helix = Part.makeHelix(P, l - a, dia/2.0 - H*5.0/8.0)
+    helix.translate(Base.Vector(0.0, 0.0, -l))
+    return Part.makeCompound([screw, helix])
+
+
   def cutChamfer(self, dia_cC, P_cC, l_cC):
     cham_t = P_cC*math.sqrt(3.0)/2.0*17.0/24.0
     PntC0 = Base.Vector(0.0,0.0,-l_cC)
@@ -4982,6 +3930,13 @@ class Screw(object):
 
   # cross recess type H
   def makeCross_H3(self, CrossType = '2', m = 6.9, h = 0.0):
+    cross, crossShell0 = self.getCachedTool(('cross', CrossType, m), self.buildCross_H3, CrossType, m)
+    cross.Placement.Base = Base.Vector(0.0,0.0,h)
+    crossShell0.Placement.Base = Base.Vector(0.0,0.0,h)
+    return cross, crossShell0
+
+
+  def buildCross_H3(self, CrossType = '2', m = 6.9):
     # m = diameter of cross at top of screw at reference level for penetration depth
     b, e_mean, g, f_mean, r, t1, alpha, beta = iso4757def[CrossType]
 
@@ -5110,8 +4065,6 @@ class Screw(object):
 
     #FreeCAD.Console.PrintMessage("Placement: " + str(pl_rot) + "\n")
 
-    cross.Placement.Base = Base.Vector(0.0,0.0,h)
-    crossShell0.Placement.Base = Base.Vector(0.0,0.0,h)
     #Part.show(crossShell0)
     #Part.show(cross)
     return cross, crossShell0
@@ -5122,6 +4075,13 @@ class Screw(object):
   # Parameters used: s_mean, k, t_min, dk
   def makeAllen2(self, s_a = 3.0, t_a = 1.5, h_a = 2.0 ):
     # h_a  top height location of cutting tool
+    solidHex, allenShell = self.getCachedTool(('allen', s_a, t_a), self.buildAllen2, s_a, t_a)
+    solidHex.Placement.Base = Base.Vector(0.0,0.0,h_a)
+    allenShell.Placement.Base = Base.Vector(0.0,0.0,h_a)
+    return solidHex, allenShell
+
+
+  def buildAllen2(self, s_a = 3.0, t_a = 1.5):
     # s_a hex width
     # t_a dept of the allen
     # dk_a diameter not needed anymore
@@ -5184,16 +4144,21 @@ class Screw(object):
     for i in range(2,9):
       allenFaces.append(allen.Faces[i])
     allenShell = Part.Shell(allenFaces)
-    solidHex.Placement.Base = Base.Vector(0.0,0.0,h_a)
-    allenShell.Placement.Base = Base.Vector(0.0,0.0,h_a)
     return solidHex, allenShell
 
 
 
   # ISO 10664 Hexalobular internal driving feature for bolts and screws
   def makeIso10664_3(self,RType ='T20',t_hl=3.0, h_hl = 0):
-    # t_hl depth of the recess
     # h_hl top height location of Cutting tool
+    Helo, hexlobShell = self.getCachedTool(('hexalobular', RType, t_hl), self.buildIso10664_3, RType, t_hl)
+    hexlobShell.Placement.Base = Base.Vector(0.0,0.0,h_hl)
+    Helo.Placement.Base = Base.Vector(0.0,0.0,h_hl)
+    return Helo, hexlobShell
+
+
+  def buildIso10664_3(self,RType ='T20',t_hl=3.0):
+    # t_hl depth of the recess
     A, B, Re = iso10664def[RType]
     sqrt_3 = math.sqrt(3.0)
     depth=A/4.0
@@ -5291,9 +4256,6 @@ class Screw(object):
 
     hexlobShell = Part.Shell(hexlobFaces)
 
-    hexlobShell.Placement.Base = Base.Vector(0.0,0.0,h_hl)
-    Helo.Placement.Base = Base.Vector(0.0,0.0,h_hl)
-
     return Helo, hexlobShell
 
   def setThreadType(self, TType = 'simple'):
@@ -5309,6 +4271,18 @@ class Screw(object):
 
   def setTuner(self, myTuner = 511):
     self.Tuner = myTuner
+    self.fixedTuner = True
+
+  # tuner for the thread sweeps of the given diameter and pitch. taken from the
+  # tuner table, Tuner is used for sizes not in the table
+  def getTuner(self, d, P, inner):
+    if self.fixedTuner:
+      return self.Tuner
+    if inner:
+      table = getTunerTable()['inner']
+    else:
+      table = getTunerTable()['outer']
+    return table.get(tunerKey(d, P), self.Tuner)
 
   def getDia(self, ThreadType, isNut):
     if '(' in ThreadType:
@@ -5323,16 +4297,89 @@ class Screw(object):
         dia = self.smScrewThrScaleA * dia + self.smScrewThrScaleB
     return dia
 
+# registry of the fastener standards known to the screw maker, filled by
+# registerScrewStandard. it drives createScrew and check_Data and the list of
+# fastener types of the workbench (ScrewMaker.screwTables)
+ScrewStandard = collections.namedtuple('ScrewStandard', 'kind table lengths ranges builder diamPos kPos')
+ScrewStandards = {}
+# item kinds as written in labels and messages
+ScrewKindLabels = {'ScrewTap': 'Screw-Tap'}
+
+def registerScrewStandard(type, kind, table, lengths, ranges, builder, diamPos = -1, kPos = 0):
+  ''' Add a fastener standard, or replace an existing one.
+      kind: 'Screw', 'Washer', 'Nut' or 'ScrewTap'
+      table: definition table, keyed by diameter
+      lengths, ranges: length list and length range per diameter, None if there is no length
+      builder: called as builder(screw, type, diam, length) and returns the shape
+      diamPos: position within the definition table to be used for auto diameter selection, -1 = get size from Mxx
+      kPos: position within the definition table to be used for countersunk holes creation '''
+  ScrewStandards[type] = ScrewStandard(kind, table, lengths, ranges, builder, diamPos, kPos)
+
+def registerCatalogStandard(type, builder):
+  ''' Register a standard of the fastener catalog with its builder, see FSCatalog '''
+  std = FSGetCatalogStandards()[type]
+  registerScrewStandard(type, std['kind'], FSGetCatalogTable(std['table']), FSGetCatalogTable(std['lengths']),
+      FSGetCatalogTable(std['ranges']), builder, std['diamPos'], std['kPos'])
+
+def buildWasher(screw, type, diam, l):
+  return screw.makeIso7089(type, diam)
+
+def buildNut(screw, type, diam, l):
+  return screw.makeIso4032(type, diam)
+
+registerCatalogStandard('ISO4017',   Screw.makeIso4017_2)
+registerCatalogStandard('ISO4014',   Screw.makeIso4017_2)
+registerCatalogStandard('EN1662',    Screw.makeEN1662_2)
+registerCatalogStandard('EN1665',    Screw.makeEN1662_2)
+registerCatalogStandard('ISO2009',   Screw.makeSlottedScrew)
+registerCatalogStandard('ISO2010',   Screw.makeSlottedScrew)
+registerCatalogStandard('ISO4762',   Screw.makeIso4762)
+registerCatalogStandard('ISO10642',  Screw.makeIso7046)
+registerCatalogStandard('ISO1207',   Screw.makeIso1207)
+registerCatalogStandard('ISO1580',   Screw.makeSlottedScrew)
+registerCatalogStandard('ISO7045',   Screw.makeIso7045)
+registerCatalogStandard('ISO7046',   Screw.makeIso7046)
+registerCatalogStandard('ISO7047',   Screw.makeIso7046)
+registerCatalogStandard('ISO7048',   Screw.makeIso1207)
+registerCatalogStandard('DIN967',    Screw.makeIso7380)
+registerCatalogStandard('ISO7380-1', Screw.makeIso7380)
+registerCatalogStandard('ISO7380-2', Screw.makeIso7380)
+registerCatalogStandard('ISO14579',  Screw.makeIso4762)
+registerCatalogStandard('ISO14580',  Screw.makeIso1207)
+registerCatalogStandard('ISO14582',  Screw.makeIso7046)
+registerCatalogStandard('ISO14583',  Screw.makeIso7045)
+registerCatalogStandard('ISO14584',  Screw.makeIso7046)
+registerCatalogStandard('DIN7984',   Screw.makeIso4762)
+registerCatalogStandard('ISO7089',   buildWasher)
+registerCatalogStandard('ISO7090',   buildWasher)
+registerCatalogStandard('ISO7091',   buildWasher)
+registerCatalogStandard('ISO7092',   buildWasher)
+registerCatalogStandard('ISO7093-1', buildWasher)
+registerCatalogStandard('ISO7094',   buildWasher)
+registerCatalogStandard('ISO4032',   buildNut)
+registerCatalogStandard('ISO4033',   buildNut)
+registerCatalogStandard('ISO4035',   buildNut)
+registerCatalogStandard('ISO4036',   buildNut)
+registerCatalogStandard('EN1661',    lambda screw, type, diam, l: screw.makeEN1661(diam))
+registerCatalogStandard('ScrewTap',  lambda screw, type, diam, l: screw.makeScrewTap(diam, l))
+
 class ScrewMacro(object):
-  d = QtGui.QWidget()
-  d.ui = Ui_ScrewMaker()
-  d.ui.setupUi(d)
-  if __name__ == '__main__':
-    d.show()
+  # the dialog is created on use, so the module can be imported without gui
+  def __init__(self):
+    d = QtGui.QWidget()
+    d.ui = Ui_ScrewMaker()
+    d.ui.setupUi(d)
+    self.d = d
+    if __name__ == '__main__':
+      d.show()
+
 
+# the open dialog, kept referenced so it is not garbage collected
+ScrewMacroWindow = None
 
 def main():
-  o = ScrewMacro()
+  global ScrewMacroWindow
+  ScrewMacroWindow = ScrewMacro()
 
 if __name__ == '__main__':
   main()